@@ -2,20 +2,57 @@ import math
 import copy
 import functools
 import streamlit as st
-import importlib
 import os
-import glob
+import time
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# 스크립트 실행 시간 측정 (메트릭 'exergy_rerun_seconds{scope="app"}')
+run_started = time.perf_counter()
+
+from exergy_dashboard.metrics import RERUN_SECONDS, start_metrics_server, timed
+from exergy_dashboard.plugins import load_plugins
+
+# Prometheus 메트릭 서버 (프로세스당 한 번 시작)
+start_metrics_server()
 
 # systems 폴더의 *_system.py 파일을 모두 동적으로 임포트
 systems_dir = os.path.join(os.path.dirname(__file__), 'systems')
-system_files = glob.glob(os.path.join(systems_dir, '*_system.py'))
-for file_path in system_files:
-    module_name = os.path.splitext(os.path.basename(file_path))[0]
-    importlib.import_module(f'systems.{module_name}')
+load_plugins(systems_dir)
+
+# 학습된 surrogate 모델 불러오기 (빠른 근사 결과 표시용)
+from exergy_dashboard.surrogate import surrogates
+surrogate_dir = os.path.join(os.path.dirname(__file__), 'surrogates')
+surrogates.load_directory(surrogate_dir)
+
+# 기본값 평가와 차트 spec을 미리 캐시에 채움 (프로세스당 한 번, 끝나면 '/ready'가 200).
+# `python -m exergy_dashboard.warmup app.py`로 실행하면 서버 시작 시 이미 시작되어 있음
+from exergy_dashboard.warmup import start_warmup
+start_warmup(systems_dir, surrogate_dir)
+
+# JSON 평가 API (환경 변수 EXERGY_API_PORT를 지정한 경우에만, 평가 캐시와 스케줄러를 공유)
+from exergy_dashboard.api import start_api_server
+start_api_server()
 
 # 시스템 관련 모듈을 나중에 import
 from exergy_dashboard.system import get_systems
-from exergy_dashboard.evaluation import evaluate_parameters
+from exergy_dashboard.evaluation import evaluate_systems, collect_parameters, refine_pending, stale_systems
+from exergy_dashboard.memory import memory_monitor
+from exergy_dashboard.prefetch import prefetch_neighbours
+from exergy_dashboard.report import build_report
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.scenario import (
+    MAX_TOKEN_LENGTH,
+    SCENARIO_QUERY_KEY,
+    decode_scenario,
+    dump_scenario,
+    encode_scenario,
+    export_scenario,
+    load_scenario,
+    restore_scenario,
+    validate_scenario,
+)
+from exergy_dashboard.session_store import SESSION_QUERY_KEY, new_session_key, session_store
+from exergy_dashboard.scheduler import scheduler
 from exergy_dashboard.visualization import VisualizationManager, registry
 
 # 시스템 상태 확인
@@ -26,6 +63,9 @@ if 'TEST' in systems:
 
 LANG = 'EN'
 
+# 근사 결과를 표시 중일 때 정확한 평가가 끝났는지 확인하는 간격 [s]
+REFINE_INTERVAL = 1.0
+
 # SYSTEM_CASE 내용 디버깅을 위한 로그
 print("Available modes in SYSTEM_CASE:", list(systems.keys()))
 
@@ -77,6 +117,7 @@ if 'mode' not in sss:
 def reset_systems():
     """시스템 상태를 초기화합니다."""
     sss.systems = {}
+    get_result_table(sss).clear()
     systems = get_systems()  # 최신 상태 가져오기
     sss.system_count = {
         k: 0 for k in systems[sss.mode.upper()].keys()
@@ -142,24 +183,167 @@ def add_system(type_):
         sss[f"{data['name']}:{k}"] = v['default']
 
 
+def mark_edited(name, param):
+    """가장 최근에 수정한 파라미터를 기록합니다 (선행 평가 대상)."""
+    sss.last_edited = (name, param)
+
+
+def pending_edits():
+    """일괄 편집 모드에서 아직 적용하지 않은 수정값 {시스템 이름: {파라미터: 값}}"""
+    edits = {}
+    for key in list(sss.keys()):
+        if not isinstance(key, str) or not key.startswith('draft:'):
+            continue
+        name, param = key[len('draft:'):].rsplit(':', 1)
+        committed = f"{name}:{param}"
+        if name in sss.systems and committed in sss and sss[key] != sss[committed]:
+            edits.setdefault(name, {})[param] = sss[key]
+    return edits
+
+
+def apply_batch_edits():
+    """일괄 편집한 값을 한꺼번에 반영 (다음 실행에서 바뀐 시스템만 한 번에 평가)"""
+    for name, edits in pending_edits().items():
+        for param, value in edits.items():
+            sss[f"{name}:{param}"] = value
+        sss.last_edited = (name, param)
+    discard_batch_edits()
+
+
+def discard_batch_edits():
+    """적용하지 않은 일괄 편집값을 버림"""
+    for key in [k for k in sss.keys() if isinstance(k, str) and k.startswith('draft:')]:
+        sss.pop(key)
+
+
+def keep_parameter_state(shown=None):
+    """화면에 표시하지 않은 입력 위젯의 값이 위젯 정리(cleanup)로 사라지지 않도록 유지
+
+    Streamlit은 한 번의 실행에서 그려지지 않은 위젯의 상태를 지우므로, 사이드바에서 다른
+    시스템을 선택하거나 일괄 편집 모드로 바꾸면 숨겨진 입력값이 사라집니다. 숨겨진
+    입력값(`shown` 키 제외)을 session state에 다시 기록하여 유지합니다.
+    """
+    shown = shown or set()
+    for key in list(sss.keys()):
+        if not isinstance(key, str) or key in shown:
+            continue
+        name = key[len('draft:'):] if key.startswith('draft:') else key
+        if name.rsplit(':', 1)[0] in sss.systems:
+            sss[key] = sss[key]
+
+
+def short_name(name):
+    """결과 패널에 표시할 시스템 약칭 (예: 'Air source heat pump 1' -> 'ASH Pump 1')"""
+    return ''.join(c[0] for c in name.title().split()[:-1]) + ' ' + name.title().split()[-1]
+
+
 def remove_system(name):
     sss.systems.pop(name)
+    get_result_table(sss).remove(name)
     to_be_removed = []
     for k, v in sss.items():
-        if isinstance(k, str) and k.startswith(name):
+        if isinstance(k, str) and (k.startswith(f'{name}:') or k.startswith(f'draft:{name}:')):
             to_be_removed.append(k)
     for k in to_be_removed:
         sss.pop(k)
 
     # selected_options에서 삭제된 시스템의 short name 제거
     if 'selected_options' in sss:
-        # short name 생성 (visualization 부분과 동일한 로직)
-        short_name = ''.join(c[0] for c in name.title().split()[:-1]) + ' ' + name.title().split()[-1]
         sss.selected_options = [
-            option for option in sss.selected_options if option != short_name
+            option for option in sss.selected_options if option != short_name(name)
         ]
 
 
+def apply_scenario(scenario, token=None):
+    """시나리오로 시스템 구성을 한 번에 복원하고 모드/시스템 선택 위젯 상태를 맞춤"""
+    names, warnings = restore_scenario(sss, scenario)
+    sss.mode_segmented_control = sss.mode
+    for key in ('selected_system_tab', 'selected_system_radio', 'report', 'batch_edit'):
+        sss.pop(key, None)
+    sss.selected_options = [short_name(name) for name in names]
+    sss.scenario_token = token
+    sss.scenario_messages = warnings
+
+
+def load_scenario_file():
+    """업로드한 시나리오 파일을 복원 (전체를 다시 실행해 사이드바까지 갱신)"""
+    uploaded = sss.get('scenario_file')
+    if uploaded is None:
+        return
+    try:
+        apply_scenario(load_scenario(uploaded))
+    except ValueError as e:
+        sss.scenario_error = str(e)
+    sss.scenario_reload = True
+
+
+def sync_scenario_url():
+    """현재 시스템 구성을 URL의 시나리오 토큰에 반영 (새로고침하거나 링크를 공유해도 유지)
+
+    Returns
+    -------
+    bool
+        시나리오가 URL에 들어가는지 여부 (너무 길면 URL에서 제거하고 파일 저장을 안내)
+    """
+    token = encode_scenario(export_scenario(sss, sss.mode)) if sss.systems else None
+    fits = token is None or len(token) <= MAX_TOKEN_LENGTH
+    if not fits:
+        token = None
+    if token != st.query_params.get(SCENARIO_QUERY_KEY):
+        if token:
+            st.query_params[SCENARIO_QUERY_KEY] = token
+        else:
+            st.query_params.pop(SCENARIO_QUERY_KEY, None)
+    sss.scenario_token = token
+    return fits
+
+
+def restore_session():
+    """URL의 세션 키로 세션 저장소에서 상태를 복원하고 이 세션의 새 키를 발급
+
+    다른 replica로 연결되었거나 서버가 재시작되어 메모리에 세션이 없어도 이어서 사용할 수
+    있습니다. 읽은 뒤에는 새 키로 저장하므로 같은 URL을 연 다른 탭과 상태를 덮어쓰지 않습니다.
+    """
+    saved_key = st.query_params.get(SESSION_QUERY_KEY)
+    saved = session_store.load(saved_key) if saved_key else None
+    if saved:
+        try:
+            apply_scenario(validate_scenario(saved.get('scenario')), st.query_params.get(SCENARIO_QUERY_KEY))
+        except ValueError as e:
+            print(f"Error restoring session {saved_key}: {e}")
+        else:
+            sss.selected_options = [
+                option for option in saved.get('selected', []) if option in sss.selected_options
+            ]
+    sss.session_key = new_session_key()
+    st.query_params[SESSION_QUERY_KEY] = sss.session_key
+
+
+def save_session():
+    """시스템 구성과 표시 중인 시스템 선택이 바뀌었으면 세션 저장소에 저장"""
+    state = {
+        'scenario': export_scenario(sss, sss.mode),
+        'selected': list(sss.get('selected_options', [])),
+    }
+    if state == sss.get('saved_session') or (not sss.systems and 'saved_session' not in sss):
+        return
+    session_store.save(sss.session_key, state)
+    sss.saved_session = state
+
+
+if 'session_key' not in sss:
+    restore_session()
+
+# URL로 공유된 시나리오는 세션을 시작할 때 한 번 복원
+scenario_token = st.query_params.get(SCENARIO_QUERY_KEY)
+if scenario_token and scenario_token != sss.get('scenario_token'):
+    try:
+        apply_scenario(decode_scenario(scenario_token), scenario_token)
+    except ValueError as e:
+        sss.scenario_error = str(e)
+        sss.scenario_token = scenario_token
+
+
 with st.sidebar:
     st.title('Exergy Analyzer')
     st.divider()
@@ -247,59 +431,170 @@ pad = 0.6
 col_border = False
 _, title_col, title_right_col = st.columns([ml, 4 + pad + 5, mr], border=col_border)
 _, title_col1, _, title_col2, _ = st.columns([ml, 2.5, pad, 7.5, mr], border=col_border)
-_, col1, _, col2, _ = st.columns([ml, 2.5, pad, 7.5, mr], border=col_border)
-
 
 
-with col1:
+# 화면은 두 단계의 fragment로 나누어 필요한 부분만 다시 실행합니다.
+# - workspace: 입력 패널 + 평가 + 결과 패널. 파라미터를 수정하면 사이드바와 모드/시스템 목록은
+#   다시 실행하지 않고, 입력값이 바뀐 시스템만 다시 평가한 뒤 결과 패널을 다시 그림
+# - results_panel: 시스템 선택, 시각화 탭, 보고서 등 결과 패널 위젯은 이 fragment만 다시 실행
+#   (평가 없이 표시 중인 시각화만 다시 그림)
+# 사이드바(모드 변경, 시스템 추가/삭제/선택)는 fragment 밖에 있으므로 전체를 다시 실행합니다.
+def input_panel():
     st.subheader('System Inputs :dart:')
     if len(sss.systems) == 0 or not st.session_state.get('selected_system_tab'):
         st.write('No system added yet.')
+        return
+
+    system = sss.systems[st.session_state['selected_system_tab']]
+    mode_upper = sss.mode.upper()
+    systems = get_systems()
+    system_info = systems[mode_upper][system['type']]
+    st.write(f"#### {system_info['display']['title']} {system_info['display']['icon']}")
+
+    # 일괄 편집 모드: 수정값을 모아 두었다가 Apply에서 한 번에 평가
+    batch = st.toggle(
+        'Edit batch mode',
+        key='batch_edit',
+        help='Collect several parameter edits and evaluate them together on Apply.',
+        on_change=discard_batch_edits,
+    )
+    if batch:
+        batch_input_panel(system['name'])
     else:
-        system = sss.systems[st.session_state['selected_system_tab']]
+        parameter_inputs(system)
+
+
+def parameter_inputs(system, draft=False):
+    """시스템의 파라미터 입력 위젯 (draft=True이면 일괄 편집용 'draft:' 키에 저장)"""
+    # 파라미터를 카테고리별로 그룹화
+    params_by_category = {}
+    for k, v in system['parameters'].items():
+        category = v.get('category', 'General')
+        if category not in params_by_category:
+            params_by_category[category] = []
+        params_by_category[category].append((k, v))
+
+    # 카테고리별 하위 탭 생성
+    category_tabs = st.tabs([category.capitalize() for category in params_by_category.keys()])
+    for cat_tab, category in zip(category_tabs, params_by_category.keys()):
+        with cat_tab:
+            params = params_by_category[category]
+            for k, v in params:
+                key = f"{system['name']}:{k}"
+                if draft:
+                    key = f"draft:{key}"
+                    if key not in sss:
+                        sss[key] = sss[f"{system['name']}:{k}"]
+                st.number_input(
+                    f"{v['explanation'][LANG].capitalize()}, {v['latex']} [{v['unit']}]",
+                    value=v['default'],
+                    step=v['step'],
+                    format=f"%.{max(0, -math.floor(math.log10(v['step'])))}f",
+                    key=key,
+                    help=v['explanation'][LANG],
+                    on_change=None if draft else functools.partial(mark_edited, system['name'], k),
+                )
+
+                system['parameters'][k]['value'] = sss[f"{system['name']}:{k}"]
+
+
+@st.fragment
+def batch_input_panel(system_name):
+    """일괄 편집 입력 패널 (수정할 때는 이 fragment만 다시 실행되고 평가하지 않음)"""
+    parameter_inputs(sss.systems[system_name], draft=True)
+
+    edits = pending_edits()
+    if edits:
         mode_upper = sss.mode.upper()
-        systems = get_systems()
-        system_info = systems[mode_upper][system['type']]
-        st.write(f"#### {system_info['display']['title']} {system_info['display']['icon']}")
-
-        # 파라미터를 카테고리별로 그룹화
-        params_by_category = {}
-        for k, v in system['parameters'].items():
-            category = v.get('category', 'General')
-            if category not in params_by_category:
-                params_by_category[category] = []
-            params_by_category[category].append((k, v))
-
-        # 카테고리별 하위 탭 생성
-        category_tabs = st.tabs([category.capitalize() for category in params_by_category.keys()])
-        for cat_tab, category in zip(category_tabs, params_by_category.keys()):
-            with cat_tab:
-                params = params_by_category[category]
-                for k, v in params:
-                    st.number_input(
-                        f"{v['explanation'][LANG].capitalize()}, {v['latex']} [{v['unit']}]",
-                        value=v['default'],
-                        step=v['step'],
-                        format=f"%.{max(0, -math.floor(math.log10(v['step'])))}f",
-                        key=f"{system['name']}:{k}",
-                        help=v['explanation'][LANG],
-                    )
-
-                    system['parameters'][k]['value'] = sss[f"{system['name']}:{k}"]
-
-# 현재 모드에 유효한 시스템만 평가
-mode_upper = sss.mode.upper()
-systems = get_systems()
-for key in sss.systems.keys():
-    try:
-        system = sss.systems[key]
+        requests = [
+            (sss.systems[name]['type'], {**collect_parameters(sss, name), **changed})
+            for name, changed in edits.items()
+        ]
+        count, seconds = scheduler.estimate_cost(mode_upper, requests)
+        n_changes = sum(len(changed) for changed in edits.values())
+        st.caption(
+            f"{n_changes} pending change{'s' if n_changes != 1 else ''}. "
+            f"Stale systems: {', '.join(edits)}. "
+            f"Estimated cost: {count} evaluation{'s' if count != 1 else ''}, ~{seconds:.1f} s"
+            + (f" ({len(requests) - count} cached)" if count < len(requests) else '')
+        )
+    else:
+        st.caption('No pending changes.')
+
+    apply_col, discard_col = st.columns(2)
+    if apply_col.button(
+        'Apply', type='primary', disabled=not edits, use_container_width=True,
+        on_click=apply_batch_edits,
+    ):
+        # 반영한 값으로 평가와 결과 패널을 다시 실행
+        st.rerun()
+    discard_col.button(
+        'Discard', disabled=not edits, use_container_width=True, on_click=discard_batch_edits,
+    )
+
+
+def scenario_panel(fits_url):
+    """시나리오 저장/불러오기 패널"""
+    with st.expander('Scenario'):
+        if sss.get('scenario_error'):
+            st.error(f"Could not load scenario: {sss.pop('scenario_error')}")
+        for message in sss.pop('scenario_messages', []):
+            st.warning(message)
+
+        if not sss.systems:
+            st.caption('Add systems or load a saved scenario.')
+        elif fits_url:
+            st.caption('The page URL keeps this scenario. Copy it to share the comparison.')
+        else:
+            st.caption('This scenario is too large for the URL. Save it as a file to share it.')
+        st.download_button(
+            'Save scenario',
+            dump_scenario(export_scenario(sss, sss.mode)),
+            file_name=f'exergy_scenario_{sss.mode.lower().replace(" ", "_")}.json',
+            mime='application/json',
+            disabled=not sss.systems,
+            use_container_width=True,
+        )
+        st.file_uploader(
+            'Load scenario', type='json', key='scenario_file', on_change=load_scenario_file,
+        )
+
+
+def evaluate_workspace():
+    """현재 모드에 유효한 시스템 중 입력값이 바뀐 시스템만 평가 (전역 스케줄러에 한꺼번에 제출)"""
+    mode_upper = sss.mode.upper()
+    systems = get_systems()
+    evaluation_targets = [
+        key for key, system in sss.systems.items()
         # 현재 모드에 해당 시스템 타입이 존재하는지 확인
-        if system['type'] in systems[mode_upper]:
-            evaluate_parameters(sss, key)
-    except Exception as e:
-        print(f"Error evaluating parameters for {key}: {e}")
+        if system['type'] in systems[mode_upper]
+    ]
+    stale = stale_systems(sss, evaluation_targets)
+    for key, result in evaluate_systems(sss, stale, approximate=True).items():
+        if isinstance(result, Exception):
+            print(f"Error evaluating parameters for {key}: {result}")
+
+    # 마지막으로 수정한 파라미터의 ±1 step 이웃값을 유휴 워커에서 미리 평가
+    if sss.get('last_edited') and sss.last_edited[0] in stale:
+        edited_name, edited_param = sss.last_edited
+        edited_system = sss.systems[edited_name]
+        prefetch_neighbours(
+            mode_upper,
+            edited_system['type'],
+            collect_parameters(sss, edited_name),
+            edited_param,
+            edited_system['parameters'][edited_param],
+        )
+
+
+@st.fragment
+@timed(RERUN_SECONDS, 'results_panel')
+def results_panel():
+    # 유휴 상태에서 평가 결과가 해제되었으면 전체를 다시 실행해 먼저 재계산
+    memory_monitor.touch()
+    if sss.get('results_released'):
+        st.rerun()
 
-with col2:
     st.subheader('Results Visualization :chart_with_upwards_trend:')
     
     # 현재 모드에 유효한 시스템만 필터링
@@ -313,10 +608,7 @@ with col2:
         if sys_type in systems[mode_upper]:
             valid_system_names.append(sys_name)
     
-    short_name_map = {
-        name: ''.join(c[0] for c in name.title().split()[:-1]) + ' ' + name.title().split()[-1]
-        for name in valid_system_names
-    }
+    short_name_map = {name: short_name(name) for name in valid_system_names}
 
     short_name_reverse_map = {
         v: k for k, v in short_name_map.items()
@@ -331,8 +623,129 @@ with col2:
 
     options = [short_name_reverse_map[opt] for opt in options]
 
+    # 저사양 클라이언트용: 차트를 서버에서 이미지(SVG)로 렌더링하여 전송
+    # (브라우저의 CPU 사용량은 줄지만 이미지가 Vega-Lite spec보다 커서 전송량은 늘어남)
+    static_charts = st.toggle(
+        'Static images (slow devices)',
+        key='static_charts',
+        help=(
+            'Render charts on the server as images instead of running them in the browser. '
+            'Reduces the work on slow devices, but images are larger than interactive charts '
+            'and use more bandwidth.'
+        ),
+    )
+
+    # 서버 과부하로 직전 결과를 표시하는 시스템 안내
+    degraded = [name for name in options if sss.systems[name].get('degraded')]
+    if degraded:
+        st.warning(
+            'Server is busy. Showing previous results for: ' + ', '.join(degraded)
+        )
+
+    # 정확한 평가에 실패한 시스템은 근사 결과를 표시 중임을 알림 (입력값을 바꾸면 다시 평가)
+    failed = [name for name in options if sss.systems[name].get('error')]
+    if failed:
+        st.error(
+            'Exact evaluation failed, showing approximate results for: '
+            + ', '.join(f"{name} ({sss.systems[name]['error']})" for name in failed)
+        )
+
+    # 정확한 평가가 진행 중인 시스템은 surrogate 근사 결과와 오차 한계를 안내
+    approximated = [name for name in options if sss.systems[name].get('approximate')]
+    if approximated:
+        bounds = []
+        for name in approximated:
+            model = surrogates.get(mode_upper, sss.systems[name]['type'])
+            if model is not None and model.error_bound is not None:
+                bounds.append(f"{name} (X_eff ±{model.error_bound * 100:.2f} %p)")
+            else:
+                bounds.append(name)
+        st.info('Approximate results, refining with exact evaluation: ' + ', '.join(bounds))
+
     if len(options) != 0:
         # Initialize visualization manager with the registry
         viz_manager = VisualizationManager(registry)
-        # 현재 모드에 맞는 시각화만 표시
-        viz_manager.render_tabs(sss, options, mode=sss.mode.upper())
+        # 현재 모드에 맞는 시각화 중 선택한 탭만 실행하여 표시
+        viz_manager.render_tabs(
+            sss, options, mode=sss.mode.upper(), lazy=True,
+            static='svg' if static_charts else None,
+        )
+
+        # 선택한 모든 시스템의 입력/시각화/등급을 담은 HTML 보고서 내보내기
+        # 입력값이나 결과(결과 테이블 버전: 재평가, 근사 결과 갱신)가 바뀌면 이전 보고서는 내려받지 않음
+        report_key = (
+            mode_upper,
+            tuple((name, tuple(sorted(collect_parameters(sss, name).items()))) for name in options),
+            get_result_table(sss).version,
+        )
+        if st.button('Export report', help='Build an HTML report of all selected systems (print to PDF from the browser).'):
+            with st.spinner('Rendering report...'):
+                sss.report = {'key': report_key, 'data': build_report(sss, options, mode_upper)}
+        if sss.get('report') and sss.report['key'] == report_key:
+            st.download_button(
+                'Download report (HTML)',
+                sss.report['data'],
+                file_name=f'exergy_report_{mode_upper.lower()}.html',
+                mime='text/html',
+            )
+
+
+@st.fragment
+@timed(RERUN_SECONDS, 'workspace')
+def workspace():
+    # 업로드한 시나리오를 복원했으면 사이드바까지 전체를 다시 실행
+    if sss.pop('scenario_reload', False):
+        st.rerun()
+    # 해제된 평가 결과는 아래 evaluate_workspace에서 한 번에 다시 계산됨
+    sss.pop('results_released', None)
+
+    # 선택한 시스템의 입력 위젯(일괄 편집 모드에서는 'draft:' 위젯)은 이번 실행에서 그려지므로 제외
+    shown = set()
+    selected_system = st.session_state.get('selected_system_tab')
+    if selected_system in sss.systems:
+        prefix = 'draft:' if sss.get('batch_edit') else ''
+        shown = {f"{prefix}{selected_system}:{k}" for k in sss.systems[selected_system]['parameters']}
+    keep_parameter_state(shown)
+
+    _, col1, _, col2, _ = st.columns([ml, 2.5, pad, 7.5, mr], border=col_border)
+
+    with col1:
+        input_panel()
+
+    evaluate_workspace()
+
+    with col2:
+        results_panel()
+
+    fits_url = sync_scenario_url()
+    save_session()
+    # 세션 메모리 사용량 기록, 예산을 넘은 유휴 세션의 결과 해제
+    memory_monitor.record()
+    with col1:
+        scenario_panel(fits_url)
+
+    # 근사 결과를 먼저 보여준 시스템은 정확한 평가가 하나라도 끝나면 이 fragment만 다시 그림
+    # (정확한 결과는 캐시에 저장되어 있으므로 다시 실행해도 평가 비용이 들지 않음).
+    # 전체 실행 중에는 fragment 범위 재실행이 허용되지 않으므로 전체를 다시 실행
+    if refine_pending(sss):
+        ctx = get_script_run_ctx()
+        st.rerun(scope='fragment' if ctx is not None and ctx.fragment_ids_this_run else 'app')
+    # 아직 진행 중이면 스크립트를 붙잡지 않고 refine_poll이 주기적으로 확인
+    if sss.get('pending_evaluations'):
+        refine_poll()
+
+
+@st.fragment(run_every=REFINE_INTERVAL)
+def refine_poll():
+    """진행 중인 정확한 평가가 끝났는지 주기적으로 확인 (끝났으면 전체를 다시 실행)
+
+    다른 fragment(workspace)는 다시 실행할 수 없으므로 전체를 다시 실행합니다.
+    확인할 평가가 없으면 아무것도 하지 않습니다.
+    """
+    if refine_pending(sss, timeout=0):
+        st.rerun(scope='app')
+
+
+workspace()
+
+RERUN_SECONDS.observe(time.perf_counter() - run_started, 'app')
@@ -0,0 +1,391 @@
+"""JSON 평가 API 모듈
+
+다른 도구가 대시보드 화면을 거치거나 `systems/*.py`를 직접 임포트하지 않고 엑서지 평가 결과를
+얻을 수 있도록 HTTP JSON API(WSGI 앱)를 제공합니다. 플러그인 로딩(`load_plugins`), 평가
+스케줄러(`scheduler`), 평가 캐시(`evaluation_cache`)를 대시보드와 그대로 공유합니다.
+
+경로
+----
+- ``GET /systems[?mode=...]``: 등록된 모드/시스템 타입과 파라미터 스키마(기본값, 범위, 단위 등)
+- ``POST /evaluate``: ``{"mode", "system_type", "params": {...}}`` 하나를 평가
+- ``POST /evaluate/batch``: ``{"mode", "system_type", "params": [{...}, ...]}``을 평가하여
+  NDJSON(한 줄에 결과 하나, 입력 순서)으로 스트리밍. 한 번에 큐에 올리는 작업 수가 제한되므로
+  큰 배치도 다른 사용자의 평가를 막지 않음
+
+`params`에 없는 파라미터는 기본값을 사용하고, 알 수 없는 파라미터나 허용 범위를 벗어난 값은
+400으로 거절합니다. 서버가 과부하이면 503, 평가가 기한 안에 끝나지 않으면 504를 반환합니다.
+
+실행 방법
+--------
+- 별도 프로세스: ``python -m exergy_dashboard.api --port 8600``
+- 대시보드와 같은 프로세스(캐시 공유): 환경 변수 `EXERGY_API_PORT`를 지정하면 app.py가
+  `start_api_server()`로 백그라운드 스레드에서 시작
+
+Examples
+--------
+>>> import json, urllib.request
+>>> body = json.dumps({'mode': 'COOLING', 'system_type': 'Air source heat pump', 'params': {'T_0': 30}})
+>>> response = urllib.request.urlopen('http://127.0.0.1:8600/evaluate', body.encode())
+>>> json.load(response)['variables']['X_eff']
+0.2531
+"""
+
+import argparse
+import json
+import math
+import os
+import threading
+import time
+from http import HTTPStatus
+from socketserver import ThreadingMixIn
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import numpy as np
+
+from exergy_dashboard.metrics import metrics
+from exergy_dashboard.results import is_scalar
+from exergy_dashboard.scheduler import (
+    EvaluationScheduler,
+    Priority,
+    SchedulerBusyError,
+    scheduler as default_scheduler,
+)
+from exergy_dashboard.system import get_systems, resolve_range
+
+
+# API 서버 설정 (환경 변수). 대시보드 프로세스에서는 포트를 지정한 경우에만 시작
+API_PORT_ENV = 'EXERGY_API_PORT'
+API_HOST_ENV = 'EXERGY_API_HOST'
+DEFAULT_API_PORT = 8600
+DEFAULT_API_HOST = '127.0.0.1'
+
+# 요청 본문의 최대 크기 (bytes)와 배치당 최대 파라미터 세트 수
+MAX_BODY_BYTES = 8 << 20
+MAX_BATCH_SIZE = 10000
+
+# 스케줄러에서 API 요청을 구분하는 세션 ID 접두사 (클라이언트 주소별로 공정하게 분배)
+API_SESSION_PREFIX = 'api:'
+
+API_SECONDS = metrics.histogram(
+    'exergy_api_seconds', 'JSON API request latency (until the last byte is sent).', ('route', 'status'),
+)
+
+
+class APIError(Exception):
+    """클라이언트에 JSON 오류 응답으로 돌려줄 예외
+
+    Parameters
+    ----------
+    status : int
+        HTTP 상태 코드
+    message : str
+        오류 메시지
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def system_schema(mode: Optional[str] = None) -> Dict[str, Any]:
+    """등록된 시스템의 스키마 {모드: {시스템 타입: {'display', 'parameters'}}}
+
+    Raises
+    ------
+    APIError
+        지정한 모드가 등록되어 있지 않은 경우 (404)
+    """
+    systems = get_systems()
+    if mode is not None:
+        if mode.upper() not in systems:
+            raise APIError(404, f'Unknown mode: {mode}')
+        systems = {mode.upper(): systems[mode.upper()]}
+    return {
+        name: {
+            system_type: {'display': config['display'], 'parameters': config['parameters']}
+            for system_type, config in types.items()
+        }
+        for name, types in systems.items()
+    }
+
+
+def resolve_system(mode: Any, system_type: Any) -> Tuple[str, str, Dict[str, Dict[str, Any]]]:
+    """모드와 시스템 타입을 확인하고 (모드, 시스템 타입, 파라미터 설정)을 반환
+
+    Raises
+    ------
+    APIError
+        모드나 시스템 타입이 등록되어 있지 않은 경우 (400)
+    """
+    if not isinstance(mode, str) or not isinstance(system_type, str):
+        raise APIError(400, "'mode' and 'system_type' must be strings")
+    systems = get_systems().get(mode.upper())
+    if systems is None:
+        raise APIError(400, f'Unknown mode: {mode}')
+    if system_type not in systems:
+        raise APIError(400, f'Unknown system type for {mode.upper()}: {system_type}')
+    return mode.upper(), system_type, systems[system_type]['parameters']
+
+
+def complete_parameters(parameters: Dict[str, Dict[str, Any]], params: Any) -> Dict[str, float]:
+    """입력 파라미터를 확인하고 빠진 파라미터를 기본값으로 채움
+
+    Raises
+    ------
+    APIError
+        알 수 없는 파라미터, 숫자가 아닌 값, 허용 범위를 벗어난 값이 있는 경우 (400)
+    """
+    if params is None:
+        params = {}
+    if not isinstance(params, dict):
+        raise APIError(400, "'params' must be an object")
+    unknown = sorted(set(params) - set(parameters))
+    if unknown:
+        raise APIError(400, f"Unknown parameters: {', '.join(unknown)}")
+    values = {}
+    for key, parameter in parameters.items():
+        value = params.get(key, parameter['default'])
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise APIError(400, f"Parameter '{key}' must be a finite number")
+        values[key] = value
+    for key, parameter in parameters.items():
+        try:
+            low, high = resolve_range(parameter, values)
+        except NameError:
+            continue
+        if not min(low, high) - 1e-9 <= values[key] <= max(low, high) + 1e-9:
+            raise APIError(400, f"Parameter '{key}' = {values[key]} is outside [{low}, {high}]")
+    return values
+
+
+def json_variables(variables: Dict[str, Any]) -> Dict[str, Any]:
+    """평가 결과를 JSON으로 보낼 수 있는 값으로 변환 (numpy 수는 int/float, NaN/무한대는 null)"""
+    converted = {}
+    for key, value in variables.items():
+        if isinstance(value, (bool, str)):
+            converted[key] = value
+        elif is_scalar(value):
+            value = value.item() if isinstance(value, np.generic) else value
+            converted[key] = value if isinstance(value, int) or math.isfinite(value) else None
+        else:
+            converted[key] = str(value)
+    return converted
+
+
+class EvaluationAPI:
+    """JSON 평가 API WSGI 앱
+
+    Parameters
+    ----------
+    scheduler : EvaluationScheduler, optional
+        평가 스케줄러 (기본값: 대시보드와 공유하는 전역 스케줄러)
+    """
+
+    def __init__(self, scheduler: Optional[EvaluationScheduler] = None):
+        self.scheduler = scheduler if scheduler is not None else default_scheduler
+        self.routes: Dict[str, Dict[str, Callable]] = {
+            '/systems': {'GET': self.get_systems},
+            '/evaluate': {'POST': self.evaluate},
+            '/evaluate/batch': {'POST': self.evaluate_batch},
+        }
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable[bytes]:
+        start = time.perf_counter()
+        path = environ.get('PATH_INFO', '') or '/'
+        route = path.rstrip('/') or '/'
+        methods = self.routes.get(route)
+        try:
+            if methods is None:
+                raise APIError(404, f'Not found: {path}')
+            handler = methods.get(environ['REQUEST_METHOD'])
+            if handler is None:
+                raise APIError(405, f"Method not allowed (use {', '.join(methods)})")
+            status, content_type, body = handler(environ)
+        except APIError as e:
+            status, content_type, body = e.status, 'application/json', [_dumps({'error': e.message})]
+
+        headers = [('Content-Type', content_type)]
+        if isinstance(body, list):
+            headers.append(('Content-Length', str(sum(len(chunk) for chunk in body))))
+        start_response(_status_line(status), headers)
+        return _observed(body, route if methods is not None else 'unknown', status, start)
+
+    # ------------------------------------------------------------------
+    # 경로
+    # ------------------------------------------------------------------
+    def get_systems(self, environ: Dict[str, Any]):
+        """GET /systems: 시스템 스키마"""
+        mode = parse_qs(environ.get('QUERY_STRING', '')).get('mode', [None])[0]
+        return 200, 'application/json', [_dumps(system_schema(mode))]
+
+    def evaluate(self, environ: Dict[str, Any]):
+        """POST /evaluate: 파라미터 세트 하나를 평가"""
+        request = _read_json(environ)
+        mode, system_type, parameters = resolve_system(request.get('mode'), request.get('system_type'))
+        params = complete_parameters(parameters, request.get('params'))
+        try:
+            variables = self.scheduler.evaluate(
+                mode, system_type, params,
+                session_id=_session_id(environ), priority=Priority.INTERACTIVE,
+            )
+        except SchedulerBusyError as e:
+            raise APIError(503, str(e)) from e
+        except TimeoutError as e:
+            raise APIError(504, 'Evaluation timed out') from e
+        except Exception as e:
+            raise APIError(422, f'Evaluation failed: {e}') from e
+        body = {'mode': mode, 'system_type': system_type, 'params': params, 'variables': json_variables(variables)}
+        return 200, 'application/json', [_dumps(body)]
+
+    def evaluate_batch(self, environ: Dict[str, Any]):
+        """POST /evaluate/batch: 여러 파라미터 세트를 평가하여 NDJSON으로 스트리밍
+
+        모든 입력을 먼저 확인한 뒤(잘못된 항목이 있으면 400) 평가를 시작하고, 결과는 입력
+        순서대로 ``{"index": i, "variables": {...}}`` 또는 ``{"index": i, "error": "..."}`` 줄로
+        보냅니다.
+        """
+        request = _read_json(environ)
+        mode, system_type, parameters = resolve_system(request.get('mode'), request.get('system_type'))
+        params_list = request.get('params')
+        if not isinstance(params_list, list):
+            raise APIError(400, "'params' must be an array of objects")
+        if len(params_list) > MAX_BATCH_SIZE:
+            raise APIError(413, f'Batch too large (max {MAX_BATCH_SIZE})')
+        completed = []
+        for i, params in enumerate(params_list):
+            try:
+                completed.append(complete_parameters(parameters, params))
+            except APIError as e:
+                raise APIError(e.status, f'params[{i}]: {e.message}') from None
+
+        results = self.scheduler.iter_evaluate(
+            mode, system_type, completed, session_id=_session_id(environ), priority=Priority.BATCH,
+        )
+        return 200, 'application/x-ndjson', _ndjson(results)
+
+
+def _ndjson(results: Iterable[Any]) -> Iterator[bytes]:
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            line = {'index': i, 'error': str(result) or type(result).__name__}
+        else:
+            line = {'index': i, 'variables': json_variables(result)}
+        yield _dumps(line)
+
+
+def _observed(body: Iterable[bytes], route: str, status: int, start: float) -> Iterator[bytes]:
+    # 스트리밍 응답은 마지막 줄을 보낼 때까지 시간을 잼
+    try:
+        yield from body
+    finally:
+        API_SECONDS.observe(time.perf_counter() - start, route, status)
+
+
+def _read_json(environ: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        length = int(environ.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        raise APIError(400, 'Invalid Content-Length') from None
+    if length > MAX_BODY_BYTES:
+        raise APIError(413, f'Request body too large (max {MAX_BODY_BYTES} bytes)')
+    try:
+        request = json.loads(environ['wsgi.input'].read(length) or b'null')
+    except ValueError as e:
+        raise APIError(400, f'Invalid JSON: {e}') from None
+    if not isinstance(request, dict):
+        raise APIError(400, 'Request body must be a JSON object')
+    return request
+
+
+def _dumps(obj: Any) -> bytes:
+    return (json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=str) + '\n').encode('utf-8')
+
+
+def _session_id(environ: Dict[str, Any]) -> str:
+    return API_SESSION_PREFIX + environ.get('REMOTE_ADDR', '')
+
+
+def _status_line(status: int) -> str:
+    return f'{status} {HTTPStatus(status).phrase}'
+
+
+# 전역 WSGI 앱 (다른 WSGI 서버에서 `exergy_dashboard.api:app`으로 실행 가능)
+app = EvaluationAPI()
+
+
+# ----------------------------------------------------------------------
+# HTTP 서버
+# ----------------------------------------------------------------------
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[WSGIServer] = None
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def start_api_server(port: Optional[int] = None, host: Optional[str] = None) -> Optional[WSGIServer]:
+    """API 서버를 백그라운드 스레드에서 시작 (프로세스당 한 번만 시작)
+
+    Parameters
+    ----------
+    port : int, optional
+        포트 (기본값: 환경 변수 `EXERGY_API_PORT`. 지정하지 않았거나 0이면 시작하지 않음)
+    host : str, optional
+        주소 (기본값: 환경 변수 `EXERGY_API_HOST`, 없으면 127.0.0.1)
+
+    Returns
+    -------
+    WSGIServer or None
+        실행 중인 서버. 꺼져 있거나 포트를 열지 못하면 None (앱 실행은 계속됨)
+    """
+    global _server, _server_started
+    with _server_lock:
+        if _server_started:
+            return _server
+        _server_started = True
+        port = int(os.environ.get(API_PORT_ENV) or 0) if port is None else port
+        host = host or os.environ.get(API_HOST_ENV, DEFAULT_API_HOST)
+        if not port:
+            return None
+        try:
+            _server = make_server(host, port, app, server_class=_ThreadingWSGIServer, handler_class=_QuietHandler)
+        except OSError as e:
+            print(f"Error starting API server on {host}:{port}: {e}")
+            return None
+        threading.Thread(target=_server.serve_forever, name='api-server', daemon=True).start()
+        return _server
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """플러그인을 불러오고 API 서버를 실행"""
+    from exergy_dashboard.plugins import load_plugins
+
+    parser = argparse.ArgumentParser(description='Serve the exergy evaluation JSON API.')
+    parser.add_argument('--systems-dir', default='systems', help='plugin folder (*_system.py)')
+    parser.add_argument('--host', default=os.environ.get(API_HOST_ENV, DEFAULT_API_HOST))
+    parser.add_argument('--port', type=int, default=int(os.environ.get(API_PORT_ENV) or DEFAULT_API_PORT))
+    args = parser.parse_args(argv)
+
+    load_plugins(args.systems_dir)
+    server = make_server(args.host, args.port, app, server_class=_ThreadingWSGIServer)
+    print(f'Serving exergy evaluation API on http://{args.host}:{args.port}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
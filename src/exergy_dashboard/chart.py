@@ -1,4 +1,23 @@
+"""차트 생성 모듈
+
+차트 종류마다 Altair 객체를 한 번만 만들어 데이터가 빠진 Vega-Lite dict 템플릿으로
+컴파일해 둡니다(named dataset 참조). 렌더링할 때는 템플릿을 얕게 복사하고
+`datasets`에 데이터 값만 넣으므로, Altair 객체 생성과 스키마 검증 비용이 들지 않습니다.
+
+Examples
+--------
+>>> spec = plot_waterfall_multi(source)
+>>> spec['datasets'].keys()
+dict_keys(['waterfall'])
+>>> st.vega_lite_chart(spec, use_container_width=True)
+"""
+
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
 import altair as alt
+import numpy as np
 import pandas as pd
 
 # Colors from streamlit theme.
@@ -13,24 +32,206 @@ COLORS = [
     '#ffde96',
     '#9878d2',
     '#e1e5ec',
-] * 50
+]
+
+
+# waterfall 차트 데이터셋 이름
+WATERFALL_DATASET = 'waterfall'
+
+# 대규모 비교 차트 데이터셋 이름
+HEATMAP_DATASET = 'destruction'
+RANKING_DATASET = 'ranking'
+DISTRIBUTION_DATASET = 'distribution'
+
+# 2차원 sweep 차트 데이터셋 이름 (격자 셀, 현재 운전점)
+SWEEP_DATASET = 'sweep'
+SWEEP_POINT_DATASET = 'sweep_point'
+
+# 클라이언트 측 탐색 차트 데이터셋 이름 (격자 인덱스 + 출력 변수)
+EXPLORE_DATASET = 'explore'
+
+# 서버에서 미리 계산한 waterfall 열 이름 (Vega transform 필드 이름 -> 짧은 이름)
+WATERFALL_FIELDS = {
+    'calc_prev_sum': 'start',
+    'window_sum_amount': 'end',
+    'calc_lead': 'next',
+    'calc_top': 'top',
+    'calc_amount_fmt': 'text',
+}
+
+# chart_to_dict의 전역 Altair 설정 변경을 직렬화하는 잠금
+_compile_lock = threading.Lock()
+
+
+def chart_to_dict(chart: alt.TopLevelMixin) -> Dict[str, Any]:
+    """Altair 차트를 Vega-Lite dict로 직렬화
+
+    Streamlit과 같은 방식('none' 테마)으로 변환하며, 데이터는 행 수 제한 없이
+    spec의 'datasets'에 포함됩니다.
+    """
+    theme = getattr(alt, 'theme', None) or alt.themes
+    # 테마/데이터 변환기는 전역 설정이므로 다른 스레드와 동시에 바꾸지 않도록 잠금
+    with _compile_lock, alt.data_transformers.enable('default', max_rows=None):
+        if theme.active == 'default':
+            with theme.enable('none'):
+                return chart.to_dict()
+        return chart.to_dict()
+
+
+def fill_template(template: Dict[str, Any], datasets: Dict[str, Any]) -> Dict[str, Any]:
+    """템플릿에 데이터를 넣은 spec을 반환 (템플릿은 변경하지 않음)
+
+    Parameters
+    ----------
+    template : Dict[str, Any]
+        `chart_to_dict`로 컴파일한 Vega-Lite 템플릿
+    datasets : Dict[str, Any]
+        데이터셋 이름과 데이터(DataFrame 또는 레코드 리스트)
+
+    Returns
+    -------
+    Dict[str, Any]
+        렌더링할 Vega-Lite spec (중첩 객체는 템플릿과 공유)
+    """
+    spec = dict(template)
+    spec['datasets'] = dict(template.get('datasets', {}))
+    for name, data in datasets.items():
+        spec['datasets'][name] = to_records(data) if isinstance(data, pd.DataFrame) else data
+    return spec
+
+
+def to_records(data: Any) -> list:
+    """DataFrame(또는 열 이름 -> 배열 딕셔너리)을 JSON으로 직렬화할 수 있는
+    레코드 리스트로 변환 (NaN은 None)"""
+    if isinstance(data, pd.DataFrame):
+        data = {name: data[name].to_numpy() for name in data.columns}
+    names = [str(name) for name in data]
+    columns = []
+    for values in data.values():
+        values = np.asarray(values)
+        if values.dtype.kind == 'f' and np.isnan(values).any():
+            values = np.where(np.isnan(values), None, values)
+        elif values.dtype.kind == 'O':
+            values = np.where(pd.isna(values), None, values)
+        columns.append(values.tolist())
+    return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+def plot_waterfall_multi(source: pd.DataFrame, precompute: bool = True) -> Dict[str, Any]:
+    """여러 시스템의 엑서지 소비 과정(waterfall) 차트 spec 생성
+
+    Parameters
+    ----------
+    source : pd.DataFrame
+        'label', 'amount', 'desc', 'group' 열을 가진 데이터 (그룹별로 막대 순서대로)
+    precompute : bool, default True
+        True이면 누적합, 이전 누적합, 다음 라벨, 값 라벨을 서버에서 미리 계산하여
+        transform이 없는 spec을 생성. False이면 브라우저(Vega)의 window/calculate
+        transform으로 계산
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec
+    """
+    if precompute:
+        columns = waterfall_columns(source)
+    else:
+        # 그룹별 시작/끝 라벨 (window 계산에서 첫 막대와 마지막 출력 막대 구분용)
+        codes, _ = pd.factorize(source['group'])
+        labels = source['label'].to_numpy()
+        first = np.unique(codes, return_index=True)[1]
+        last = len(codes) - 1 - np.unique(codes[::-1], return_index=True)[1]
+        columns = {name: source[name].to_numpy() for name in ('label', 'amount', 'desc', 'group')}
+        columns['start_label'] = labels[first[codes]]
+        columns['end_label'] = labels[last[codes]]
+    return fill_template(_waterfall_template(precompute), {WATERFALL_DATASET: to_records(columns)})
+
+
+def waterfall_columns(source: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """waterfall 막대 위치와 라벨을 그룹별로 계산 (Vega window/calculate transform과 동일)
+
+    - start: 이전 누적합 (막대 시작, 마지막 출력 막대는 0)
+    - end: 그룹 내 누적합 (막대 끝)
+    - next: 다음 막대 라벨 (연결선 끝, 마지막 막대는 자기 자신)
+    - top: 값 라벨 위치 (증가 막대는 위, 감소 막대는 아래 끝)
+    - text: 값 라벨 (절댓값 크기에 따라 소수점 0~2자리)
+
+    Vega와 마찬가지로 값이 없는(NaN) 막대는 0으로 취급하고, 좌표는 소수점 3자리로
+    반올림합니다.
+
+    Parameters
+    ----------
+    source : pd.DataFrame
+        'label', 'amount', 'desc', 'group' 열을 가진 데이터 (그룹별로 막대 순서대로)
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        차트 데이터셋 열 (원래 행 순서)
+    """
+    labels = source['label'].to_numpy()
+    amount = np.nan_to_num(source['amount'].to_numpy(dtype=float))
+    codes, _ = pd.factorize(source['group'])
+    n = len(codes)
+
+    # 그룹별로 모은 순서에서 누적합과 다음 라벨 계산
+    order = np.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+    starts = np.ones(n, dtype=bool)
+    starts[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    ends = np.ones(n, dtype=bool)
+    ends[:-1] = starts[1:]
+
+    csum = np.cumsum(amount[order])
+    before = csum - amount[order]
+    window_sum = np.empty(n)
+    window_sum[order] = csum - before[starts][np.cumsum(starts) - 1]
+
+    lead = np.empty(n, dtype=object)
+    lead_sorted = np.empty(n, dtype=object)
+    lead_sorted[:-1] = labels[order][1:]
+    lead_sorted[ends] = labels[order][ends]
+    lead[order] = lead_sorted
+
+    end_label = np.empty(n, dtype=object)
+    end_label[order] = labels[order][np.flatnonzero(ends)[np.cumsum(starts) - 1]]
+    is_end = labels == end_label
+
+    prev_sum = np.where(is_end, 0.0, window_sum - amount)
+    calc_amount = np.where(is_end, window_sum, amount)
+    top = np.where(calc_amount > 0, window_sum, prev_sum)
+
+    magnitude = np.abs(calc_amount)
+    fmt = np.where(magnitude >= 100, '{:.0f}', np.where(magnitude >= 10, '{:.1f}', '{:.2f}'))
+    amount_fmt = np.array([f.format(v) for f, v in zip(fmt, magnitude)], dtype=object)
 
+    return {
+        'label': labels,
+        'desc': source['desc'].to_numpy(),
+        'group': source['group'].to_numpy(),
+        'start': np.round(prev_sum, 3),
+        'end': np.round(window_sum, 3),
+        'next': lead,
+        'top': np.round(top, 3),
+        'text': amount_fmt,
+    }
+
+
+@lru_cache(maxsize=None)
+def _waterfall_template(precompute: bool) -> Dict[str, Any]:
+    """waterfall 차트 템플릿 (처음 한 번만 컴파일)
+
+    precompute가 True이면 transform 없이 미리 계산된 열(`waterfall_columns`)을 그대로 사용합니다.
+    """
+    source = alt.NamedData(WATERFALL_DATASET)
 
-def plot_waterfall_multi(source):
     # Define frequently referenced fields
     amount = alt.datum.amount
     label = alt.datum.label
     window_lead_label = alt.datum.window_lead_label
     window_sum_amount = alt.datum.window_sum_amount
 
-    # Define start and end labels
-    group_starts = source.groupby("group").first().reset_index()[["group", "label"]].rename(columns={"label": "start_label"})
-    group_ends = source.groupby("group").last().reset_index()[["group", "label"]].rename(columns={"label": "end_label"})
-    
-    # 기존 source에 merge
-    source = source.merge(group_starts, on="group")
-    source = source.merge(group_ends, on="group")
-
     # Define frequently referenced/long expressions
     calc_prev_sum = alt.expr.if_(label == alt.datum.end_label, 0, window_sum_amount - amount)
     calc_amount = alt.expr.if_(label == alt.datum.end_label, window_sum_amount, amount)
@@ -43,11 +244,14 @@ def plot_waterfall_multi(source):
         ) + calc_amount
     )
 
+    # 미리 계산한 데이터는 짧은 열 이름을 사용 (spec 크기 감소)
+    fields = WATERFALL_FIELDS if precompute else {name: name for name in WATERFALL_FIELDS}
+
     bar_size = 50
     fs = bar_size / 3.5
     
-    # The "base_chart" defines the transform_window, transform_calculate, and X axis
-    base_chart = alt.Chart(source).encode(
+    # The "base_chart" defines the X and Y axes (data is given once at the facet level)
+    base_chart = alt.Chart().encode(
         x=alt.X(
         "label:O",
         axis=alt.Axis(
@@ -59,7 +263,7 @@ def plot_waterfall_multi(source):
             sort=None
         ),
         y=alt.Y(
-            "calc_prev_sum:Q",
+            f"{fields['calc_prev_sum']}:Q",
             title="Exergy [W]",
             axis=alt.Axis(
                 labelFontSize=fs,   # y축 틱 레이블 폰트 크기
@@ -71,16 +275,15 @@ def plot_waterfall_multi(source):
     )
 
     bar = base_chart.mark_bar(size=bar_size).encode(
-        y2=alt.Y2("window_sum_amount:Q"),
+        y2=alt.Y2(f"{fields['window_sum_amount']}:Q"),
         color=alt.Color('group:N').legend(None).sort(None),
         tooltip=[
             alt.Tooltip("desc:N", title="Description"),
         ],
     )
 
-    # 툴팁 영역 확장용 투명 rect (전체 y범위)
-    max_y = float(source['amount'].sum()) if not source.empty else 1.0
-    hover_rect = alt.Chart(source).mark_rect(opacity=0).encode(
+    # 툴팁 영역 확장용 투명 rect (전체 y범위, 데이터는 상위 facet에서 상속)
+    hover_rect = alt.Chart().mark_rect(opacity=0).encode(
         x=alt.X("label:O", sort=None),
         color=alt.value('rgba(0,0,0,0)'),
         tooltip=[
@@ -90,28 +293,26 @@ def plot_waterfall_multi(source):
 
     # The "rule" chart is for the horizontal lines that connect the bars
     rule = base_chart.mark_rule(xOffset=-bar_size / 2, x2Offset=bar_size / 2, strokeWidth=0.5, tooltip=None).encode(
-        y="window_sum_amount:Q",
-        x2="calc_lead",
+        y=f"{fields['window_sum_amount']}:Q",
+        x2=fields['calc_lead'],
     )
 
     # Add values as text
     text_values_top = base_chart.mark_text(
         baseline="bottom", dy=-4, fontSize=fs, tooltip=None
     ).encode(
-        text=alt.Text(
-            "calc_amount:Q",
-            format="~s",),
-        y="calc_top:Q"
-    ).transform_calculate(
-        calc_amount_abs="abs(datum.calc_amount)",
-        calc_amount_fmt="""
-            datum.calc_amount_abs >= 100 ? format(datum.calc_amount_abs, ".0f") :
-            datum.calc_amount_abs >= 10 ? format(datum.calc_amount_abs, ".1f") :
-            format(datum.calc_amount_abs, ".2f")
-        """
-    ).encode(
-        text=alt.Text("calc_amount_fmt:N")
+        text=alt.Text(f"{fields['calc_amount_fmt']}:N"),
+        y=f"{fields['calc_top']}:Q"
     )
+    if not precompute:
+        text_values_top = text_values_top.transform_calculate(
+            calc_amount_abs="abs(datum.calc_amount)",
+            calc_amount_fmt="""
+                datum.calc_amount_abs >= 100 ? format(datum.calc_amount_abs, ".0f") :
+                datum.calc_amount_abs >= 10 ? format(datum.calc_amount_abs, ".1f") :
+                format(datum.calc_amount_abs, ".2f")
+            """
+        )
     # text_pos_values_top_of_bar = base_chart.mark_text(baseline="bottom", dy=-4, fontSize=fs, tooltip=None).encode(
     #     text=alt.Text("calc_sum_inc:N"),
     #     y="calc_sum_inc:Q",
@@ -139,7 +340,8 @@ def plot_waterfall_multi(source):
         width='container',
         height=190
     ).facet(
-        facet=alt.Facet("group").title('').sort([]),
+        data=source,
+        facet=alt.Facet("group:N").title('').sort([]),
         columns=1,
         spacing=50  # facet 간 간격 조절 (기본값은 20 정도)
     ).configure_header(
@@ -148,7 +350,14 @@ def plot_waterfall_multi(source):
         labelColor='black',
         labelAnchor='middle',
         labelPadding=2,
-    ).transform_window(
+    ).resolve_scale(
+        x="independent"
+    )
+
+    if precompute:
+        return chart_to_dict(chart)
+
+    chart = chart.transform_window(
         window_sum_amount="sum(amount)",
         window_lead_label="lead(label)",
         groupby=["group"],
@@ -166,11 +375,62 @@ def plot_waterfall_multi(source):
             alt.expr.format(window_sum_amount, ".2f"),
             None
         ),  
-    ).resolve_scale(
-        x="independent"
     )
     
-    return chart
+    return chart_to_dict(chart)
+
+
+# 효율 등급 색상
+GRADE_COLORS = [
+    '#E74C3C',
+    '#FF8C00',
+    '#FFD700',
+    '#90EE90',
+    '#32CD32',
+    '#228B22'
+]
+
+# 텍스트용 진한 색상 (시인성 개선)
+GRADE_TEXT_COLORS = [
+    '#E72D19',
+    '#FF8C00',
+    '#F0CA00',
+    '#00E700',
+    '#25DA25',
+    '#00A752'
+]
+
+# 효율 등급 이름 (낮은 등급부터)
+GRADE_LABELS = ['E', 'D', 'C', 'B', 'A', 'A+']
+
+# 등급 인덱스 배열로 한 번에 조회하기 위한 배열
+_GRADE_LABELS = np.array(GRADE_LABELS, dtype=object)
+_GRADE_COLORS = np.array(GRADE_COLORS, dtype=object)
+_GRADE_TEXT_COLORS = np.array(GRADE_TEXT_COLORS, dtype=object)
+
+
+def _grade_scale(grade_unit, grade_ranges):
+    """등급별 (이름, 시작, 끝, 색상) 목록 생성"""
+    grades = []
+    if grade_ranges is not None:
+        # 직접 지정된 범위 사용
+        for i, (label, (start, end)) in enumerate(zip(GRADE_LABELS, grade_ranges)):
+            grades.append({
+                'grade': label,
+                'start': start,
+                'end': end,
+                'color': GRADE_COLORS[i]
+            })
+    else:
+        # grade_unit을 사용한 기본 범위
+        for i, label in zip(range(6), GRADE_LABELS):
+            grades.append({
+                'grade': label,
+                'start': i * grade_unit,
+                'end': (i + 1) * grade_unit,
+                'color': GRADE_COLORS[i]
+            })
+    return grades
 
 
 def create_efficiency_grade_chart(
@@ -185,6 +445,7 @@ def create_efficiency_grade_chart(
     grade_unit=10,
     font_size=16,
     grade_ranges = None,
+    height=None,
 ):
     """
     에너지 효율 등급 시각화 생성
@@ -214,123 +475,163 @@ def create_efficiency_grade_chart(
     grade_ranges : list of tuple, optional
         각 등급의 (start, end) 범위 리스트. 예: [(0,10), (10,20), (20,30), (30,40), (40,50), (50,60)]
         제공되면 grade_unit은 무시됨
+    height : int, optional
+        차트 높이
     
     Returns:
     --------
-    alt.Chart
-        Altair 차트 객체
+    dict
+        Vega-Lite spec (등급 설정별로 컴파일한 템플릿에 케이스 데이터만 넣은 것)
     """
-    
+    if grade_ranges is not None:
+        grade_ranges = tuple(tuple(r) for r in grade_ranges)
+    template = _grade_template(
+        margin, bottom_height, top_height, text_rotation, text_dx, text_dy,
+        grade_unit, font_size, grade_ranges, height,
+    )
 
-    # 효율 등급 정의
-    colors = [
-        '#E74C3C',
-        '#FF8C00',
-        '#FFD700',
-        '#90EE90',
-        '#32CD32',
-        '#228B22'
-    ]
-    
-    # 텍스트용 진한 색상 (시인성 개선)
-    text_colors = [
-        '#E72D19',
-        '#FF8C00',
-        '#F0CA00',
-        '#00E700',
-        '#25DA25',
-        '#00A752'
+    # 케이스별 등급을 한 번에 찾고 해당 등급의 마진 offset 적용
+    efficiency = np.array([case['efficiency'] for case in cases], dtype=float)
+    grade_index = grade_indices(efficiency, grade_unit, grade_ranges)
+    # 명시적 타입 지정으로 JSON 직렬화 안정성 확보 (NaN은 None)
+    columns = zip(
+        cases,
+        _json_floats(efficiency + margin * grade_index),
+        _json_floats(efficiency),
+        _GRADE_LABELS[grade_index].tolist(),
+        _GRADE_COLORS[grade_index].tolist(),
+        _GRADE_TEXT_COLORS[grade_index].tolist(),
+    )
+    y2 = int(bottom_height)
+    adjusted_cases = [
+        {
+            **case,
+            'name': str(case['name']),
+            'efficiency': shifted,
+            'real_efficiency': real,
+            'y': 0,  # 위쪽 박스의 윗면과 정확히 일치
+            'y2': y2,
+            'grade': label,  # 등급 라벨 (보고서 등에서 사용)
+            'grade_color': color,
+            'text_color': text_color,  # 텍스트용 진한 색상
+        }
+        for case, shifted, real, label, color, text_color in columns
     ]
 
-    grades = []
+    spec = fill_template(template, {'grade_cases': adjusted_cases})
+
+    # 차트에 고유 이름 설정 (React 키 역할)
+    case_names_str = "_".join([case.get('name', '') for case in cases])
+    spec['name'] = f"efficiency_grade_{hash(case_names_str) % 10000}"
+    return spec
+
+
+def grade_indices(efficiency, grade_unit=10, grade_ranges=None) -> np.ndarray:
+    """효율값 배열의 등급 인덱스 (0: E ~ 5: A+)
+
+    등급 범위는 오름차순이어야 합니다. 마지막 등급의 끝 이상이면 최고 등급,
+    어느 범위에도 속하지 않으면(범위 아래, 범위 사이, NaN) 최저 등급입니다.
+    """
     if grade_ranges is not None:
-        # 직접 지정된 범위 사용
-        for i, (label, (start, end)) in enumerate(zip(['E', 'D', 'C', 'B', 'A', 'A+'], grade_ranges)):
-            grades.append({
-                'grade': label,
-                'start': start,
-                'end': end,
-                'color': colors[i]
-            })
-    else:
-        # grade_unit을 사용한 기본 범위
-        for i, label in zip(range(6), ['E', 'D', 'C', 'B', 'A', 'A+']):
-            grades.append({
-                'grade': label,
-                'start': i * grade_unit,
-                'end': (i + 1) * grade_unit,
-                'color': colors[i]
-            })
-    
+        grade_ranges = tuple(tuple(r) for r in grade_ranges)
+    starts, ends = _grade_bounds(grade_unit, grade_ranges)
+    efficiency = np.asarray(efficiency, dtype=float)
+    index = np.searchsorted(starts, efficiency, side='right') - 1
+    inside = (index >= 0) & (efficiency < ends[np.maximum(index, 0)])
+    index = np.where(inside, index, 0)
+    return np.where(efficiency >= ends[-1], len(ends) - 1, index)
+
+
+@lru_cache(maxsize=64)
+def _grade_bounds(grade_unit, grade_ranges):
+    """등급별 시작/끝 값 배열"""
+    grades = _grade_scale(grade_unit, grade_ranges)
+    starts = np.array([grade['start'] for grade in grades], dtype=float)
+    ends = np.array([grade['end'] for grade in grades], dtype=float)
+    starts.flags.writeable = False
+    ends.flags.writeable = False
+    return starts, ends
+
+
+def _json_floats(values: np.ndarray) -> list:
+    """float 배열을 JSON으로 직렬화할 수 있는 리스트로 변환 (NaN은 None)"""
+    nan = np.isnan(values)
+    if nan.any():
+        return np.where(nan, None, values).tolist()
+    return values.tolist()
+
+
+@lru_cache(maxsize=64)
+def _grade_template(
+    margin,
+    bottom_height,
+    top_height,
+    text_rotation,
+    text_dx,
+    text_dy,
+    grade_unit,
+    font_size,
+    grade_ranges,
+    height,
+):
+    """효율 등급 차트 템플릿 (등급 설정별로 한 번만 컴파일)
+
+    등급 박스, 등급 라벨, 축 제목 데이터는 템플릿에 포함되고, 케이스 데이터
+    ('grade_cases')만 렌더링할 때 채워집니다.
+    """
+    grades = _grade_scale(grade_unit, grade_ranges)
+
     # 마진을 적용한 등급 데이터 생성 (박스 이동 방식)
-    grade_data_bottom = []  # 아래쪽 알파 박스
-    grade_data_top = []     # 위쪽 진한색 박스
+    # 아래쪽 알파 박스, 위쪽 진한색 박스, 등급 라벨이 등급당 한 행인 데이터셋 하나를 공유
+    grade_data = []
     
     for i, grade in enumerate(grades):
         # 첫 번째 등급은 그대로, 이후 등급들은 마진만큼 이동
         offset = margin * i
         
-        # 아래쪽 알파 박스
-        grade_data_bottom.append({
+        grade_data.append({
             'grade': grade['grade'],
             'start': grade['start'] + offset,
             'end': grade['end'] + offset,
             'real_start': grade['start'],
             'real_end': grade['end'],
             'color': grade['color'],
-            'y': 0,
-            'height': bottom_height + 1,
-            'original_start': grade['start']
-        })
-        
-        # 위쪽 진한색 박스 (등급 텍스트용)
-        grade_data_top.append({
-            'grade': grade['grade'],
-            'start': grade['start'] + offset,
-            'end': grade['end'] + offset,
-            'real_start': grade['start'],
-            'real_end': grade['end'],
-            'color': grade['color'],
-            'y': bottom_height,  # 아래쪽 박스 위에 위치
-            'height': top_height,
+            # 아래쪽 알파 박스
+            'bottom_y': 0,
+            'bottom_height': bottom_height + 1,
+            # 위쪽 진한색 박스 (등급 텍스트용, 아래쪽 박스 위에 위치)
+            'top_y': bottom_height,
+            'top_height': top_height,
+            # 등급 레이블 위치 (위쪽 박스 중앙)
+            'x_center': ((grade['start'] + offset) + (grade['end'] + offset)) / 2,
+            'y_center': (bottom_height + top_height) / 2,
             'original_start': grade['start']
         })
     
     # DataFrame 생성 시 명시적으로 데이터 타입 지정 및 JSON 직렬화 안정성 확보
-    grade_df_bottom = pd.DataFrame(grade_data_bottom).astype({
-        'grade': 'str',
-        'start': 'float64',
-        'end': 'float64',
-        'real_start': 'int',
-        'real_end': 'int',
-        'color': 'str',
-        'y': 'int',
-        'height': 'int',
-        'original_start': 'int'
-    }).copy()  # 명시적 복사로 참조 문제 방지
-    
-    grade_df_top = pd.DataFrame(grade_data_top).astype({
+    grade_df = pd.DataFrame(grade_data).astype({
         'grade': 'str',
         'start': 'float64',
         'end': 'float64',
         'real_start': 'int',
         'real_end': 'int',
         'color': 'str',
-        'y': 'int',
-        'height': 'int',
+        'bottom_y': 'int',
+        'bottom_height': 'int',
+        'top_y': 'int',
+        'top_height': 'int',
+        'x_center': 'float64',
+        'y_center': 'float64',
         'original_start': 'int'
-    }).copy()  # 명시적 복사로 참조 문제 방지
-    
-    # 포인트 위치 계산 (y=0 위치)
-    point_y = 0  # y=0 위치
+    })
     
     # 실제 등급 시작점들 (x축 틱 위치용) - 마진의 중간에 위치하도록 조정
-    actual_starts = [grade['start'] - 0.5 * margin for grade in grade_data_bottom]
-    labels = [int(grade['real_start']) for grade in grade_data_bottom]
+    actual_starts = [grade['start'] - 0.5 * margin for grade in grade_data]
+    labels = [int(grade['real_start']) for grade in grade_data]
     
     # 마지막 박스의 오른쪽 끝 값 추가
-    actual_starts.append(grade_data_bottom[-1]['end'] - 0.5 * margin)
-    labels.append(int(grade_data_bottom[-1]['real_end']))
+    actual_starts.append(grade_data[-1]['end'] - 0.5 * margin)
+    labels.append(int(grade_data[-1]['real_end']))
     
     # labelExpr을 미리 생성하여 안정성 확보
     label_conditions = []
@@ -342,17 +643,17 @@ def create_efficiency_grade_chart(
     chart_height = top_height  # 전체 박스 높이
     
     # 아래쪽 알파 박스 차트
-    bottom_chart = alt.Chart(grade_df_bottom).mark_rect(
+    bottom_chart = alt.Chart(alt.NamedData('grade_scale')).mark_rect(
         # stroke='white',
         # strokeWidth=1,
         opacity=0.3  # 알파 적용
     ).encode(
         x=alt.X('start:Q'),
         x2=alt.X2('end:Q'),
-        y=alt.Y('y:Q', 
+        y=alt.Y('bottom_y:Q', 
                 scale=alt.Scale(domain=[0, chart_height]),
                 axis=None),
-        y2=alt.Y2('height:Q'),
+        y2=alt.Y2('bottom_height:Q'),
         color=alt.Color('color:N', scale=None),
         tooltip=[
             alt.Tooltip('grade:N', title='Grade'),
@@ -365,7 +666,7 @@ def create_efficiency_grade_chart(
     )
     
     # 위쪽 진한색 박스 차트
-    top_chart = alt.Chart(grade_df_top).mark_rect(
+    top_chart = alt.Chart(alt.NamedData('grade_scale')).mark_rect(
         # stroke='white',
         # strokeWidth=1
     ).encode(
@@ -387,8 +688,8 @@ def create_efficiency_grade_chart(
                     labelPadding=5,  # 틱 라벨과 축 사이의 거리 줄임
                 )),
         x2=alt.X2('end:Q'),
-        y=alt.Y('y:Q'),
-        y2=alt.Y2('height:Q'),
+        y=alt.Y('top_y:Q'),
+        y2=alt.Y2('top_height:Q'),
         color=alt.Color('color:N', scale=None),
         tooltip=[
             alt.Tooltip('grade:N', title='Grade'),
@@ -397,16 +698,8 @@ def create_efficiency_grade_chart(
         ]
     )
     
-    # 등급 레이블 추가 (위쪽 박스에) - 데이터 타입 안정성 확보
-    grade_labels = grade_df_top.copy()
-    grade_labels['x_center'] = (grade_labels['start'] + grade_labels['end']) / 2
-    grade_labels['y_center'] = (grade_labels['y'] + grade_labels['height']) / 2
-    grade_labels = grade_labels.astype({
-        'x_center': 'float64',
-        'y_center': 'float64'
-    }).copy()  # 이중 복사로 데이터 안정성 확보
-    
-    label_chart = alt.Chart(grade_labels).mark_text(
+    # 등급 레이블 추가 (위쪽 박스에)
+    label_chart = alt.Chart(alt.NamedData('grade_scale')).mark_text(
         fontSize=font_size * 1.3,
         fontWeight='bold',
         color='white'
@@ -433,7 +726,7 @@ def create_efficiency_grade_chart(
         'title': 'str'
     })
     
-    title_chart = alt.Chart(title_data).mark_text(
+    title_chart = alt.Chart(alt.NamedData('grade_title')).mark_text(
         fontSize=font_size + 1,
         color='black',
         dx=0,  # 원하는 dx 오프셋
@@ -445,55 +738,11 @@ def create_efficiency_grade_chart(
         text=alt.Text('title:N'),
         tooltip=[],
     )
-    
-    # 케이스 데이터를 마진을 고려해서 조정
-    adjusted_cases = []
-    for case in cases:
-        efficiency = case['efficiency']
-        # 어느 등급에 속하는지 찾기
-        grade_index = 0
-        grade_color = colors[0]  # 기본값
-        text_color = text_colors[0]  # 텍스트용 기본값
-        for i, grade in enumerate(grades):
-            if grade['start'] <= efficiency < grade['end']:
-                grade_index = i
-                grade_color = grade['color']
-                text_color = text_colors[i]
-                break
-            elif efficiency >= grades[-1]['end']:  # A+ 등급 이상
-                grade_index = len(grades) - 1
-                grade_color = grades[-1]['color']
-                text_color = text_colors[-1]
-                break
-        
-        # 해당 등급의 마진 offset 적용
-        offset = margin * grade_index
-        adjusted_case = case.copy()
-        adjusted_case['efficiency'] = efficiency + offset
-        adjusted_case['real_efficiency'] = efficiency
-        adjusted_case['y'] = point_y  # 위쪽 박스의 윗면과 정확히 일치
-        adjusted_case['y2'] = bottom_height
-        adjusted_case['grade_color'] = grade_color  # 등급 색상 추가
-        adjusted_case['text_color'] = text_color  # 텍스트용 진한 색상 추가
-        adjusted_cases.append(adjusted_case)
-    
-    # case_df도 명시적 타입 지정으로 안정성 향상
-    case_df = pd.DataFrame(adjusted_cases)
-    if not case_df.empty:
-        case_df = case_df.astype({
-            'name': 'str',
-            'efficiency': 'float64',
-            'real_efficiency': 'float64',
-            'y': 'int',
-            'y2': 'int',
-            'grade_color': 'str',
-            'text_color': 'str'
-        }).copy()  # 명시적 복사로 참조 문제 방지
-    
+
     # 레이어 순서: alpha box (bottom), grade box (top), label (top), title
     layers = [bottom_chart, top_chart, label_chart, title_chart]
     # 포인트에서 알파 박스 높이까지의 점선 수직선
-    case_lines = alt.Chart(case_df).mark_rule(
+    case_lines = alt.Chart().mark_rule(
         strokeDash=[2, 2],  # 점선
         strokeWidth=3.5
     ).encode(
@@ -509,7 +758,7 @@ def create_efficiency_grade_chart(
     layers.append(case_lines)
             
     # 3. 케이스 점 차트 (가장 아래) - 위쪽 박스의 윗면에 정확히 위치
-    case_points = alt.Chart(case_df).mark_circle(
+    case_points = alt.Chart().mark_circle(
         size=150,
         stroke='white',
         strokeWidth=2,
@@ -527,7 +776,7 @@ def create_efficiency_grade_chart(
     
     # 2. 케이스 이름 텍스트 (포인트 위) - 회전 옵션 적용
     text_angle = text_rotation
-    case_names = alt.Chart(case_df).mark_text(
+    case_names = alt.Chart().mark_text(
         fontSize=font_size,
         dx=text_dx,  # 회전 시 위치 조정
         dy=text_dy,
@@ -546,18 +795,290 @@ def create_efficiency_grade_chart(
     layers.append(case_names)
     
     # 모든 레이어 결합
-    chart = alt.layer(*layers)
+    # 케이스 데이터는 최상위 데이터로 두고 케이스 레이어들이 상속
+    chart = alt.layer(*layers, data=alt.NamedData('grade_cases'))
 
     # view의 외각선 제거 및 안정적인 렌더링을 위한 설정
     chart = chart.configure_view(stroke=None).resolve_scale(color='independent')
-    
-    # 차트에 고유 이름 설정 (React 키 역할)
-    case_names_str = "_".join([case.get('name', '') for case in cases])
-    chart_name = f"efficiency_grade_{hash(case_names_str) % 10000}"
-    chart = chart.properties(
+    chart = chart.properties(width='container')
+    if height is not None:
+        chart = chart.properties(height=height)
+
+    template = chart_to_dict(chart)
+    template['datasets'] = {
+        'grade_scale': to_records(grade_df),
+        'grade_title': to_records(title_data),
+    }
+    return template
+
+
+def plot_destruction_heatmap(data: Dict[str, Any]) -> Dict[str, Any]:
+    """시스템(또는 효율 구간) x 엑서지 소비 항목 히트맵 spec 생성
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        'row', 'term', 'value', 'n' 열 (long-form, 행 순서대로).
+        'n'은 행에 묶인 시스템 수 (구간 집계가 아니면 1)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec. 행 높이가 고정되어 있으므로 spec 크기는 행 수에만 비례
+    """
+    return fill_template(_heatmap_template(), {HEATMAP_DATASET: to_records(data)})
+
+
+@lru_cache(maxsize=None)
+def _heatmap_template() -> Dict[str, Any]:
+    """히트맵 템플릿 (처음 한 번만 컴파일)"""
+    chart = alt.Chart(alt.NamedData(HEATMAP_DATASET)).mark_rect(stroke='white', strokeWidth=0.5).encode(
+        x=alt.X('term:N', sort=None, title=None).axis(orient='top', labelAngle=-45, labelFontSize=12),
+        y=alt.Y('row:N', sort=None, title=None).axis(labelFontSize=12, labelLimit=260),
+        color=alt.Color('value:Q', title='Exergy consumed [W]').scale(scheme='orangered'),
+        tooltip=[
+            alt.Tooltip('row:N', title='System'),
+            alt.Tooltip('term:N', title='Term'),
+            alt.Tooltip('value:Q', title='Exergy consumed [W]', format='.2f'),
+            alt.Tooltip('n:Q', title='Systems'),
+        ],
+    ).properties(
         width='container',
-        name=chart_name  # 고유 식별자 추가
+        height=alt.Step(16),
     )
+    return chart_to_dict(chart)
 
 
-    return chart
\ No newline at end of file
+def plot_efficiency_ranking(ranking: Dict[str, Any]) -> Dict[str, Any]:
+    """엑서지 효율 상위 k개 시스템 순위 spec 생성
+
+    Parameters
+    ----------
+    ranking : Dict[str, Any]
+        'rank', 'system', 'type', 'efficiency' [%] 열 (순위 순서대로)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec. 데이터 크기는 k로 제한되어 시스템 수와 무관
+    """
+    return fill_template(_ranking_template(), {RANKING_DATASET: to_records(ranking)})
+
+
+def plot_efficiency_distribution(distribution: Dict[str, Any]) -> Dict[str, Any]:
+    """엑서지 효율 분포(구간 집계) spec 생성
+
+    Parameters
+    ----------
+    distribution : Dict[str, Any]
+        효율 구간별 'start', 'end' [%], 'type', 'count' 열
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec. 데이터 크기는 (구간 수 x 시스템 타입 수)로 제한되어 시스템 수와 무관
+    """
+    return fill_template(_distribution_template(), {DISTRIBUTION_DATASET: to_records(distribution)})
+
+
+def _type_color() -> alt.Color:
+    return alt.Color('type:N', title='System type').scale(range=COLORS).legend(orient='bottom')
+
+
+@lru_cache(maxsize=None)
+def _ranking_template() -> Dict[str, Any]:
+    """순위 템플릿 (처음 한 번만 컴파일)"""
+    bars = alt.Chart(alt.NamedData(RANKING_DATASET)).mark_bar().encode(
+        y=alt.Y('system:N', sort=None, title=None).axis(labelFontSize=12, labelLimit=260),
+        x=alt.X('efficiency:Q', title='Exergy Efficiency [%]'),
+        color=_type_color(),
+        tooltip=[
+            alt.Tooltip('rank:Q', title='Rank'),
+            alt.Tooltip('system:N', title='System'),
+            alt.Tooltip('efficiency:Q', title='Exergy efficiency [%]', format='.2f'),
+        ],
+    )
+    text = bars.mark_text(align='left', baseline='middle', dx=3, fontSize=12).encode(
+        text=alt.Text('efficiency:Q', format='.1f'),
+        color=alt.value('black'),
+    )
+    chart = alt.layer(bars, text).properties(width='container', height=alt.Step(18))
+    return chart_to_dict(chart)
+
+
+@lru_cache(maxsize=None)
+def _distribution_template() -> Dict[str, Any]:
+    """분포 템플릿 (처음 한 번만 컴파일)"""
+    chart = alt.Chart(alt.NamedData(DISTRIBUTION_DATASET)).mark_bar(binSpacing=1).encode(
+        x=alt.X('start:Q', title='Exergy Efficiency [%]').bin('binned'),
+        x2='end:Q',
+        y=alt.Y('count:Q', title='Systems').stack('zero'),
+        color=_type_color(),
+        tooltip=[
+            alt.Tooltip('start:Q', title='From [%]', format='.1f'),
+            alt.Tooltip('end:Q', title='To [%]', format='.1f'),
+            alt.Tooltip('type:N', title='System type'),
+            alt.Tooltip('count:Q', title='Systems'),
+        ],
+    ).properties(width='container', height=300)
+    return chart_to_dict(chart)
+
+
+def plot_sweep_heatmap(
+    cells: Dict[str, Any],
+    point: Dict[str, Any],
+    x_title: str,
+    y_title: str,
+    value_title: str,
+    levels: Optional[int] = None,
+) -> Dict[str, Any]:
+    """2차원 파라미터 sweep 히트맵 spec 생성
+
+    Parameters
+    ----------
+    cells : Dict[str, Any]
+        격자 셀의 'x', 'y' (중심), 'x0', 'x1', 'y0', 'y1' (경계), 'value' 열
+    point : Dict[str, Any]
+        현재 운전점의 'x', 'y', 'value' 열 (한 행)
+    x_title, y_title, value_title : str
+        축과 색상 범례 제목
+    levels : int, optional
+        지정하면 값을 `levels`개 구간으로 나누어 등고선처럼 색상을 단계적으로 표시
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec
+    """
+    return fill_template(_sweep_template(x_title, y_title, value_title, levels), {
+        SWEEP_DATASET: to_records(cells),
+        SWEEP_POINT_DATASET: to_records(point),
+    })
+
+
+@lru_cache(maxsize=64)
+def _sweep_template(x_title: str, y_title: str, value_title: str, levels: Optional[int]) -> Dict[str, Any]:
+    """sweep 히트맵 템플릿 (축 제목과 색상 단계별로 한 번만 컴파일)"""
+    if levels:
+        scale = alt.Scale(type='quantize', scheme=alt.SchemeParams('viridis', count=levels), nice=True, zero=False)
+        legend = alt.Legend(symbolLimit=levels + 1)
+    else:
+        scale = alt.Scale(scheme='viridis', zero=False)
+        legend = alt.Legend()
+    tooltip = [
+        alt.Tooltip('x:Q', title=x_title, format='.3~f'),
+        alt.Tooltip('y:Q', title=y_title, format='.3~f'),
+        alt.Tooltip('value:Q', title=value_title, format='.4~f'),
+    ]
+
+    cells = alt.Chart(alt.NamedData(SWEEP_DATASET)).mark_rect().encode(
+        x=alt.X('x0:Q', title=x_title).scale(zero=False, nice=False),
+        x2='x1:Q',
+        y=alt.Y('y0:Q', title=y_title).scale(zero=False, nice=False),
+        y2='y1:Q',
+        color=alt.Color('value:Q', title=value_title, scale=scale, legend=legend),
+        tooltip=tooltip,
+    )
+    point = alt.Chart(alt.NamedData(SWEEP_POINT_DATASET)).mark_point(
+        shape='cross', size=200, filled=True, color='#ff2b2b', stroke='white', strokeWidth=1,
+    ).encode(
+        x='x:Q',
+        y='y:Q',
+        tooltip=tooltip,
+    )
+    chart = alt.layer(cells, point).properties(width='container', height=420)
+    return chart_to_dict(chart)
+
+
+def plot_explore(
+    data: Dict[str, Any],
+    axes: tuple,
+    titles: tuple,
+    terms: tuple,
+    values: tuple,
+) -> Dict[str, Any]:
+    """미리 계산한 격자를 브라우저에서 슬라이더로 탐색하는 차트 spec 생성
+
+    파라미터마다 Vega-Lite param에 연결된 슬라이더를 두고, 슬라이더 값에 가장 가까운
+    격자점을 브라우저에서 골라 표시하므로 슬라이더를 움직여도 서버가 다시 실행되지 않습니다.
+
+    - 위: 첫 번째 파라미터에 따른 엑서지 효율 (나머지 파라미터는 슬라이더 값으로 고정)
+    - 아래: 슬라이더 값의 격자점에서 엑서지 소비 항목
+
+    Parameters
+    ----------
+    data : Dict[str, Any]
+        격자점마다 'i0', 'i1', ... (축별 격자 인덱스), 'X_eff' [%], 엑서지 소비 항목 열
+    axes : tuple
+        축 정의 (하한, 상한, 점 수)의 튜플 (파라미터 순서)
+    titles : tuple
+        파라미터별 슬라이더/축 제목
+    terms : tuple
+        엑서지 소비 항목 열 이름
+    values : tuple
+        슬라이더 초기값 (파라미터 순서)
+
+    Returns
+    -------
+    Dict[str, Any]
+        Vega-Lite spec
+    """
+    spec = fill_template(_explore_template(axes, titles, terms), {EXPLORE_DATASET: to_records(data)})
+    spec['params'] = [dict(param, value=value) for param, value in zip(spec['params'], values)]
+    return spec
+
+
+def explore_step(axis: tuple) -> float:
+    """축 정의 (하한, 상한, 점 수)의 격자 간격 (점이 하나이면 1)"""
+    low, high, n = axis
+    return (high - low) / (n - 1) if n > 1 else 1.0
+
+
+@lru_cache(maxsize=64)
+def _explore_template(axes: tuple, titles: tuple, terms: tuple) -> Dict[str, Any]:
+    """탐색 차트 템플릿 (축 정의, 제목, 소비 항목별로 한 번만 컴파일)"""
+    sliders = [
+        alt.param(
+            name=f'p{j}', value=float(low),
+            bind=alt.binding_range(min=low, max=high, step=explore_step((low, high, n)), name=f'{title} '),
+        )
+        for j, ((low, high, n), title) in enumerate(zip(axes, titles))
+    ]
+
+    def selected(dims):
+        # 슬라이더 값에 가장 가까운 격자 인덱스와 같은 행만 남김
+        return ' && '.join(
+            f'datum.i{j} == round((p{j} - {axes[j][0]!r}) / {explore_step(axes[j])!r})' for j in dims
+        ) or 'true'
+
+    x = f'{axes[0][0]!r} + datum.i0 * {explore_step(axes[0])!r}'
+    efficiency = alt.Chart(alt.NamedData(EXPLORE_DATASET)).transform_filter(
+        selected(range(1, len(axes)))
+    ).transform_calculate(x=x)
+    line = efficiency.mark_line(point=True, color=COLORS[6]).encode(
+        x=alt.X('x:Q', title=titles[0]).scale(zero=False, nice=False),
+        y=alt.Y('X_eff:Q', title='Exergy efficiency [%]').scale(zero=False),
+        tooltip=[
+            alt.Tooltip('x:Q', title=titles[0], format='.3~f'),
+            alt.Tooltip('X_eff:Q', title='Exergy efficiency [%]', format='.2f'),
+        ],
+    )
+    current = efficiency.transform_filter(selected([0])).mark_point(
+        shape='cross', size=200, filled=True, color='#ff2b2b',
+    ).encode(x='x:Q', y='X_eff:Q')
+    top = alt.layer(line, current).properties(width=640, height=260)
+
+    charts = [top]
+    if terms:
+        bars = alt.Chart(alt.NamedData(EXPLORE_DATASET)).transform_filter(
+            selected(range(len(axes)))
+        ).transform_fold(list(terms), as_=['term', 'value']).mark_bar(color=COLORS[2]).encode(
+            x=alt.X('value:Q', title='Exergy consumed [W]'),
+            y=alt.Y('term:N', title=None, sort=list(terms)),
+            tooltip=[
+                alt.Tooltip('term:N', title='Term'),
+                alt.Tooltip('value:Q', title='Exergy consumed [W]', format='.2f'),
+            ],
+        ).properties(width=640, height=alt.Step(22))
+        charts.append(bars)
+    return chart_to_dict(alt.vconcat(*charts).add_params(*sliders))
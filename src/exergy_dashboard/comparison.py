@@ -0,0 +1,184 @@
+"""대규모 비교 시각화 모듈
+
+시스템이 수십~수백 개일 때도 spec 크기와 브라우저 메모리가 일정하도록, 시스템마다
+차트를 그리는 대신 결과 테이블에서 집계한 데이터만 전송하는 비교 시각화를 제공합니다.
+
+- 엑서지 소비 히트맵: 시스템 x 엑서지 소비 항목(X_c_*). 행이 많으면 효율 구간별 평균으로 집계
+- 효율 순위: 엑서지 효율 상위 k개 시스템
+- 효율 분포: 전체 시스템의 효율 구간별 시스템 수 (시스템 타입별 누적)
+
+시스템별 waterfall은 `page_size`를 지정해 등록하면 효율 순위 순서로 페이지를 나누어
+표시합니다(`VisualizationRegistry.register` 참조).
+
+Examples
+--------
+>>> from exergy_dashboard.comparison import register_comparison_views
+>>> register_comparison_views('COOLING')
+"""
+
+import functools
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from exergy_dashboard.chart import (
+    plot_destruction_heatmap,
+    plot_efficiency_distribution,
+    plot_efficiency_ranking,
+)
+from exergy_dashboard.results import ResultTable, get_result_table
+from exergy_dashboard.visualization import VisualizationRegistry, registry as viz_registry
+from exergy_dashboard.waterfall import WaterfallRegistry, waterfall_registry
+
+
+# 순위 차트에 표시할 시스템 수
+TOP_K = 20
+
+# 히트맵에 시스템별로 표시할 최대 행 수 (초과하면 효율 구간별로 집계)
+MAX_HEATMAP_ROWS = 60
+
+# 효율 구간 수
+N_BINS = 20
+
+
+def consumption_terms(
+    table: ResultTable,
+    selected_systems: Sequence[str],
+    mode: str,
+    registry: Optional[WaterfallRegistry] = None,
+) -> List[str]:
+    """선택한 시스템 타입들의 waterfall 정의에 나오는 엑서지 소비 항목 (정의 순서, 중복 제거)"""
+    registry = registry or waterfall_registry
+    terms: Dict[str, None] = {}
+    for system_type in dict.fromkeys(table.system_type(name) for name in selected_systems):
+        for step in registry.get(mode, system_type) or ():
+            if step.source and step.source.startswith('X_c_'):
+                terms[step.source] = None
+    return list(terms)
+
+
+def heatmap_data(
+    table: ResultTable,
+    selected_systems: Sequence[str],
+    mode: str,
+    max_rows: int = MAX_HEATMAP_ROWS,
+    bins: int = N_BINS,
+) -> Dict[str, np.ndarray]:
+    """엑서지 소비 히트맵 데이터 (행: 효율 내림차순)
+
+    시스템 수가 `max_rows` 이하이면 시스템마다 한 행, 초과하면 엑서지 효율 구간마다
+    한 행(구간에 속한 시스템의 평균)으로 집계합니다.
+
+    Returns
+    -------
+    Dict[str, np.ndarray]
+        'row', 'term', 'value', 'n' 열 (long-form)
+    """
+    names = table.rank('X_eff', [name for name in selected_systems if name in table])
+    terms = consumption_terms(table, names, mode)
+    values = table.values(names, terms) if names and terms else np.empty((len(names), len(terms)))
+    rows = np.array(names, dtype=object)
+    counts = np.ones(len(names), dtype=int)
+
+    if len(names) > max_rows:
+        efficiency = table.column('X_eff', names) * 100
+        valid = np.isfinite(efficiency)
+        efficiency, values = efficiency[valid], values[valid]
+        edges = np.histogram_bin_edges(efficiency, bins=bins) if len(efficiency) else np.zeros(bins + 1)
+        index = np.clip(np.searchsorted(edges, efficiency, side='right') - 1, 0, bins - 1)
+
+        # 구간별 평균 (항목이 없는 시스템은 평균에서 제외)
+        present = ~np.isnan(values)
+        sums = np.zeros((bins, len(terms)))
+        present_counts = np.zeros((bins, len(terms)))
+        np.add.at(sums, index, np.where(present, values, 0.0))
+        np.add.at(present_counts, index, present)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums / present_counts
+
+        counts = np.bincount(index, minlength=bins)
+        order = [b for b in range(bins - 1, -1, -1) if counts[b] > 0]  # 높은 효율 구간부터
+        rows = np.array(
+            [f'{edges[b]:.1f}-{edges[b + 1]:.1f} % ({counts[b]} systems)' for b in order],
+            dtype=object,
+        )
+        values, counts = means[order], counts[order]
+
+    k = len(terms)
+    return {
+        'row': np.repeat(rows, k),
+        'term': np.tile(np.array(terms, dtype=object), len(rows)),
+        'value': values.ravel(),
+        'n': np.repeat(counts, k),
+    }
+
+
+def ranking_data(table: ResultTable, selected_systems: Sequence[str], k: int = TOP_K) -> Dict[str, Any]:
+    """엑서지 효율 상위 k개 시스템 (결과가 없는 시스템은 제외)"""
+    names = table.rank('X_eff', [name for name in selected_systems if name in table])
+    efficiency = table.column('X_eff', names) * 100
+    top = [i for i in range(len(names)) if np.isfinite(efficiency[i])][:k]
+    return {
+        'rank': np.arange(1, len(top) + 1),
+        'system': [names[i] for i in top],
+        'type': [table.system_type(names[i]) for i in top],
+        'efficiency': efficiency[top],
+    }
+
+
+def distribution_data(
+    table: ResultTable,
+    selected_systems: Sequence[str],
+    bins: int = N_BINS,
+) -> Dict[str, np.ndarray]:
+    """엑서지 효율 구간별, 시스템 타입별 시스템 수 (시스템이 없는 구간은 제외)"""
+    names = [name for name in selected_systems if name in table]
+    efficiency = table.column('X_eff', names) * 100
+    valid = np.isfinite(efficiency)
+    efficiency = efficiency[valid]
+    types = np.array([table.system_type(name) for name in names], dtype=object)[valid]
+    if not len(efficiency):
+        return {'start': np.empty(0), 'end': np.empty(0), 'type': np.empty(0, dtype=object),
+                'count': np.empty(0, dtype=int)}
+
+    edges = np.histogram_bin_edges(efficiency, bins=bins)
+    labels, codes = np.unique(types, return_inverse=True)
+    index = np.clip(np.searchsorted(edges, efficiency, side='right') - 1, 0, bins - 1)
+    counts = np.zeros((len(labels), bins), dtype=int)
+    np.add.at(counts, (codes, index), 1)
+
+    type_index, bin_index = np.nonzero(counts)
+    return {
+        'start': edges[bin_index],
+        'end': edges[bin_index + 1],
+        'type': labels[type_index],
+        'count': counts[type_index, bin_index],
+    }
+
+
+def plot_consumption_heatmap(session_state: Any, selected_systems: List[str], mode: str) -> Dict[str, Any]:
+    """엑서지 소비 히트맵 차트 생성"""
+    table = get_result_table(session_state, selected_systems)
+    return plot_destruction_heatmap(heatmap_data(table, selected_systems, mode))
+
+
+def plot_top_systems(session_state: Any, selected_systems: List[str]) -> Dict[str, Any]:
+    """엑서지 효율 상위 시스템 순위 차트 생성"""
+    table = get_result_table(session_state, selected_systems)
+    return plot_efficiency_ranking(ranking_data(table, selected_systems))
+
+
+def plot_distribution(session_state: Any, selected_systems: List[str]) -> Dict[str, Any]:
+    """엑서지 효율 분포 차트 생성"""
+    table = get_result_table(session_state, selected_systems)
+    return plot_efficiency_distribution(distribution_data(table, selected_systems))
+
+
+def register_comparison_views(mode: str, registry: Optional[VisualizationRegistry] = None) -> None:
+    """모드에 대규모 비교 시각화를 등록 (모든 모드에 공통)"""
+    registry = registry or viz_registry
+    registry.register(mode, 'Exergy consumption heatmap')(
+        functools.partial(plot_consumption_heatmap, mode=mode)
+    )
+    registry.register(mode, f'Top {TOP_K} by exergy efficiency')(plot_top_systems)
+    registry.register(mode, 'Exergy efficiency distribution')(plot_distribution)
@@ -70,7 +70,14 @@ See Also
 - evaluate_parameters : 통합 평가 인터페이스 함수
 """
 
-from typing import Callable, Dict, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent import futures as _futures
+from typing import Callable, Dict, Any, Optional, Hashable, List, Tuple, Union
+
+from exergy_dashboard.metrics import EVALUATION_ERRORS, EVALUATION_SECONDS
+from exergy_dashboard.results import is_scalar
 
 
 class EvaluationRegistry:
@@ -129,7 +136,8 @@ class EvaluationRegistry:
         Returns
         -------
         Dict[str, float]
-            계산된 변수들
+            계산된 변수들. 평가 함수가 `locals()`로 함께 반환한 계산 객체(enex 모델 등) 같은
+            숫자/문자열이 아닌 값은 제외 (캐시와 세션에 남아 메모리를 차지하지 않도록)
 
         Raises
         ------
@@ -139,16 +147,108 @@ class EvaluationRegistry:
         evaluator = self.get_evaluator(mode, system_type)
         if evaluator is None:
             raise ValueError(f"No evaluator registered for mode '{mode}' and system type '{system_type}'")
-        return evaluator(params)
+        with EVALUATION_SECONDS.time(mode, system_type):
+            try:
+                return scalar_variables(evaluator(params))
+            except Exception:
+                EVALUATION_ERRORS.inc(mode, system_type)
+                raise
+
+
+class EvaluationCache:
+    """평가 결과를 (모드, 시스템 타입, 파라미터) 단위로 보관하는 LRU 캐시
+
+    평가 함수는 순수 함수이므로 같은 입력에 대한 결과를 세션 간에 공유할 수 있습니다.
+    여러 스레드(스크립트 스레드, 스케줄러 워커)에서 동시에 접근하므로 잠금으로 보호합니다.
+
+    Parameters
+    ----------
+    maxsize : int, default 1024
+        보관할 최대 결과 수. 초과하면 가장 오래 사용되지 않은 결과부터 제거
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(mode: str, system_type: str, params: Dict[str, float]) -> Tuple:
+        """캐시 키 생성 (파라미터 순서와 무관)"""
+        return (mode, system_type, tuple(sorted(params.items())))
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """캐시된 결과를 반환하고, 없으면 None을 반환"""
+        with self._lock:
+            variables = self._data.get(key)
+            if variables is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return variables
+
+    def put(self, key: Hashable, variables: Dict[str, Any]) -> None:
+        """결과를 캐시에 저장"""
+        with self._lock:
+            self._data[key] = variables
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+def scalar_variables(variables: Dict[str, Any]) -> Dict[str, Any]:
+    """평가 결과에서 스칼라 숫자(`is_scalar`)와 문자열, bool 값만 남김"""
+    return {k: v for k, v in variables.items() if is_scalar(v) or isinstance(v, (bool, str))}
 
 
 # 전역 레지스트리 인스턴스 생성
 registry = EvaluationRegistry()
 
+# 전역 평가 결과 캐시 (모든 세션이 공유)
+evaluation_cache = EvaluationCache()
+
+# 근사 결과를 쓰기 전에 정확한 평가를 기다리는 시간 [s]
+APPROXIMATE_WAIT = 0.05
+
+# 근사 결과를 표시한 뒤 정확한 평가가 끝나기를 한 번에 기다리는 최대 시간 [s]
+REFINE_WAIT = 0.25
+
+
+def collect_parameters(sss: Any, system_name: str) -> Dict[str, float]:
+    """session state에서 '{system_name}:{parameter_name}' 형식의 입력값을 모음"""
+    params = {}
+    for key, value in sss.items():
+        if not key.startswith(system_name + ':'):
+            continue
+
+        key = key.split(':')[1]
+        params[key] = value
+    return params
+
+
 def evaluate_parameters(sss: Any, system_name: str) -> Dict[str, float]:
     """
     시스템 파라미터 평가를 위한 통합 인터페이스
 
+    평가는 서버 전역 스케줄러(`exergy_dashboard.scheduler`)를 통해 수행됩니다.
+    서버 과부하로 작업이 거절되거나 시간 초과되면 직전 결과를 유지하고
+    시스템에 ``'degraded'`` 표시를 남깁니다.
+
     Parameters
     ----------
     sss : Any
@@ -161,25 +261,191 @@ def evaluate_parameters(sss: Any, system_name: str) -> Dict[str, float]:
     Dict[str, float]
         계산된 변수들의 딕셔너리
     """
-    # Extract all inputs
-    params = {}
-    for key, value in sss.items():
-        if not key.startswith(system_name + ':'):
-            continue
-        
-        key = key.split(':')[1]
-        params[key] = value
+    return evaluate_systems(sss, [system_name], raise_errors=True)[system_name]
+
+
+def evaluate_systems(
+    sss: Any,
+    system_names: List[str],
+    raise_errors: bool = False,
+    approximate: bool = False,
+) -> Dict[str, Union[Dict[str, float], Exception]]:
+    """
+    여러 시스템을 스케줄러에 한꺼번에 제출하여 평가
+
+    모든 평가 작업을 먼저 제출한 뒤 결과를 모으므로, 워커 풀에서 병렬로 처리됩니다.
+
+    ``approximate=True``이면 `APPROXIMATE_WAIT` 안에 끝나지 않은 평가는 학습된
+    surrogate 모델의 근사 결과로 먼저 채우고(``'approximate'`` 표시), 진행 중인 작업을
+    ``sss.pending_evaluations``에 남겨 둡니다. 호출 측은 `refine_pending`으로 작업이 끝났는지
+    주기적으로 확인하고 다시 실행하여 캐시에 저장된 정확한 결과로 갱신합니다.
+
+    Parameters
+    ----------
+    sss : Any
+        Streamlit session state
+    system_names : List[str]
+        평가할 시스템 이름 목록
+    raise_errors : bool, default False
+        True이면 첫 번째 오류를 그대로 발생시킴
+    approximate : bool, default False
+        True이면 오래 걸리는 평가를 surrogate 근사 결과로 먼저 대체
+
+    Returns
+    -------
+    Dict[str, Union[Dict[str, float], Exception]]
+        시스템 이름별 계산 결과. ``raise_errors=False``인 경우 실패한 시스템은 예외 객체를 가짐
+
+    Notes
+    -----
+    결과는 ``sss.systems[name]['variables']``와 세션 결과 테이블
+    (`exergy_dashboard.results.get_result_table`)에 함께 저장됩니다.
+    """
+    from exergy_dashboard.scheduler import scheduler, SchedulerBusyError
+    from exergy_dashboard.results import get_result_table
 
-    # Get system mode and type
-    system = sss.systems[system_name]
     mode = sss.mode.upper()
-    system_type = system['type']
+    table = get_result_table(sss)
 
-    # Evaluate parameters using registered evaluator
-    variables = registry.evaluate(mode, system_type, params)
-    
-    # Store results in session state
-    sss.systems[system_name]['variables'] = variables
+    # 모든 작업을 먼저 제출
+    futures = {}
+    params_by_name = {}
+    for system_name in system_names:
+        system = sss.systems[system_name]
+        params = params_by_name[system_name] = collect_parameters(sss, system_name)
+        try:
+            futures[system_name] = scheduler.submit_evaluation(mode, system['type'], params)
+        except SchedulerBusyError as e:
+            futures[system_name] = e
 
-    return variables
+    if approximate:
+        from exergy_dashboard.surrogate import surrogates
 
+        _futures.wait(
+            [f for f in futures.values() if not isinstance(f, Exception)],
+            timeout=APPROXIMATE_WAIT,
+        )
+        if 'pending_evaluations' not in sss:
+            sss.pending_evaluations = {}
+
+    results = {}
+    deadline = time.monotonic() + scheduler.default_timeout
+    for system_name, future in futures.items():
+        system = sss.systems[system_name]
+        if approximate and not isinstance(future, Exception) and not future.done():
+            # 정확한 평가가 끝날 때까지 surrogate 근사 결과를 먼저 표시
+            estimate = surrogates.predict(mode, system['type'], params_by_name[system_name])
+            if estimate is not None:
+                system['variables'] = estimate
+                system['approximate'] = True
+                system.pop('error', None)
+                table.upsert(system_name, system['type'], estimate)
+                sss.pending_evaluations[system_name] = future
+                results[system_name] = estimate
+                continue
+        try:
+            if isinstance(future, Exception):
+                raise future
+            variables = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except (SchedulerBusyError, TimeoutError) as e:
+            # 과부하 시에는 직전 결과로 대체
+            if 'variables' in system:
+                system['degraded'] = True
+                results[system_name] = system['variables']
+                continue
+            if raise_errors:
+                raise
+            results[system_name] = e
+            continue
+        except Exception as e:
+            if raise_errors:
+                raise
+            results[system_name] = e
+            continue
+
+        # Store results in session state
+        system['variables'] = variables
+        system['degraded'] = False
+        system['approximate'] = False
+        system.pop('error', None)
+        system['evaluated_params'] = params_by_name[system_name]
+        table.upsert(system_name, system['type'], variables)
+        results[system_name] = variables
+
+    return results
+
+
+def refine_pending(sss: Any, timeout: float = REFINE_WAIT) -> bool:
+    """근사 결과를 표시 중인 시스템의 정확한 평가가 끝났는지 확인 (최대 `timeout`초 대기)
+
+    끝난 평가가 성공했으면 결과가 캐시에 있으므로, 호출 측이 다시 실행하면
+    `evaluate_systems`가 정확한 결과로 갱신합니다. 실패하거나 취소된 평가는 근사 표시를 지우고
+    ``'error'``를 남기며, 입력값이 바뀔 때까지 다시 제출하지 않습니다 (실패하는 평가를 반복해서
+    제출하지 않도록). 아직 끝나지 않은 평가는 근사 표시를 유지한 채 ``sss.pending_evaluations``에
+    다시 남기므로, 호출 측은 짧은 간격으로 다시 확인하면 됩니다.
+
+    Parameters
+    ----------
+    sss : Any
+        Streamlit session state
+    timeout : float, default REFINE_WAIT
+        최대 대기 시간 [s]. 스크립트 스레드를 오래 붙잡지 않도록 짧게 유지
+
+    Returns
+    -------
+    bool
+        다시 실행해야 하는지 여부 (끝난 평가가 있으면 True)
+    """
+    pending = sss.get('pending_evaluations')
+    if not pending:
+        return False
+    done, _ = _futures.wait(list(pending.values()), timeout=timeout, return_when=_futures.FIRST_COMPLETED)
+    sss.pending_evaluations = {name: f for name, f in pending.items() if f not in done}
+    if not done:
+        return False
+
+    for system_name, future in pending.items():
+        system = sss.systems.get(system_name)
+        if future not in done or system is None or not system.get('approximate'):
+            continue
+        if future.cancelled():
+            error = 'exact evaluation was cancelled'
+        elif future.exception() is not None:
+            error = str(future.exception()) or type(future.exception()).__name__
+        else:
+            continue
+        system['approximate'] = False
+        system['error'] = error
+        system['evaluated_params'] = collect_parameters(sss, system_name)
+    return True
+
+
+def stale_systems(sss: Any, system_names: List[str]) -> List[str]:
+    """다시 평가해야 하는 시스템 이름 목록
+
+    입력값이 마지막 정확한 평가 이후 바뀌었거나, 결과가 없거나, 근사/직전 결과를 표시 중인
+    시스템을 반환합니다. 나머지 시스템은 결과가 최신이므로 다시 제출하지 않습니다.
+
+    Parameters
+    ----------
+    sss : Any
+        Streamlit session state
+    system_names : List[str]
+        확인할 시스템 이름 목록
+
+    Returns
+    -------
+    List[str]
+        다시 평가할 시스템 이름 (입력 순서)
+    """
+    stale = []
+    for system_name in system_names:
+        system = sss.systems[system_name]
+        if (
+            'variables' not in system
+            or system.get('approximate')
+            or system.get('degraded')
+            or system.get('evaluated_params') != collect_parameters(sss, system_name)
+        ):
+            stale.append(system_name)
+    return stale
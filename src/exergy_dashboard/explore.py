@@ -0,0 +1,251 @@
+"""클라이언트 측 파라미터 탐색 모듈
+
+선택한 시스템 하나에 대해 2~3개 파라미터의 작은 격자에서 엑서지 효율과 주요 엑서지 소비
+항목(waterfall 정의의 X_c_*)을 미리 계산해 한 번만 전송하고, 브라우저에서 Vega-Lite
+param에 연결된 슬라이더로 격자점을 골라 표시합니다. 슬라이더를 움직여도 서버는 다시 실행되지
+않습니다(Streamlit 입력 위젯과 달리 왕복 통신, 재실행, 차트 재생성이 없음).
+
+- 격자 평가는 `exergy_dashboard.sweep.evaluate_grid`로 스케줄러 워커에서 실행
+- 계산한 격자는 sweep 격자와 같은 캐시(`sweep_cache`)에 시스템 구성 단위로 보관
+
+Examples
+--------
+>>> from exergy_dashboard.explore import compute_explore
+>>> grid = compute_explore('COOLING', 'Air source heat pump', params, ['T_0', 'T_a_room', 'T_a_int_out'], ['X_eff'])
+>>> grid.values.shape
+(9, 9, 9, 1)
+"""
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import streamlit as st
+
+from exergy_dashboard.chart import explore_step, plot_explore
+from exergy_dashboard.comparison import consumption_terms
+from exergy_dashboard.evaluation import collect_parameters
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.scheduler import EvaluationScheduler
+from exergy_dashboard.sweep import (
+    SweepCache,
+    evaluate_grid,
+    feasible_range,
+    round_significant,
+    sweep_cache,
+)
+from exergy_dashboard.system import get_systems
+from exergy_dashboard.visualization import VisualizationRegistry, registry as viz_registry
+
+
+# 축당 격자점 수 선택지와 기본값 (파라미터 3개, 15점이면 3,375개 격자점)
+EXPLORE_RESOLUTIONS = (5, 9, 15)
+DEFAULT_EXPLORE_RESOLUTION = 9
+
+# 탐색할 최대 파라미터 수
+MAX_EXPLORE_PARAMS = 3
+
+
+@dataclass(frozen=True, eq=False)
+class ExploreGrid:
+    """탐색 격자
+
+    Parameters
+    ----------
+    names : Tuple[str, ...]
+        파라미터 이름 (축 순서)
+    outputs : Tuple[str, ...]
+        출력 변수 이름
+    axes : Tuple[Tuple[float, float, int], ...]
+        축 정의 (하한, 상한, 점 수)
+    values : np.ndarray
+        (n_0, ..., n_{d-1}, len(outputs)) 출력 값. 평가할 수 없는 격자점은 NaN
+    """
+    names: Tuple[str, ...]
+    outputs: Tuple[str, ...]
+    axes: Tuple[Tuple[float, float, int], ...]
+    values: np.ndarray
+
+
+def compute_explore(
+    mode: str,
+    system_type: str,
+    params: Dict[str, float],
+    names: Sequence[str],
+    outputs: Sequence[str],
+    resolution: int = DEFAULT_EXPLORE_RESOLUTION,
+    cache: Optional[SweepCache] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> ExploreGrid:
+    """여러 파라미터의 격자에서 출력 변수들을 계산 (캐시 적중 시 평가하지 않음)
+
+    Parameters
+    ----------
+    mode : str
+        시스템 모드
+    system_type : str
+        시스템 타입
+    params : Dict[str, float]
+        기준 파라미터 값 (탐색하지 않는 파라미터는 이 값으로 고정)
+    names : Sequence[str]
+        탐색할 파라미터 이름
+    outputs : Sequence[str]
+        격자에 담을 출력 변수
+    resolution : int, default DEFAULT_EXPLORE_RESOLUTION
+        축당 격자점 수
+    cache : SweepCache, optional
+        격자 캐시 (기본값: 전역 sweep 캐시)
+    scheduler : EvaluationScheduler, optional
+        평가 스케줄러 (기본값: 전역 스케줄러)
+
+    Returns
+    -------
+    ExploreGrid
+        탐색 격자
+    """
+    mode = mode.upper()
+    cache = cache if cache is not None else sweep_cache
+    parameters = get_systems()[mode][system_type]['parameters']
+    names, outputs = tuple(names), tuple(outputs)
+    axes = tuple(explore_axis(parameters, params, name, resolution) for name in names)
+
+    key = cache.make_key(mode, system_type, params, names, outputs, axes)
+    grid = cache.get(key)
+    if grid is not None:
+        return grid
+
+    shape = tuple(n for _, _, n in axes)
+    index = np.indices(shape).reshape(len(axes), -1).T
+    points = np.column_stack([np.linspace(*axis)[index[:, j]] for j, axis in enumerate(axes)])
+    values, complete = evaluate_grid(mode, system_type, params, names, points, outputs, scheduler)
+
+    grid = ExploreGrid(names, outputs, axes, values.reshape(shape + (len(outputs),)))
+    if complete:
+        cache.put(key, grid)
+    return grid
+
+
+def explore_axis(
+    parameters: Dict[str, Dict[str, Any]],
+    params: Dict[str, float],
+    name: str,
+    resolution: int,
+) -> Tuple[float, float, int]:
+    """탐색 축 정의 (하한, 상한, 점 수)
+
+    허용 범위가 넓어도 다른 파라미터의 범위 식 때문에 실제로 가능한 구간은 좁을 수 있으므로,
+    다른 파라미터를 현재 값으로 고정했을 때 가능한 구간(`feasible_range`)을 `resolution`개
+    점으로 나눕니다. 현재 입력값이 격자점이 되도록 격자를 맞추므로 현재 운전점은 항상 표시됩니다.
+    """
+    low, high = feasible_range(parameters, params, name)
+    value = params.get(name)
+    if high <= low or resolution <= 1:
+        return (low, high, 1)
+    step = (high - low) / (resolution - 1)
+    if value is None or not low <= value <= high:
+        return (low, high, resolution)
+    below = int(np.floor((value - low) / step + 1e-9))
+    above = int(np.floor((high - value) / step + 1e-9))
+    return (float(value - below * step), float(value + above * step), below + above + 1)
+
+
+def explore_data(grid: ExploreGrid) -> Dict[str, np.ndarray]:
+    """탐색 격자를 차트 데이터로 변환 (축별 격자 인덱스 + 출력 변수, 값이 없는 격자점은 제외)
+
+    엑서지 효율('X_eff')은 % 단위로 바꿉니다.
+    """
+    shape = grid.values.shape[:-1]
+    values = grid.values.reshape(-1, len(grid.outputs))
+    index = np.indices(shape).reshape(len(shape), -1).T
+    keep = ~np.isnan(values).all(axis=1)
+    data: Dict[str, np.ndarray] = {f'i{j}': index[keep, j] for j in range(len(shape))}
+    for j, output in enumerate(grid.outputs):
+        column = values[keep, j] * (100.0 if output == 'X_eff' else 1.0)
+        data[output] = round_significant(column)
+    return data
+
+
+def snap(axis: Tuple[float, float, int], value: float) -> float:
+    """값을 축에서 가장 가까운 격자점으로 맞춤"""
+    low, high, n = axis
+    step = explore_step(axis)
+    i = int(np.clip(round((value - low) / step), 0, n - 1))
+    return float(low + i * step)
+
+
+# ----------------------------------------------------------------------
+# 시각화
+# ----------------------------------------------------------------------
+def explore_settings(session_state: Any, selected_systems: List[str], mode: str) -> Dict[str, Any]:
+    """session state의 탐색 설정('explore:{mode}:*')을 읽고 유효하지 않은 값은 기본값으로 바꿈"""
+    def get(field, default=None):
+        return session_state.get(f'explore:{mode}:{field}', default)
+
+    system = get('system')
+    if system not in selected_systems:
+        system = selected_systems[0]
+    names = list(session_state.systems[system]['parameters'])
+    chosen = [name for name in get('params') or () if name in names][:MAX_EXPLORE_PARAMS]
+    if not chosen:
+        chosen = names[:MAX_EXPLORE_PARAMS]
+    resolution = get('resolution')
+    if resolution not in EXPLORE_RESOLUTIONS:
+        resolution = DEFAULT_EXPLORE_RESOLUTION
+    return {'system': system, 'params': chosen, 'resolution': resolution}
+
+
+def explore_controls(session_state: Any, selected_systems: List[str], mode: str) -> None:
+    """탐색 설정 위젯 표시 (값은 session state의 'explore:{mode}:*'에 저장)"""
+    settings = explore_settings(session_state, selected_systems, mode)
+    # 선택한 시스템이 바뀌어 없어진 값은 위젯을 만들기 전에 바로잡음
+    for field in ('system', 'params', 'resolution'):
+        session_state[f'explore:{mode}:{field}'] = settings[field]
+    parameters = session_state.systems[settings['system']]['parameters']
+
+    def describe(name):
+        return f"{parameters[name]['explanation']['EN'].capitalize()} ({name})"
+
+    system_col, params_col, resolution_col = st.columns([1, 2, 1], vertical_alignment='bottom')
+    system_col.selectbox('System', selected_systems, key=f'explore:{mode}:system')
+    params_col.multiselect(
+        'Parameters', list(parameters), format_func=describe,
+        max_selections=MAX_EXPLORE_PARAMS, key=f'explore:{mode}:params',
+    )
+    resolution_col.select_slider(
+        'Grid points per parameter', EXPLORE_RESOLUTIONS, key=f'explore:{mode}:resolution',
+    )
+    st.caption('Move the sliders below the chart to explore without recalculating.')
+
+
+def plot_explore_view(session_state: Any, selected_systems: List[str], mode: str) -> Dict[str, Any]:
+    """선택한 시스템의 클라이언트 측 파라미터 탐색 차트 생성"""
+    settings = explore_settings(session_state, selected_systems, mode)
+    name = settings['system']
+    system = session_state.systems[name]
+    parameters = system['parameters']
+    params = {
+        key: parameter.get('value', parameter['default']) for key, parameter in parameters.items()
+    }
+    params.update(collect_parameters(session_state, name))
+
+    table = get_result_table(session_state, [name])
+    terms = tuple(consumption_terms(table, [name], mode)) if name in table else ()
+    grid = compute_explore(
+        mode, system['type'], params, settings['params'], ('X_eff',) + terms, settings['resolution'],
+    )
+    titles = tuple(
+        f"{parameters[key]['explanation']['EN'].capitalize()} [{parameters[key]['unit']}]"
+        for key in grid.names
+    )
+    values = tuple(snap(axis, params[key]) for axis, key in zip(grid.axes, grid.names))
+    return plot_explore(explore_data(grid), grid.axes, titles, terms, values)
+
+
+def register_explore_views(mode: str, registry: Optional[VisualizationRegistry] = None) -> None:
+    """모드에 클라이언트 측 파라미터 탐색 시각화를 등록 (모든 모드에 공통)"""
+    registry = registry or viz_registry
+    registry.register(
+        mode, 'Explore parameters (in browser)', cacheable=False,
+        controls=functools.partial(explore_controls, mode=mode),
+    )(functools.partial(plot_explore_view, mode=mode))
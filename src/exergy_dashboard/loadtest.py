@@ -0,0 +1,661 @@
+"""동시 세션 부하 테스트 모듈
+
+replica 하나가 감당할 수 있는 동시 사용자 수를 정하기 위해, 실행 중인 Streamlit 서버에 브라우저
+대신 헤드리스 websocket 클라이언트 N개를 연결하고 실제 사용 흐름을 동시에 실행합니다.
+
+- 세션 흐름: 첫 화면 로딩 -> 모드 선택 -> 시스템 추가(타입 선택, 'Add to List') -> 표시할 시스템
+  선택 -> 파라미터 수정과 시각화 탭 전환을 섞어서 반복. 동작 사이에는 사용자의 생각 시간(think time)
+- 재실행 지연 시간: 위젯 조작을 보낸 뒤 스크립트(또는 fragment) 실행이 끝날 때까지의 시간 [s].
+  `st.rerun()`으로 이어지는 실행까지 포함하며 동작별 p50/p95/p99를 보고
+- 처리량: 초당 완료된 재실행 수
+- 세션당 메모리: 서버 메트릭(`exergy_session_memory_bytes`, 프로세스 RSS)의 증가량을 세션 수로 나눈 값.
+  모든 세션이 흐름을 마친 뒤 연결을 유지한 상태에서 측정
+
+클라이언트는 브라우저와 같은 프로토콜(BackMsg/ForwardMsg protobuf)로 통신하며, 모든 위젯의 현재
+값을 함께 보내고 위젯이 속한 fragment만 다시 실행하도록 요청합니다. 따라서 서버 측 세션 관리,
+fragment 재실행, 메시지 직렬화와 전송 비용이 모두 측정에 포함됩니다. `streamlit.testing.v1.AppTest`는
+실행할 때마다 전역 런타임 상태를 바꾸므로 여러 세션을 동시에 실행하는 데 사용할 수 없습니다.
+
+실행 방법
+--------
+- 서버를 직접 시작하여 측정 (warm-up이 끝난 뒤 시작)::
+
+    python -m exergy_dashboard.loadtest --start app.py --sessions 20
+
+- 실행 중인 서버 측정::
+
+    python -m exergy_dashboard.loadtest --url http://127.0.0.1:8501 \\
+        --metrics-url http://127.0.0.1:9464/metrics --sessions 50 --ramp 30
+
+Examples
+--------
+>>> from exergy_dashboard.loadtest import LoadProfile, run_load_test
+>>> result = asyncio.run(run_load_test('http://127.0.0.1:8501', 10, LoadProfile(think=0.5)))
+>>> result['actions']['edit']['p95']
+0.183
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlsplit
+
+import numpy as np
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.NumberInput_pb2 import NumberInput
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+from tornado.httpclient import AsyncHTTPClient
+from tornado.websocket import websocket_connect
+
+
+# 재실행 하나를 기다리는 기본 시간 [s]
+DEFAULT_RERUN_TIMEOUT = 60.0
+
+# 보고하는 지연 시간 백분위수
+PERCENTILES = (50, 95, 99)
+
+# 서버 메트릭에서 읽는 항목
+MEMORY_METRICS = ('exergy_active_sessions', 'exergy_session_memory_bytes', 'exergy_process_resident_memory_bytes')
+
+# 재실행이 정상적으로 끝났음을 나타내는 종료 상태
+_SUCCESS = (
+    ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY,
+    ForwardMsg.ScriptFinishedStatus.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+)
+
+# 사용자 key로 만든 위젯 ID의 접두사 ('$$ID-{hash}-{key}')
+_KEYED_ID_PREFIX = '$$ID-'
+
+
+@dataclass
+class LoadProfile:
+    """세션 하나가 실행하는 사용 흐름
+
+    Parameters
+    ----------
+    systems : int, default 3
+        추가할 시스템 수
+    edits : int, default 6
+        파라미터 수정 횟수
+    tabs : int, default 3
+        시각화 탭 전환 횟수
+    think : float, default 1.0
+        동작 사이의 평균 생각 시간 [s] (0.5~1.5배에서 무작위)
+    """
+    systems: int = 3
+    edits: int = 6
+    tabs: int = 3
+    think: float = 1.0
+
+
+class RerunError(RuntimeError):
+    """재실행이 실패하거나 시간 안에 끝나지 않았을 때 발생하는 예외"""
+
+
+class _Widget:
+    __slots__ = ('id', 'kind', 'proto', 'fragment_id')
+
+    def __init__(self, id, kind, proto, fragment_id):
+        self.id = id
+        self.kind = kind
+        self.proto = proto
+        self.fragment_id = fragment_id
+
+    @property
+    def key(self) -> Optional[str]:
+        """사용자가 지정한 위젯 key (없으면 None)"""
+        if not self.id.startswith(_KEYED_ID_PREFIX):
+            return None
+        return self.id[len(_KEYED_ID_PREFIX):].split('-', 1)[1]
+
+
+class SessionClient:
+    """브라우저 대신 Streamlit 서버에 연결하는 헤드리스 세션
+
+    받은 ForwardMsg에서 위젯을 모아 두고, 위젯을 조작하면 브라우저처럼 모든 위젯의 현재 값과
+    함께 재실행을 요청합니다.
+
+    Parameters
+    ----------
+    url : str
+        서버 주소 (예: 'http://127.0.0.1:8501')
+    timeout : float, default DEFAULT_RERUN_TIMEOUT
+        재실행 하나를 기다리는 시간 [s]
+    """
+
+    def __init__(self, url: str, timeout: float = DEFAULT_RERUN_TIMEOUT):
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+        self.widgets: Dict[str, _Widget] = {}
+        self.errors = 0
+        self.query_string = ''
+        self._values: Dict[str, WidgetState] = {}
+        self._messages: Dict[str, ForwardMsg] = {}
+        self._seen: set = set()
+        self._fragment_run = False
+        self._conn = None
+
+    async def connect(self) -> float:
+        """연결하고 첫 화면을 불러옴
+
+        Returns
+        -------
+        float
+            첫 실행이 끝날 때까지 걸린 시간 [s]
+        """
+        parts = urlsplit(self.url)
+        scheme = 'wss' if parts.scheme == 'https' else 'ws'
+        self._conn = await websocket_connect(
+            f'{scheme}://{parts.netloc}{parts.path}/_stcore/stream', subprotocols=['streamlit'],
+        )
+        return await self.rerun()
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # 위젯 조작
+    # ------------------------------------------------------------------
+    def find(self, key: Optional[str] = None, label: Optional[str] = None, kind: Optional[str] = None) -> Optional[_Widget]:
+        """key, 라벨, 종류가 일치하는 첫 위젯"""
+        for widget in self.widgets.values():
+            if key is not None and widget.key != key:
+                continue
+            if label is not None and getattr(widget.proto, 'label', None) != label:
+                continue
+            if kind is not None and widget.kind != kind:
+                continue
+            return widget
+        return None
+
+    def value(self, widget: _Widget) -> Any:
+        """위젯의 현재 값 (WidgetState에 담긴 값)"""
+        state = self._values.get(widget.id)
+        if state is None or state.WhichOneof('value') is None:
+            return None
+        value = getattr(state, state.WhichOneof('value'))
+        return list(value.data) if hasattr(value, 'data') else value
+
+    async def click(self, widget: _Widget) -> float:
+        """버튼 클릭"""
+        state = WidgetState(id=widget.id, trigger_value=True)
+        return await self.rerun(state, widget.fragment_id)
+
+    async def select(self, widget: _Widget, index: int) -> float:
+        """selectbox/radio 선택 (옵션 인덱스)"""
+        return await self._set(widget, WidgetState(id=widget.id, int_value=index))
+
+    async def select_many(self, widget: _Widget, indices: List[int]) -> float:
+        """multiselect/segmented control 선택 (옵션 인덱스 목록)"""
+        state = WidgetState(id=widget.id)
+        state.int_array_value.data[:] = indices
+        return await self._set(widget, state)
+
+    async def set_number(self, widget: _Widget, value: float) -> float:
+        """number_input 값 입력"""
+        return await self._set(widget, WidgetState(id=widget.id, double_value=float(value)))
+
+    async def _set(self, widget: _Widget, state: WidgetState) -> float:
+        self._values[widget.id] = state
+        return await self.rerun(fragment_id=widget.fragment_id)
+
+    # ------------------------------------------------------------------
+    # 재실행
+    # ------------------------------------------------------------------
+    async def rerun(self, trigger: Optional[WidgetState] = None, fragment_id: str = '') -> float:
+        """재실행을 요청하고 끝날 때까지 기다림 (`st.rerun()`으로 이어지는 실행 포함)
+
+        Returns
+        -------
+        float
+            걸린 시간 [s]
+
+        Raises
+        ------
+        RerunError
+            연결이 끊겼거나, 컴파일 오류가 났거나, 시간 안에 끝나지 않은 경우
+        """
+        msg = BackMsg()
+        msg.rerun_script.query_string = self.query_string
+        msg.rerun_script.fragment_id = fragment_id
+        states = [s for widget_id, s in self._values.items() if trigger is None or widget_id != trigger.id]
+        if trigger is not None:
+            states.append(trigger)
+        msg.rerun_script.widget_states.widgets.extend(states)
+
+        start = time.perf_counter()
+        await self._conn.write_message(msg.SerializeToString(), binary=True)
+        deadline = start + self.timeout
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                raise RerunError('Rerun timed out')
+            try:
+                payload = await asyncio.wait_for(self._conn.read_message(), remaining)
+            except asyncio.TimeoutError:
+                raise RerunError('Rerun timed out') from None
+            if payload is None:
+                raise RerunError('Connection closed')
+            forward = ForwardMsg()
+            forward.ParseFromString(payload)
+            status = await self._handle(forward)
+            if status is None:
+                continue
+            if status in _SUCCESS:
+                return time.perf_counter() - start
+            if status == ForwardMsg.ScriptFinishedStatus.FINISHED_WITH_COMPILE_ERROR:
+                raise RerunError('Script compile error')
+
+    async def _handle(self, msg: ForwardMsg) -> Optional[int]:
+        """ForwardMsg 하나를 처리하고, 실행이 끝났으면 종료 상태를 반환"""
+        kind = msg.WhichOneof('type')
+        if kind == 'ref_hash':
+            cached = self._messages.get(msg.ref_hash) or await self._fetch(msg.ref_hash)
+            cached = ForwardMsg.FromString(cached.SerializeToString())
+            cached.metadata.CopyFrom(msg.metadata)
+            return await self._handle(cached)
+        if msg.metadata.cacheable and msg.hash:
+            self._messages[msg.hash] = msg
+
+        if kind == 'new_session':
+            self._seen = set()
+            self._fragment_run = bool(msg.new_session.fragment_ids_this_run)
+        elif kind == 'page_info_changed':
+            self.query_string = msg.page_info_changed.query_string
+        elif kind == 'delta' and msg.delta.WhichOneof('type') == 'new_element':
+            self._add_element(msg.delta.new_element, msg.delta.fragment_id)
+        elif kind == 'script_finished':
+            status = msg.script_finished
+            if status == ForwardMsg.ScriptFinishedStatus.FINISHED_SUCCESSFULLY and not self._fragment_run:
+                # 전체 실행에서 그려지지 않은 위젯은 브라우저에서도 사라짐
+                for widget_id in set(self.widgets) - self._seen:
+                    del self.widgets[widget_id]
+                    self._values.pop(widget_id, None)
+            return status
+        return None
+
+    def _add_element(self, element: Any, fragment_id: str) -> None:
+        kind = element.WhichOneof('type')
+        if kind == 'exception':
+            self.errors += 1
+            return
+        proto = getattr(element, kind)
+        widget_id = getattr(proto, 'id', '')
+        if not widget_id or kind in ('download_button', 'file_uploader'):
+            return
+        self.widgets[widget_id] = _Widget(widget_id, kind, proto, fragment_id)
+        self._seen.add(widget_id)
+        state = _initial_state(kind, proto)
+        if state is not None and (widget_id not in self._values or getattr(proto, 'set_value', False)):
+            self._values[widget_id] = state
+
+    async def _fetch(self, ref_hash: str) -> ForwardMsg:
+        response = await AsyncHTTPClient().fetch(f'{self.url}/_stcore/message?hash={ref_hash}')
+        msg = ForwardMsg.FromString(response.body)
+        self._messages[ref_hash] = msg
+        return msg
+
+
+def _initial_state(kind: str, proto: Any) -> Optional[WidgetState]:
+    """서버가 보낸 위젯의 현재 값 (`set_value`이면 서버가 지정한 값, 아니면 기본값)"""
+    state = WidgetState(id=proto.id)
+    if kind == 'number_input':
+        state.double_value = proto.value if proto.set_value else proto.default
+    elif kind in ('selectbox', 'radio'):
+        field = 'value' if proto.set_value else 'default'
+        if not proto.HasField(field):
+            return None
+        state.int_value = getattr(proto, field)
+    elif kind in ('multiselect', 'button_group'):
+        state.int_array_value.data[:] = list(proto.value if proto.set_value else proto.default)
+    elif kind == 'checkbox':
+        state.bool_value = proto.value if proto.set_value else proto.default
+    else:
+        return None
+    return state
+
+
+# ----------------------------------------------------------------------
+# 사용 흐름
+# ----------------------------------------------------------------------
+class _Recorder:
+    """동작별 지연 시간과 세션 결과를 모음"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.completed = 0
+        self.failed: List[str] = []
+        self.errors = 0
+
+    def record(self, action: str, seconds: float) -> None:
+        self.latencies.setdefault(action, []).append(seconds)
+
+
+async def run_session(
+    url: str,
+    profile: LoadProfile,
+    rng: random.Random,
+    recorder: _Recorder,
+    timeout: float = DEFAULT_RERUN_TIMEOUT,
+) -> Optional[SessionClient]:
+    """세션 하나의 사용 흐름을 실행 (연결은 유지한 채 반환, 실패하면 None)"""
+    client = SessionClient(url, timeout)
+
+    async def think():
+        await asyncio.sleep(profile.think * rng.uniform(0.5, 1.5))
+
+    try:
+        recorder.record('load', await client.connect())
+        await think()
+
+        # 모드 선택
+        mode = client.find(key='mode_segmented_control')
+        if mode is None:
+            raise RerunError('Mode selector not found')
+        mode_index = rng.randrange(len(mode.proto.options))
+        recorder.record('mode', await client.select_many(mode, [mode_index]))
+        await think()
+
+        # 시스템 추가
+        for _ in range(profile.systems):
+            system_type = client.find(label='System type', kind='selectbox')
+            index = rng.randrange(len(system_type.proto.options))
+            if client.value(system_type) != index:
+                recorder.record('select', await client.select(system_type, index))
+                await think()
+            recorder.record('add', await client.click(client.find(label='Add to List', kind='button')))
+            await think()
+
+        # 추가한 시스템을 모두 표시
+        display = client.find(key='selected_options')
+        if display is not None:
+            recorder.record('display', await client.select_many(display, list(range(len(display.proto.options)))))
+            await think()
+
+        # 파라미터 수정과 시각화 탭 전환
+        actions = ['edit'] * profile.edits + ['tab'] * profile.tabs
+        rng.shuffle(actions)
+        tab_key = f'visualization_tab:{mode.proto.options[mode_index].content.upper()}'
+        for action in actions:
+            if action == 'edit':
+                inputs = [w for w in client.widgets.values() if w.kind == 'number_input' and w.key
+                          and ':' in w.key and not w.key.startswith('visualization_page:')]
+                if not inputs:
+                    continue
+                widget = rng.choice(inputs)
+                recorder.record('edit', await client.set_number(widget, _next_value(widget, client.value(widget), rng)))
+            else:
+                tabs = client.find(key=tab_key)
+                if tabs is None:
+                    continue
+                recorder.record('tab', await client.select_many(tabs, [rng.randrange(len(tabs.proto.options))]))
+            await think()
+    except Exception as e:
+        recorder.failed.append(f'{type(e).__name__}: {e}')
+        recorder.errors += client.errors
+        await client.close()
+        return None
+
+    recorder.completed += 1
+    recorder.errors += client.errors
+    return client
+
+
+def _next_value(widget: _Widget, value: Optional[float], rng: random.Random) -> float:
+    """현재 값에서 1~5 step 움직인 값 (입력 범위 안)"""
+    proto = widget.proto
+    step = proto.step or 1.0
+    value = proto.default if value is None else value
+    value += rng.choice([-1, 1]) * rng.randint(1, 5) * step
+    if proto.has_min:
+        value = max(value, proto.min)
+    if proto.has_max:
+        value = min(value, proto.max)
+    return round(value / step) * step if proto.data_type == NumberInput.INT else round(value, 10)
+
+
+# ----------------------------------------------------------------------
+# 부하 테스트
+# ----------------------------------------------------------------------
+def scrape_metrics(metrics_url: Optional[str]) -> Dict[str, float]:
+    """서버 메트릭 중 라벨 없는 값 (`MEMORY_METRICS`)을 읽음 (읽을 수 없으면 빈 dict)"""
+    if not metrics_url:
+        return {}
+    try:
+        with urllib.request.urlopen(metrics_url, timeout=5) as response:
+            text = response.read().decode('utf-8')
+    except (OSError, urllib.error.URLError):
+        return {}
+    values = {}
+    for line in text.splitlines():
+        name, _, value = line.partition(' ')
+        if name in MEMORY_METRICS:
+            values[name] = float(value)
+    return values
+
+
+def summarize(latencies: List[float]) -> Dict[str, float]:
+    """지연 시간 목록의 개수, 평균, 백분위수, 최댓값 [s]"""
+    if not latencies:
+        return {'count': 0}
+    values = np.asarray(latencies)
+    summary = {'count': len(values), 'mean': float(values.mean())}
+    for p in PERCENTILES:
+        summary[f'p{p}'] = float(np.percentile(values, p))
+    summary['max'] = float(values.max())
+    return summary
+
+
+async def run_load_test(
+    url: str,
+    sessions: int,
+    profile: Optional[LoadProfile] = None,
+    ramp: float = 0.0,
+    metrics_url: Optional[str] = None,
+    seed: int = 0,
+    timeout: float = DEFAULT_RERUN_TIMEOUT,
+) -> Dict[str, Any]:
+    """N개 세션을 동시에 실행하고 결과를 요약
+
+    Parameters
+    ----------
+    url : str
+        Streamlit 서버 주소
+    sessions : int
+        동시 세션 수
+    profile : LoadProfile, optional
+        세션 하나의 사용 흐름 (기본값: `LoadProfile()`)
+    ramp : float, default 0.0
+        세션 시작을 고르게 나누는 시간 [s]
+    metrics_url : str, optional
+        서버 메트릭 주소 (세션당 메모리 측정용)
+    seed : int, default 0
+        세션 흐름의 난수 시드
+
+    Returns
+    -------
+    Dict[str, Any]
+        'sessions', 'completed', 'failed', 'errors', 'wall_seconds', 'reruns',
+        'throughput'(재실행/초), 'actions'(동작별 `summarize`, 전체는 'all'), 'memory'
+    """
+    profile = profile or LoadProfile()
+    recorder = _Recorder()
+    before = scrape_metrics(metrics_url)
+
+    async def start(i):
+        await asyncio.sleep(ramp * i / max(sessions, 1))
+        return await run_session(url, profile, random.Random(seed * 100003 + i), recorder, timeout)
+
+    started = time.perf_counter()
+    clients = await asyncio.gather(*(start(i) for i in range(sessions)))
+    wall = time.perf_counter() - started
+
+    # 모든 세션이 연결된 상태에서 메모리 측정
+    after = scrape_metrics(metrics_url)
+    for client in clients:
+        if client is not None:
+            await client.close()
+
+    connected = max(recorder.completed, 1)
+    memory = {}
+    if 'exergy_session_memory_bytes' in after:
+        memory['session_bytes'] = (
+            after['exergy_session_memory_bytes'] - before.get('exergy_session_memory_bytes', 0.0)
+        ) / connected
+    if 'exergy_process_resident_memory_bytes' in after and 'exergy_process_resident_memory_bytes' in before:
+        memory['rss_bytes'] = (
+            after['exergy_process_resident_memory_bytes'] - before['exergy_process_resident_memory_bytes']
+        ) / connected
+    if 'exergy_active_sessions' in after:
+        memory['server_sessions'] = after['exergy_active_sessions']
+
+    actions = {name: summarize(values) for name, values in recorder.latencies.items()}
+    actions['all'] = summarize([v for values in recorder.latencies.values() for v in values])
+    reruns = actions['all']['count']
+    return {
+        'sessions': sessions,
+        'completed': recorder.completed,
+        'failed': recorder.failed,
+        'errors': recorder.errors,
+        'wall_seconds': wall,
+        'reruns': reruns,
+        'throughput': reruns / wall if wall > 0 else 0.0,
+        'actions': actions,
+        'memory': memory,
+        'profile': asdict(profile),
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """결과를 표 형식의 문자열로 변환"""
+    lines = [
+        f"sessions {result['sessions']} (completed {result['completed']}, failed {len(result['failed'])}), "
+        f"wall {result['wall_seconds']:.1f} s, reruns {result['reruns']}, "
+        f"throughput {result['throughput']:.2f} reruns/s, app exceptions {result['errors']}",
+        '',
+        f"{'action':<10} {'count':>6} {'mean [s]':>9} "
+        + ' '.join(f'{f"p{p} [s]":>9}' for p in PERCENTILES) + f" {'max [s]':>9}",
+    ]
+    for name, summary in result['actions'].items():
+        if not summary['count']:
+            continue
+        lines.append(
+            f"{name:<10} {summary['count']:>6} {summary['mean']:>9.3f} "
+            + ' '.join(f"{summary[f'p{p}']:>9.3f}" for p in PERCENTILES) + f" {summary['max']:>9.3f}"
+        )
+    memory = result['memory']
+    if memory:
+        lines.append('')
+        parts = []
+        if 'session_bytes' in memory:
+            parts.append(f"session state {memory['session_bytes'] / 2**20:.2f} MB")
+        if 'rss_bytes' in memory:
+            parts.append(f"process RSS {memory['rss_bytes'] / 2**20:+.2f} MB")
+        lines.append('memory per session: ' + ', '.join(parts))
+    for message in sorted(set(result['failed'])):
+        lines.append(f'failed: {message} (x{result["failed"].count(message)})')
+    return '\n'.join(lines)
+
+
+# ----------------------------------------------------------------------
+# 서버 시작
+# ----------------------------------------------------------------------
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_server(script: str, port: int, metrics_port: int, ready_timeout: float = 300.0) -> subprocess.Popen:
+    """warm-up 실행기(`exergy_dashboard.warmup`)로 서버를 시작하고 준비될 때까지 기다림
+
+    Raises
+    ------
+    RuntimeError
+        서버가 종료되었거나, warm-up이 오류로 끝났거나, `ready_timeout` 안에 준비되지 않은 경우
+    """
+    env = dict(os.environ, EXERGY_METRICS_PORT=str(metrics_port), EXERGY_METRICS_HOST='127.0.0.1')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'exergy_dashboard.warmup', script,
+         '--server.port', str(port), '--server.headless', 'true',
+         '--browser.gatherUsageStats', 'false'],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + ready_timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with code {process.returncode}')
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{metrics_port}/ready', timeout=2).close()
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/_stcore/health', timeout=2).close()
+            return process
+        except urllib.error.HTTPError as e:
+            # warm-up이 오류로 끝났으면(degraded/failed) 더 기다려도 준비되지 않음
+            body = e.read().decode('utf-8', 'replace').strip()
+            if 'degraded' in body or 'failed' in body:
+                process.terminate()
+                raise RuntimeError(f'Server warm-up did not succeed: {body}') from None
+            time.sleep(0.5)
+        except (OSError, urllib.error.URLError):
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError('Server did not become ready in time')
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """부하 테스트를 실행하고 결과를 출력"""
+    parser = argparse.ArgumentParser(description='Simulate concurrent dashboard sessions and report rerun latency.')
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument('--url', default='http://127.0.0.1:8501', help='running Streamlit server')
+    target.add_argument('--start', metavar='APP', help='start a local server for this app script and measure it')
+    parser.add_argument('--metrics-url', help='server metrics endpoint (default: http://127.0.0.1:9464/metrics)')
+    parser.add_argument('--sessions', type=int, default=10, help='concurrent sessions')
+    parser.add_argument('--ramp', type=float, default=5.0, help='seconds over which sessions start')
+    parser.add_argument('--systems', type=int, default=LoadProfile.systems, help='systems added per session')
+    parser.add_argument('--edits', type=int, default=LoadProfile.edits, help='parameter edits per session')
+    parser.add_argument('--tabs', type=int, default=LoadProfile.tabs, help='visualization tab changes per session')
+    parser.add_argument('--think', type=float, default=LoadProfile.think, help='mean think time between actions [s]')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_RERUN_TIMEOUT, help='timeout per rerun [s]')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', metavar='PATH', help='also write the result as JSON')
+    args = parser.parse_args(argv)
+
+    profile = LoadProfile(args.systems, args.edits, args.tabs, args.think)
+    server = None
+    url, metrics_url = args.url, args.metrics_url or 'http://127.0.0.1:9464/metrics'
+    if args.start:
+        port, metrics_port = _free_port(), _free_port()
+        print(f'Starting {args.start} on port {port} and waiting for warm-up...')
+        server = start_server(args.start, port, metrics_port)
+        url, metrics_url = f'http://127.0.0.1:{port}', f'http://127.0.0.1:{metrics_port}/metrics'
+
+    try:
+        result = asyncio.run(run_load_test(
+            url, args.sessions, profile, args.ramp, metrics_url, args.seed, args.timeout,
+        ))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    print(format_report(result))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=1)
+
+
+if __name__ == '__main__':
+    main()
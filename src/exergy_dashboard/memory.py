@@ -0,0 +1,288 @@
+"""세션별 메모리 사용량 측정 및 예산 관리 모듈
+
+세션마다 평가 결과(`systems[...]['variables']`, 결과 테이블), 입력 위젯 값, 보고서 등을 메모리에
+보관하므로 동시 사용자가 늘면 프로세스 메모리가 계속 커집니다. 이 모듈은 세션별 사용량을
+측정하고, 예산을 넘으면 유휴 세션의 평가 결과부터 해제합니다.
+
+- 세션 예산(`SESSION_BUDGET`): 초과한 세션은 유휴 상태가 되면 결과를 해제
+- 프로세스 예산(`PROCESS_BUDGET`): 전체 세션 사용량 합이 초과하면 가장 오래 활동하지 않은
+  유휴 세션부터 결과를 해제
+- 해제하는 것은 평가 결과뿐이며 시스템 구성과 입력값은 유지. 사용자가 돌아오면 결과가 없는
+  시스템이 `stale_systems`에 포함되어 한 번의 배치로 다시 계산됨 (평가 캐시에 남아 있으면 즉시)
+- 예산은 환경 변수 `EXERGY_SESSION_BUDGET_MB`, `EXERGY_PROCESS_BUDGET_MB`로 설정
+
+Examples
+--------
+>>> from exergy_dashboard.memory import memory_monitor
+>>> memory_monitor.record(st.session_state)   # 실행이 끝날 때 사용량 측정 + 예산 적용
+{'results': 48213, 'inputs': 9120, 'report': 0, 'other': 20511}
+>>> memory_monitor.stats()['sessions']
+3
+"""
+
+import os
+import sys
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from exergy_dashboard.scheduler import current_session_id
+
+
+def _env_megabytes(name: str, default: float) -> int:
+    return int(float(os.environ.get(name, default)) * 2**20)
+
+
+# 세션별 메모리 예산 (bytes)
+SESSION_BUDGET = _env_megabytes('EXERGY_SESSION_BUDGET_MB', 32)
+
+# 프로세스 전체(모든 세션 사용량의 합) 메모리 예산 (bytes)
+PROCESS_BUDGET = _env_megabytes('EXERGY_PROCESS_BUDGET_MB', 512)
+
+# 이 시간(초) 이상 활동이 없는 세션만 결과를 해제
+IDLE_SECONDS = 120.0
+
+# 시스템 딕셔너리에서 해제하는 평가 결과 항목
+RESULT_KEYS = ('variables', 'approximate', 'degraded', 'error', 'evaluated_params')
+
+# 세션 상태에서 해제하는 다시 만들 수 있는 항목
+RELEASABLE_KEYS = ('report', 'pending_evaluations')
+
+
+def deep_sizeof(obj: Any, seen: Optional[set] = None) -> int:
+    """객체와 객체가 담은 값의 대략적인 메모리 크기 (bytes)
+
+    dict/list/tuple/set은 원소까지, numpy 배열은 데이터 크기까지, 이 패키지의 객체는 속성까지
+    재귀적으로 더합니다. 그 밖의 객체는 `sys.getsizeof`만 셉니다. 공유된 객체는 한 번만 셉니다.
+    """
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return sys.getsizeof(obj) + (obj.nbytes if obj.base is not None else 0)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(v, seen) for v in obj)
+    elif type(obj).__module__.startswith('exergy_dashboard.') and hasattr(obj, '__dict__'):
+        size += deep_sizeof(vars(obj), seen)
+    return size
+
+
+def session_footprint(session_state: Any) -> Dict[str, int]:
+    """세션 상태의 항목별 메모리 사용량 (bytes)
+
+    Returns
+    -------
+    Dict[str, int]
+        'results': 평가 결과와 결과 테이블, 'inputs': 파라미터 입력값('{system}:{param}',
+        'draft:...'), 'report': 보고서, 'other': 나머지
+    """
+    footprint = {'results': 0, 'inputs': 0, 'report': 0, 'other': 0}
+    seen: set = set()
+    items = _state_items(session_state)
+    systems = items.get('systems', {})
+    for key, value in items.items():
+        if key == 'systems':
+            for system in list(value.values()):
+                for field, item in list(system.items()):
+                    category = 'results' if field in RESULT_KEYS else 'other'
+                    footprint[category] += deep_sizeof(item, seen)
+        elif key == 'result_table':
+            footprint['results'] += deep_sizeof(value, seen)
+        elif key == 'report':
+            footprint['report'] += deep_sizeof(value, seen)
+        elif isinstance(key, str) and key.removeprefix('draft:').rsplit(':', 1)[0] in systems:
+            footprint['inputs'] += deep_sizeof(value, seen)
+        else:
+            footprint['other'] += deep_sizeof(value, seen)
+    return footprint
+
+
+def release_results(session_state: Any) -> None:
+    """세션의 평가 결과와 다시 만들 수 있는 항목을 해제 (시스템 구성과 입력값은 유지)
+
+    다른 스레드에서 진행 중인 반복과 충돌하지 않도록 딕셔너리를 수정하지 않고 교체합니다.
+    """
+    from exergy_dashboard.results import ResultTable
+
+    systems = session_state['systems'] if 'systems' in session_state else None
+    if systems:
+        for name, system in list(systems.items()):
+            systems[name] = {k: v for k, v in system.items() if k not in RESULT_KEYS}
+    if 'result_table' in session_state:
+        session_state['result_table'] = ResultTable()
+    for key in RELEASABLE_KEYS:
+        if key in session_state:
+            del session_state[key]
+    session_state['results_released'] = True
+
+
+def process_rss() -> Optional[int]:
+    """현재 프로세스의 상주 메모리(RSS) 크기 (bytes, 알 수 없으면 None)"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class _SessionEntry:
+    __slots__ = ('state', 'last_active', 'size', 'released')
+
+    def __init__(self, state):
+        self.state = state
+        self.last_active = time.monotonic()
+        self.size = 0
+        self.released = False
+
+
+class MemoryMonitor:
+    """세션별 메모리 사용량을 기록하고 예산을 적용
+
+    세션 상태는 약한 참조(weakref)로 보관하므로, Streamlit이 연결이 끊긴 세션을 정리하면
+    기록에서도 사라집니다.
+
+    Parameters
+    ----------
+    session_budget : int, default SESSION_BUDGET
+        세션별 예산 (bytes)
+    process_budget : int, default PROCESS_BUDGET
+        모든 세션 사용량 합의 예산 (bytes)
+    idle_seconds : float, default IDLE_SECONDS
+        결과를 해제할 수 있는 최소 유휴 시간 (초)
+    """
+
+    def __init__(
+        self,
+        session_budget: int = SESSION_BUDGET,
+        process_budget: int = PROCESS_BUDGET,
+        idle_seconds: float = IDLE_SECONDS,
+    ):
+        self.session_budget = session_budget
+        self.process_budget = process_budget
+        self.idle_seconds = idle_seconds
+        self.evictions = 0
+        self._sessions: Dict[str, _SessionEntry] = {}
+        self._lock = threading.Lock()
+
+    def touch(self, session_state: Any = None, session_id: Optional[str] = None) -> None:
+        """세션의 마지막 활동 시각을 갱신 (결과를 읽는 모든 실행에서 호출)"""
+        session_id = session_id or current_session_id()
+        state = _underlying_state(session_state)
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None or entry.state() is None:
+                entry = self._sessions[session_id] = _SessionEntry(_weak(state))
+            entry.last_active = time.monotonic()
+            entry.released = False
+
+    def record(self, session_state: Any = None, session_id: Optional[str] = None) -> Dict[str, int]:
+        """세션의 메모리 사용량을 측정해 기록하고 예산을 적용
+
+        세션 예산을 넘으면 다시 만들 수 있는 보고서부터 해제합니다.
+
+        Returns
+        -------
+        Dict[str, int]
+            항목별 사용량 (`session_footprint`)
+        """
+        session_id = session_id or current_session_id()
+        state = _underlying_state(session_state)
+        self.touch(state, session_id)
+        footprint = session_footprint(state)
+        if sum(footprint.values()) > self.session_budget and footprint['report']:
+            del state['report']
+            footprint['report'] = 0
+        with self._lock:
+            self._sessions[session_id].size = sum(footprint.values())
+        self.enforce()
+        return footprint
+
+    def enforce(self) -> List[str]:
+        """예산을 넘은 유휴 세션의 평가 결과를 해제
+
+        Returns
+        -------
+        List[str]
+            결과를 해제한 세션 ID
+        """
+        now = time.monotonic()
+        with self._lock:
+            for session_id in [k for k, e in self._sessions.items() if e.state() is None]:
+                del self._sessions[session_id]
+            total = sum(e.size for e in self._sessions.values())
+            idle = sorted(
+                (e.last_active, session_id) for session_id, e in self._sessions.items()
+                if not e.released and e.size and now - e.last_active >= self.idle_seconds
+            )
+            victims = []
+            for _, session_id in idle:
+                entry = self._sessions[session_id]
+                if entry.size > self.session_budget or total > self.process_budget:
+                    victims.append((session_id, entry))
+                    total -= entry.size
+
+        released = []
+        for session_id, entry in victims:
+            state = entry.state()
+            if state is None:
+                continue
+            release_results(state)
+            with self._lock:
+                entry.size = sum(session_footprint(state).values())
+                entry.released = True
+                self.evictions += 1
+            released.append(session_id)
+        return released
+
+    def stats(self) -> Dict[str, Any]:
+        """전체 통계 (세션 수, 기록된 사용량 합, 결과 해제 횟수, 프로세스 RSS)"""
+        with self._lock:
+            sessions = [e for e in self._sessions.values() if e.state() is not None]
+            return {
+                'sessions': len(sessions),
+                'session_bytes': sum(e.size for e in sessions),
+                'released_sessions': sum(e.released for e in sessions),
+                'evictions': self.evictions,
+                'rss_bytes': process_rss(),
+            }
+
+
+def _state_items(session_state: Any) -> Dict[str, Any]:
+    """세션 상태의 (키, 값) 사본 (Streamlit 내부 상태 객체와 일반 매핑 모두 지원)"""
+    if hasattr(session_state, 'filtered_state'):
+        return session_state.filtered_state
+    return dict(session_state.items())
+
+
+def _underlying_state(session_state: Any) -> Any:
+    """`st.session_state` 프록시 대신 현재 세션의 실제 상태 객체 (다른 스레드에서 접근용)
+
+    실행 문맥의 상태 객체(`SafeSessionState`)는 스크립트 실행기가 바뀔 때마다 새로 만들어지므로,
+    세션이 끝날 때까지 유지되는 내부 `SessionState`를 반환합니다.
+    """
+    if session_state is None or type(session_state).__name__ == 'SessionStateProxy':
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+        ctx = get_script_run_ctx(suppress_warning=True)
+        if ctx is not None:
+            session_state = ctx.session_state
+    return getattr(session_state, '_state', session_state)
+
+
+def _weak(state: Any):
+    try:
+        return weakref.ref(state)
+    except TypeError:
+        return lambda: state
+
+
+# 전역 메모리 모니터 (모든 세션이 공유)
+memory_monitor = MemoryMonitor()
@@ -0,0 +1,392 @@
+"""Prometheus 형식 메트릭 모듈
+
+대시보드 내부 동작의 지연 시간, 오류 수, 캐시 적중률, 세션 수를 기록하고 Prometheus 텍스트
+형식으로 노출합니다. 어떤 평가 함수나 시각화가 CPU를 쓰는지 replica 단위로 확인할 수 있습니다.
+
+- `exergy_evaluation_seconds{mode, system_type}`: 평가 함수 실행 시간 (`EvaluationRegistry.evaluate`)
+- `exergy_visualization_seconds{mode, visualization}`: 시각화 하나의 렌더링 시간
+- `exergy_rerun_seconds{scope}`: 스크립트 전체('app') 및 fragment('workspace', 'results_panel') 실행 시간
+- `exergy_*_errors_total`: 평가/시각화 오류 수
+- `exergy_cache_hits_total{cache}`, `exergy_cache_misses_total{cache}`, `exergy_cache_entries{cache}`
+- `exergy_active_sessions`, `exergy_session_memory_bytes`, `exergy_process_resident_memory_bytes`,
+  `exergy_scheduler_pending_jobs`
+
+메트릭 서버(`start_metrics_server`)는 표준 라이브러리 `http.server`로 별도 포트에서 실행되며,
+환경 변수 `EXERGY_METRICS_PORT`(기본 9464, 0이면 끔)와 `EXERGY_METRICS_HOST`(기본 127.0.0.1)로
+설정합니다.
+
+Examples
+--------
+>>> from exergy_dashboard.metrics import EVALUATION_SECONDS, metrics
+>>> with EVALUATION_SECONDS.time('COOLING', 'Air source heat pump'):
+...     variables = evaluate(params)
+>>> print(metrics.render())
+"""
+
+import bisect
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+# 지연 시간 히스토그램의 기본 구간 경계 [s]
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 메트릭 서버 설정 (환경 변수)
+METRICS_PORT_ENV = 'EXERGY_METRICS_PORT'
+METRICS_HOST_ENV = 'EXERGY_METRICS_HOST'
+DEFAULT_METRICS_PORT = 9464
+DEFAULT_METRICS_HOST = '127.0.0.1'
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class _Metric:
+    """메트릭 공통 부분 (이름, 설명, 라벨 이름)"""
+    kind = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _labels(self, labels: Sequence[Any]) -> Tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}, got {tuple(labels)}')
+        return tuple(str(label) for label in labels)
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """(샘플 이름, 라벨, 값) 목록"""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    kind = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._labels(labels), 0.0)
+
+    def samples(self):
+        with self._lock:
+            return [(self.name, dict(zip(self.labelnames, k)), v) for k, v in self._values.items()]
+
+
+class Histogram(_Metric):
+    """누적 구간(bucket) 히스토그램"""
+    kind = 'histogram'
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 -> (구간별 관측 수(+Inf 포함), 합계)
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], float]] = {}
+
+    def observe(self, value: float, *labels: Any) -> None:
+        key = self._labels(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key] = (counts, total + value)
+
+    @contextmanager
+    def time(self, *labels: Any) -> Iterator[None]:
+        """블록 실행 시간을 기록 (예외가 발생해도 기록)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, *labels)
+
+    def count(self, *labels: Any) -> int:
+        with self._lock:
+            value = self._values.get(self._labels(labels))
+            return sum(value[0]) if value else 0
+
+    def samples(self):
+        samples = []
+        with self._lock:
+            for key, (counts, total) in self._values.items():
+                labels = dict(zip(self.labelnames, key))
+                cumulative = 0
+                for bound, n in zip(self.buckets + (math.inf,), counts):
+                    cumulative += n
+                    samples.append((f'{self.name}_bucket', {**labels, 'le': _format_value(bound)}, cumulative))
+                samples.append((f'{self.name}_sum', labels, total))
+                samples.append((f'{self.name}_count', labels, cumulative))
+        return samples
+
+
+class CallbackMetric(_Metric):
+    """수집할 때마다 함수를 호출해 값을 읽는 메트릭
+
+    함수는 숫자(라벨 없음) 또는 {라벨 튜플: 값}을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], Any],
+        labelnames: Sequence[str] = (),
+        kind: str = 'gauge',
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.func = func
+        self.kind = kind
+
+    def samples(self):
+        values = self.func()
+        if values is None:
+            return []
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [
+            (self.name, dict(zip(self.labelnames, self._labels(k))), float(v))
+            for k, v in values.items() if v is not None
+        ]
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리 (이름 순서대로 Prometheus 텍스트 형식으로 출력)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric already registered: {metric.name}')
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], Any],
+        labelnames: Sequence[str] = (),
+        kind: str = 'gauge',
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, func, labelnames, kind))
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """모든 메트릭을 Prometheus 텍스트 형식(0.0.4)으로 변환
+
+        값을 읽지 못한 메트릭은 건너뜁니다.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            try:
+                samples = metric.samples()
+            except Exception as e:
+                print(f"Error collecting metric {metric.name}: {e}")
+                continue
+            lines.append(f'# HELP {metric.name} {_escape_help(metric.documentation)}')
+            lines.append(f'# TYPE {metric.name} {metric.kind}')
+            for sample, labels, value in samples:
+                label_text = ','.join(f'{k}="{_escape_label(v)}"' for k, v in labels.items())
+                lines.append(f"{sample}{{{label_text}}} {_format_value(value)}" if labels
+                             else f'{sample} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_help(text: str) -> str:
+    return text.replace('\\', r'\\').replace('\n', r'\n')
+
+
+def _escape_label(text: str) -> str:
+    return text.replace('\\', r'\\').replace('\n', r'\n').replace('"', r'\"')
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def timed(histogram: Histogram, *labels: Any) -> Callable:
+    """함수 실행 시간을 히스토그램에 기록하는 데코레이터"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time(*labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# 전역 메트릭 레지스트리
+metrics = MetricsRegistry()
+
+EVALUATION_SECONDS = metrics.histogram(
+    'exergy_evaluation_seconds', 'Evaluation function latency.', ('mode', 'system_type'),
+)
+EVALUATION_ERRORS = metrics.counter(
+    'exergy_evaluation_errors_total', 'Evaluation function errors.', ('mode', 'system_type'),
+)
+VISUALIZATION_SECONDS = metrics.histogram(
+    'exergy_visualization_seconds', 'Time to build and send one visualization.', ('mode', 'visualization'),
+)
+VISUALIZATION_ERRORS = metrics.counter(
+    'exergy_visualization_errors_total', 'Visualization errors.', ('mode', 'visualization'),
+)
+RERUN_SECONDS = metrics.histogram(
+    'exergy_rerun_seconds', 'Script run (app) and fragment run latency.', ('scope',),
+)
+
+
+def _caches() -> Dict[str, Any]:
+    from exergy_dashboard.evaluation import evaluation_cache
+    from exergy_dashboard.render import image_cache
+    from exergy_dashboard.sweep import sweep_cache
+    from exergy_dashboard.visualization import spec_cache
+
+    return {'evaluation': evaluation_cache, 'spec': spec_cache, 'image': image_cache, 'sweep': sweep_cache}
+
+
+def _memory_stats() -> Dict[str, Any]:
+    from exergy_dashboard.memory import memory_monitor
+
+    return memory_monitor.stats()
+
+
+def _pending_jobs() -> int:
+    from exergy_dashboard.scheduler import scheduler
+
+    return scheduler.pending
+
+
+metrics.callback(
+    'exergy_cache_hits_total', 'Cache hits.',
+    lambda: {(name,): cache.hits for name, cache in _caches().items()}, ('cache',), kind='counter',
+)
+metrics.callback(
+    'exergy_cache_misses_total', 'Cache misses.',
+    lambda: {(name,): cache.misses for name, cache in _caches().items()}, ('cache',), kind='counter',
+)
+metrics.callback(
+    'exergy_cache_entries', 'Cached entries.',
+    lambda: {(name,): len(cache) for name, cache in _caches().items()}, ('cache',),
+)
+metrics.callback(
+    'exergy_active_sessions', 'Sessions alive in this process.', lambda: _memory_stats()['sessions'],
+)
+metrics.callback(
+    'exergy_session_memory_bytes', 'Recorded memory footprint of all sessions.',
+    lambda: _memory_stats()['session_bytes'],
+)
+metrics.callback(
+    'exergy_session_evictions_total', 'Idle sessions whose results were released.',
+    lambda: _memory_stats()['evictions'], kind='counter',
+)
+metrics.callback(
+    'exergy_process_resident_memory_bytes', 'Resident memory of this process.',
+    lambda: _memory_stats()['rss_bytes'],
+)
+metrics.callback('exergy_scheduler_pending_jobs', 'Jobs waiting in the evaluation scheduler.', _pending_jobs)
+
+
+# ----------------------------------------------------------------------
+# HTTP 서버
+# ----------------------------------------------------------------------
+# 경로 -> 응답 함수 (상태 코드, 본문). 다른 모듈이 경로를 추가할 수 있음
+routes: Dict[str, Callable[[], Tuple[int, str]]] = {
+    '/metrics': lambda: (200, metrics.render()),
+}
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        handler = routes.get(self.path.split('?', 1)[0])
+        status, body = handler() if handler is not None else (404, 'Not found\n')
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_started = False
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port: Optional[int] = None, host: Optional[str] = None) -> Optional[ThreadingHTTPServer]:
+    """메트릭 서버를 백그라운드 스레드에서 시작 (프로세스당 한 번만 시작)
+
+    Parameters
+    ----------
+    port : int, optional
+        포트 (기본값: 환경 변수 `EXERGY_METRICS_PORT`, 없으면 9464. 0이면 시작하지 않음)
+    host : str, optional
+        주소 (기본값: 환경 변수 `EXERGY_METRICS_HOST`, 없으면 127.0.0.1)
+
+    Returns
+    -------
+    ThreadingHTTPServer or None
+        실행 중인 서버. 꺼져 있거나 포트를 열지 못하면 None (앱 실행은 계속됨)
+    """
+    global _server, _server_started
+    with _server_lock:
+        if _server_started:
+            return _server
+        _server_started = True
+        port = int(os.environ.get(METRICS_PORT_ENV, DEFAULT_METRICS_PORT)) if port is None else port
+        host = host or os.environ.get(METRICS_HOST_ENV, DEFAULT_METRICS_HOST)
+        if not port:
+            return None
+        try:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+        except OSError as e:
+            print(f"Error starting metrics server on {host}:{port}: {e}")
+            return None
+        _server.daemon_threads = True
+        threading.Thread(target=_server.serve_forever, name='metrics-server', daemon=True).start()
+        return _server
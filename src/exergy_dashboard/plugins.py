@@ -0,0 +1,68 @@
+"""시스템 플러그인 로딩 모듈
+
+`systems/` 폴더의 `*_system.py` 파일은 임포트되는 순간 시스템, 평가 함수, 시각화를
+레지스트리에 등록합니다. 대시보드(app.py)와 명령행 도구가 같은 방식으로 플러그인을
+불러오도록 로딩 로직을 한곳에 둡니다.
+
+플러그인을 모두 불러온 뒤에는 모든 모드에 공통인 대규모 비교 시각화
+(`exergy_dashboard.comparison`), 2차원 파라미터 sweep(`exergy_dashboard.sweep`),
+클라이언트 측 파라미터 탐색(`exergy_dashboard.explore`)을 각 모드의 시각화 뒤에 등록합니다.
+
+Examples
+--------
+>>> from exergy_dashboard.plugins import load_plugins
+>>> load_plugins('systems')
+['systems.cooling_system', 'systems.heating_system', 'systems.hot_water_system']
+"""
+
+import glob
+import importlib
+import os
+import sys
+import threading
+from typing import List
+
+from exergy_dashboard.comparison import register_comparison_views
+from exergy_dashboard.explore import register_explore_views
+from exergy_dashboard.sweep import register_sweep_views
+from exergy_dashboard.system import get_systems
+
+
+# 여러 스레드(warm-up, 첫 세션)가 동시에 불러와도 등록이 섞이지 않도록 보호
+_lock = threading.Lock()
+
+
+def load_plugins(systems_dir: str) -> List[str]:
+    """폴더 안의 `*_system.py` 파일을 모두 임포트하여 레지스트리에 등록
+
+    폴더 이름을 패키지 이름으로 사용하므로(예: `systems.cooling_system`), 폴더의
+    상위 디렉터리가 `sys.path`에 없으면 추가합니다. 이미 임포트된 모듈은 다시
+    실행되지 않습니다.
+
+    Parameters
+    ----------
+    systems_dir : str
+        플러그인 폴더 경로
+
+    Returns
+    -------
+    List[str]
+        임포트한 모듈 이름 목록
+    """
+    systems_dir = os.path.abspath(systems_dir)
+    parent_dir, package = os.path.split(systems_dir)
+    if parent_dir not in sys.path:
+        sys.path.insert(0, parent_dir)
+
+    modules = []
+    with _lock:
+        for file_path in sorted(glob.glob(os.path.join(systems_dir, '*_system.py'))):
+            module_name = os.path.splitext(os.path.basename(file_path))[0]
+            importlib.import_module(f'{package}.{module_name}')
+            modules.append(f'{package}.{module_name}')
+
+        for mode in get_systems():
+            register_comparison_views(mode)
+            register_sweep_views(mode)
+            register_explore_views(mode)
+    return modules
@@ -0,0 +1,112 @@
+"""이웃 파라미터 값 선행 평가(speculative prefetch) 모듈
+
+사용자는 대부분 `st.number_input`의 +/- 버튼으로 파라미터를 한 `step`씩 바꿉니다.
+이 모듈은 시스템 평가가 끝난 뒤, 가장 최근에 수정한 파라미터의 ±1 step 이웃값을
+유휴 워커에서 미리 평가하여 평가 캐시에 넣어 둡니다. 다음 클릭은 캐시에서 바로 응답합니다.
+
+- 선행 평가는 `Priority.PREFETCH`로 제출되어 실제 요청보다 항상 늦게 처리됩니다.
+- 같은 세션이 새 선행 평가를 요청하면 이전에 대기 중이던 선행 평가는 취소됩니다.
+- 이웃값이 파라미터 범위('range')를 벗어나면 평가하지 않습니다.
+
+Examples
+--------
+>>> from exergy_dashboard.prefetch import prefetch_neighbours
+>>> prefetch_neighbours('COOLING', 'Air source heat pump', params, 'T_0', parameter)
+"""
+
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional
+
+from exergy_dashboard.scheduler import (
+    EvaluationScheduler,
+    Priority,
+    SchedulerBusyError,
+    current_session_id,
+    scheduler as default_scheduler,
+)
+from exergy_dashboard.system import resolve_range
+
+
+def neighbour_params(
+    params: Dict[str, float],
+    name: str,
+    parameter: Dict[str, Any],
+) -> List[Dict[str, float]]:
+    """파라미터 `name`을 ±1 step 바꾼 파라미터 세트 목록을 반환
+
+    Parameters
+    ----------
+    params : Dict[str, float]
+        현재 파라미터 값
+    name : str
+        변경할 파라미터 이름
+    parameter : Dict[str, Any]
+        파라미터 설정 ('step', 'range' 포함)
+
+    Returns
+    -------
+    List[Dict[str, float]]
+        범위 안에 있는 이웃 파라미터 세트 (최대 2개)
+    """
+    value = params.get(name)
+    step = parameter.get('step')
+    if value is None or not step:
+        return []
+
+    neighbours = []
+    # number_input의 +/- 버튼과 같은 방식(value ± step)으로 계산해야 캐시 키가 일치함
+    for candidate in (value - step, value + step):
+        trial = dict(params)
+        trial[name] = candidate
+        try:
+            low, high = resolve_range(parameter, trial)
+        except Exception:
+            low, high = float('-inf'), float('inf')
+        if low <= candidate <= high:
+            neighbours.append(trial)
+    return neighbours
+
+
+def prefetch_neighbours(
+    mode: str,
+    system_type: str,
+    params: Dict[str, float],
+    name: str,
+    parameter: Dict[str, Any],
+    session_id: Optional[str] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> List[Future]:
+    """가장 최근에 수정한 파라미터의 이웃값을 선행 평가로 제출
+
+    같은 세션에서 대기 중인 이전 선행 평가는 먼저 취소합니다. 큐가 가득 찬 경우나
+    워커가 하나뿐인 경우(`scheduler.prefetch_enabled`가 False)에는 아무것도 제출하지 않습니다.
+
+    Returns
+    -------
+    List[Future]
+        제출된 선행 평가 작업들
+    """
+    scheduler = scheduler or default_scheduler
+    session_id = session_id or current_session_id()
+    cancel_prefetch(session_id, scheduler)
+    if not scheduler.prefetch_enabled:
+        return []
+
+    futures = []
+    for trial in neighbour_params(params, name, parameter):
+        try:
+            futures.append(scheduler.submit_evaluation(
+                mode, system_type, trial, session_id=session_id, priority=Priority.PREFETCH
+            ))
+        except SchedulerBusyError:
+            break
+    return futures
+
+
+def cancel_prefetch(
+    session_id: Optional[str] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> int:
+    """세션의 대기 중인 선행 평가를 모두 취소하고 취소된 작업 수를 반환"""
+    scheduler = scheduler or default_scheduler
+    return scheduler.cancel_pending(session_id or current_session_id(), Priority.PREFETCH)
@@ -0,0 +1,244 @@
+"""차트 정적 렌더링 모듈
+
+Vega-Lite spec을 vl-convert로 서버에서 SVG/PNG 이미지로 변환합니다.
+
+- 저사양 클라이언트용 정적 이미지 표시 모드: 브라우저에서 Vega를 실행하지 않고 이미지만 전송
+  (브라우저의 계산은 줄지만 이미지는 spec보다 2~7배 크므로 전송량은 늘어남)
+- 차트 내보내기(다운로드, 보고서)
+- 렌더링된 이미지는 spec 내용의 해시를 키로 하는 LRU 캐시에 보관 (모든 세션이 공유)
+- 여러 차트는 평가 스케줄러의 워커 스레드에서 병렬로 렌더링
+
+Examples
+--------
+>>> from exergy_dashboard.render import render_image, render_images
+>>> svg = render_image(spec, 'svg')
+>>> pngs = render_images([spec1, spec2], 'png', scale=2)
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent import futures
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import vl_convert as vlc
+
+from exergy_dashboard.scheduler import (
+    EvaluationScheduler,
+    Priority,
+    current_session_id,
+    scheduler as default_scheduler,
+)
+
+
+# 지원하는 이미지 형식과 MIME 타입
+FORMATS = {
+    'svg': 'image/svg+xml',
+    'png': 'image/png',
+}
+
+# 'container' 너비 대신 사용할 고정 너비 [px] (서버에는 브라우저 컨테이너가 없음)
+STATIC_WIDTH = 720
+
+
+class ImageCache:
+    """렌더링된 이미지를 spec 내용 해시 단위로 보관하는 LRU 캐시
+
+    Parameters
+    ----------
+    maxsize : int, default 128
+        보관할 최대 이미지 수. 초과하면 가장 오래 사용되지 않은 이미지부터 제거
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(spec: Dict[str, Any], fmt: str, scale: float) -> str:
+        """spec 내용과 렌더링 옵션의 해시 키 생성"""
+        payload = json.dumps(spec, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.sha256(payload.encode('utf-8'))
+        digest.update(f'|{fmt}|{scale}'.encode('utf-8'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시된 이미지를 반환하고, 없으면 None을 반환"""
+        with self._lock:
+            image = self._data.get(key)
+            if image is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return image
+
+    def put(self, key: str, image: bytes) -> None:
+        """이미지를 캐시에 저장"""
+        with self._lock:
+            self._data[key] = image
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# 전역 이미지 캐시 (모든 세션이 공유)
+image_cache = ImageCache()
+
+
+def static_spec(spec: Dict[str, Any], width: int = STATIC_WIDTH) -> Dict[str, Any]:
+    """`width: 'container'`를 고정 너비로 바꾼 spec을 반환 (원본은 변경하지 않음)
+
+    최상위뿐 아니라 facet의 'spec', 'layer' 등 중첩된 뷰의 너비도 바꿉니다.
+    """
+    def replace(node: Any) -> Any:
+        if isinstance(node, dict):
+            changed = None
+            for key, value in node.items():
+                if key == 'datasets' or key == 'data':
+                    continue
+                if key == 'width' and value == 'container':
+                    new = width
+                else:
+                    new = replace(value)
+                if new is not value:
+                    changed = changed or dict(node)
+                    changed[key] = new
+            return changed if changed is not None else node
+        if isinstance(node, list):
+            items = [replace(item) for item in node]
+            if any(a is not b for a, b in zip(items, node)):
+                return items
+        return node
+
+    return replace(spec)
+
+
+def render_image(
+    spec: Dict[str, Any],
+    fmt: str = 'svg',
+    width: int = STATIC_WIDTH,
+    scale: float = 1.0,
+    cache: Optional[ImageCache] = None,
+) -> bytes:
+    """Vega-Lite spec을 이미지로 렌더링 (캐시 적중 시 렌더링하지 않음)
+
+    Parameters
+    ----------
+    spec : Dict[str, Any]
+        Vega-Lite spec
+    fmt : str, default 'svg'
+        이미지 형식 ('svg' 또는 'png')
+    width : int, default STATIC_WIDTH
+        'container' 너비 대신 사용할 너비 [px]
+    scale : float, default 1.0
+        PNG 해상도 배율
+    cache : ImageCache, optional
+        이미지 캐시 (기본값: 전역 캐시)
+
+    Returns
+    -------
+    bytes
+        SVG(UTF-8) 또는 PNG 데이터
+
+    Raises
+    ------
+    ValueError
+        지원하지 않는 형식인 경우
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported image format '{fmt}'. Use one of {list(FORMATS)}")
+    cache = cache if cache is not None else image_cache
+
+    spec = static_spec(spec, width)
+    key = cache.make_key(spec, fmt, scale if fmt == 'png' else 1.0)
+    image = cache.get(key)
+    if image is not None:
+        return image
+
+    if fmt == 'svg':
+        image = vlc.vegalite_to_svg(spec).encode('utf-8')
+    else:
+        image = vlc.vegalite_to_png(spec, scale=scale)
+    cache.put(key, image)
+    return image
+
+
+def submit_images(
+    specs: Sequence[Dict[str, Any]],
+    fmt: str = 'svg',
+    width: int = STATIC_WIDTH,
+    scale: float = 1.0,
+    session_id: Optional[str] = None,
+    priority: Priority = Priority.BATCH,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> List[Union[futures.Future, Exception]]:
+    """여러 spec의 렌더링을 스케줄러 워커 스레드에 제출하고 바로 반환
+
+    Returns
+    -------
+    List[Union[futures.Future, Exception]]
+        입력 순서대로의 Future. 제출이 거절된 spec은 예외 객체
+    """
+    scheduler = scheduler or default_scheduler
+    session_id = session_id or current_session_id()
+
+    submitted: List[Union[futures.Future, Exception]] = []
+    for spec in specs:
+        try:
+            submitted.append(scheduler.submit(
+                render_image, spec, fmt, width, scale,
+                session_id=session_id, priority=priority,
+            ))
+        except Exception as e:
+            submitted.append(e)
+    return submitted
+
+
+def render_images(
+    specs: Sequence[Dict[str, Any]],
+    fmt: str = 'svg',
+    width: int = STATIC_WIDTH,
+    scale: float = 1.0,
+    session_id: Optional[str] = None,
+    priority: Priority = Priority.BATCH,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> List[Union[bytes, Exception]]:
+    """여러 spec을 스케줄러 워커 스레드에서 병렬로 렌더링
+
+    Returns
+    -------
+    List[Union[bytes, Exception]]
+        입력 순서대로의 이미지. 실패한 렌더링은 예외 객체
+    """
+    submitted = submit_images(specs, fmt, width, scale, session_id, priority, scheduler)
+    return [image_result(future) for future in submitted]
+
+
+def image_result(
+    future: Union[futures.Future, Exception],
+    timeout: Optional[float] = None,
+) -> Union[bytes, Exception]:
+    """`submit_images`가 반환한 항목의 결과 (실패하면 예외 객체)"""
+    if isinstance(future, Exception):
+        return future
+    try:
+        return future.result(timeout)
+    except Exception as e:
+        return e
@@ -0,0 +1,244 @@
+"""분석 보고서 내보내기 모듈
+
+선택한 모든 시스템의 입력 파라미터 표, 현재 모드의 모든 시각화, 효율 등급 배치를
+하나의 독립(self-contained) HTML 문서로 만듭니다. 차트는 인라인 SVG로 포함되므로
+외부 스크립트나 네트워크 없이 열리고, 브라우저의 인쇄 기능으로 PDF로 저장할 수 있습니다.
+
+- 시각화 spec은 spec 캐시를 거쳐 생성하고, SVG 렌더링은 스케줄러 워커에 한꺼번에 제출
+- 렌더링이 진행되는 동안 요약/입력 표를 먼저 쓰고, 차트는 완료되는 대로 문서 순서대로 기록
+- 렌더링된 이미지는 이미지 캐시에 남으므로 같은 결과로 다시 내보내면 즉시 완료
+
+Examples
+--------
+>>> from exergy_dashboard.report import build_report
+>>> html = build_report(session_state, selected_systems, 'COOLING')
+>>> with open('report.html', 'wb') as f:
+...     f.write(html)
+"""
+
+import datetime
+import html
+import io
+from typing import Any, Dict, List, Optional, TextIO
+
+from exergy_dashboard.evaluation import collect_parameters
+from exergy_dashboard.render import image_result, submit_images
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.scheduler import EvaluationScheduler, Priority
+from exergy_dashboard.visualization import (
+    VisualizationManager,
+    chart_to_spec,
+    registry as default_registry,
+)
+
+
+# 보고서 스타일 (화면/인쇄 공용, 차트 하나가 페이지 사이에서 잘리지 않도록 함)
+REPORT_CSS = """
+body { font-family: -apple-system, 'Segoe UI', Helvetica, Arial, sans-serif; color: #222;
+       max-width: 980px; margin: 2em auto; padding: 0 1em; }
+h1 { margin-bottom: 0.2em; }
+.meta { color: #666; margin-top: 0; }
+table { border-collapse: collapse; margin: 0.5em 0 1.5em; width: 100%; font-size: 0.9em; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; text-align: left; }
+th { background: #f3f3f3; }
+td.num { text-align: right; font-variant-numeric: tabular-nums; }
+figure { margin: 1em 0 2em; break-inside: avoid; page-break-inside: avoid; }
+figure svg { max-width: 100%; height: auto; }
+figcaption { font-weight: bold; margin-bottom: 0.5em; }
+.error { color: #b00020; }
+section.system { break-inside: avoid; page-break-inside: avoid; }
+@media print { body { margin: 0; max-width: none; } h2 { break-before: page; }
+               h2:first-of-type { break-before: auto; } }
+"""
+
+
+def build_report(
+    session_state: Any,
+    selected_systems: List[str],
+    mode: str,
+    manager: Optional[VisualizationManager] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+    lang: str = 'EN',
+    title: str = 'Exergy Analysis Report',
+) -> bytes:
+    """선택한 시스템들의 분석 보고서(HTML)를 생성
+
+    Parameters
+    ----------
+    session_state : Any
+        Streamlit session state
+    selected_systems : List[str]
+        보고서에 포함할 시스템 이름 목록
+    mode : str
+        시스템 모드
+    manager : VisualizationManager, optional
+        시각화 관리자 (기본값: 전역 레지스트리를 사용하는 관리자)
+    scheduler : EvaluationScheduler, optional
+        렌더링을 실행할 스케줄러 (기본값: 전역 스케줄러)
+    lang : str, default 'EN'
+        파라미터 설명 언어 ('EN' 또는 'KR')
+    title : str, default 'Exergy Analysis Report'
+        문서 제목
+
+    Returns
+    -------
+    bytes
+        UTF-8로 인코딩된 HTML 문서
+    """
+    stream = io.StringIO()
+    write_report(stream, session_state, selected_systems, mode, manager, scheduler, lang, title)
+    return stream.getvalue().encode('utf-8')
+
+
+def write_report(
+    stream: TextIO,
+    session_state: Any,
+    selected_systems: List[str],
+    mode: str,
+    manager: Optional[VisualizationManager] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+    lang: str = 'EN',
+    title: str = 'Exergy Analysis Report',
+) -> None:
+    """분석 보고서(HTML)를 `stream`에 순서대로 기록
+
+    매개변수는 `build_report`와 같습니다. 차트 렌더링을 먼저 모두 제출한 뒤
+    요약과 입력 파라미터 표를 기록하고, 차트는 완료되는 대로 문서 순서에 맞춰 기록합니다.
+    """
+    mode = mode.upper()
+    manager = manager or VisualizationManager(default_registry)
+
+    # 1. 시각화 spec 생성 (spec 캐시 사용) 후 SVG 렌더링을 한꺼번에 제출
+    names = list(manager.registry.get_available_visualizers(mode))
+    specs: Dict[str, Any] = {}
+    for name in names:
+        try:
+            specs[name] = chart_to_spec(
+                manager.build_spec(session_state, selected_systems, mode, name)
+            )
+        except Exception as e:
+            specs[name] = e
+    renderable = [name for name in names if isinstance(specs[name], dict)]
+    pending = dict(zip(renderable, submit_images(
+        [specs[name] for name in renderable], 'svg',
+        priority=Priority.BATCH, scheduler=scheduler,
+    )))
+
+    # 2. 렌더링이 진행되는 동안 요약과 입력 파라미터 기록
+    generated = datetime.datetime.now().strftime('%Y-%m-%d %H:%M')
+    stream.write('<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n')
+    stream.write(f'<title>{_esc(title)} - {_esc(mode.title())}</title>\n')
+    stream.write(f'<style>{REPORT_CSS}</style>\n</head>\n<body>\n')
+    stream.write(f'<h1>{_esc(title)}</h1>\n')
+    stream.write(
+        f'<p class="meta">Mode: {_esc(mode.title())} &middot; '
+        f'{len(selected_systems)} systems &middot; Generated {generated}</p>\n'
+    )
+    _write_summary(stream, session_state, selected_systems, _grade_placements(specs))
+    _write_parameters(stream, session_state, selected_systems, lang)
+
+    # 3. 차트는 완료되는 대로 문서 순서대로 기록
+    stream.write('<h2>Results</h2>\n')
+    for name in names:
+        stream.write(f'<figure>\n<figcaption>{_esc(name)}</figcaption>\n')
+        spec = specs[name]
+        image = image_result(pending[name]) if name in pending else spec
+        if isinstance(image, bytes):
+            stream.write(_inline_svg(image))
+        elif isinstance(image, Exception):
+            stream.write(f'<p class="error">Failed to render: {_esc(image)}</p>')
+        elif isinstance(spec, str):
+            # HTML을 반환하는 시각화는 격리된 iframe으로 포함
+            stream.write(
+                f'<iframe srcdoc="{_esc(spec)}" style="width:100%;height:480px;border:0">'
+                '</iframe>'
+            )
+        else:
+            stream.write('<p>No data to display.</p>')
+        stream.write('\n</figure>\n')
+    stream.write('</body>\n</html>\n')
+
+
+def _write_summary(
+    stream: TextIO,
+    session_state: Any,
+    selected_systems: List[str],
+    grades: List[str],
+) -> None:
+    """시스템별 타입, 엑서지 효율, 등급 요약 표"""
+    table = get_result_table(session_state, selected_systems)
+    evaluated = [name for name in selected_systems if name in table]
+    efficiencies = dict(zip(evaluated, table.column('X_eff', evaluated) * 100))
+    # 등급 차트의 케이스는 선택한 시스템 순서와 일대일로 대응
+    grades_by_name = dict(zip(selected_systems, grades)) if len(grades) == len(selected_systems) else {}
+
+    stream.write('<h2>Summary</h2>\n<table>\n')
+    stream.write('<tr><th>System</th><th>Type</th><th>Exergy efficiency [%]</th>'
+                 '<th>Grade</th></tr>\n')
+    for name in selected_systems:
+        system = session_state.systems.get(name, {})
+        stream.write(
+            f'<tr><td>{_esc(name)}</td><td>{_esc(system.get("type", ""))}</td>'
+            f'<td class="num">{_fmt(efficiencies.get(name))}</td>'
+            f'<td>{_esc(grades_by_name.get(name, "-"))}</td></tr>\n'
+        )
+    stream.write('</table>\n')
+
+
+def _write_parameters(
+    stream: TextIO,
+    session_state: Any,
+    selected_systems: List[str],
+    lang: str,
+) -> None:
+    """시스템별 입력 파라미터 표 (카테고리, 설명, 값, 단위, 기본값)"""
+    stream.write('<h2>Inputs</h2>\n')
+    for name in selected_systems:
+        system = session_state.systems.get(name, {})
+        values = collect_parameters(session_state, name)
+        stream.write(f'<section class="system">\n<h3>{_esc(name)}</h3>\n<table>\n')
+        stream.write('<tr><th>Category</th><th>Parameter</th><th>Symbol</th>'
+                     '<th>Value</th><th>Unit</th><th>Default</th></tr>\n')
+        for key, parameter in system.get('parameters', {}).items():
+            value = values.get(key, parameter.get('value', parameter.get('default')))
+            explanation = parameter.get('explanation', {})
+            stream.write(
+                f'<tr><td>{_esc(parameter.get("category", "General").capitalize())}</td>'
+                f'<td>{_esc(explanation.get(lang, explanation.get("EN", key)))}</td>'
+                f'<td>{_esc(key)}</td>'
+                f'<td class="num">{_fmt(value)}</td>'
+                f'<td>{_esc(parameter.get("unit", ""))}</td>'
+                f'<td class="num">{_fmt(parameter.get("default"))}</td></tr>\n'
+            )
+        stream.write('</table>\n</section>\n')
+
+
+def _grade_placements(specs: Dict[str, Any]) -> List[str]:
+    """등급 차트 spec의 'grade_cases' 데이터셋에서 케이스 순서대로 등급 라벨을 모음"""
+    for spec in specs.values():
+        if isinstance(spec, dict) and 'grade_cases' in spec.get('datasets', {}):
+            return [case.get('grade', '-') for case in spec['datasets']['grade_cases']]
+    return []
+
+
+def _inline_svg(image: bytes) -> str:
+    svg = image.decode('utf-8')
+    # XML 선언은 HTML 본문 안에서 유효하지 않으므로 제거
+    if svg.startswith('<?xml'):
+        svg = svg[svg.index('?>') + 2:].lstrip()
+    return svg
+
+
+def _fmt(value: Any) -> str:
+    if value is None:
+        return '-'
+    if isinstance(value, (int, float)):
+        value = float(value)
+        if value != value:
+            return '-'
+        return f'{value:.2f}' if abs(value) < 1e5 else f'{value:.3g}'
+    return _esc(value)
+
+
+def _esc(value: Any) -> str:
+    return html.escape(str(value))
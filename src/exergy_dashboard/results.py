@@ -0,0 +1,266 @@
+"""세션 단위 열 기반(columnar) 결과 저장소 모듈
+
+시각화 함수가 렌더링할 때마다 `session_state.systems[key]['variables']` 딕셔너리를 돌며
+DataFrame을 다시 만들지 않도록, 세션마다 하나의 결과 테이블을 유지합니다.
+
+- 행: 시스템 하나 (추가된 순서 유지)
+- 열: 출력 변수 하나 (스칼라 숫자만 저장, 해당 시스템에 없는 변수는 NaN)
+- 평가/추가/삭제 시 해당 행만 갱신 (증분 유지)
+- 선택한 시스템이 연속된 행이면 열 조회는 복사 없이 읽기 전용 뷰를 반환
+
+Examples
+--------
+>>> from exergy_dashboard.results import get_result_table
+>>> table = get_result_table(session_state)
+>>> efficiencies = table.column('X_eff', selected_systems) * 100
+>>> frame = table.frame(selected_systems, ['X_eff', 'X_c_int'])
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class ResultTable:
+    """시스템별 계산 결과를 담는 2차원 float 배열 기반 테이블
+
+    Notes
+    -----
+    `column`, `values` 등이 반환하는 뷰는 다음 변경(upsert/remove) 전까지만 유효합니다.
+    """
+
+    def __init__(self, row_capacity: int = 8, column_capacity: int = 64):
+        self._data = np.full((row_capacity, column_capacity), np.nan)
+        self._names: List[str] = []
+        self._types: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._columns: Dict[str, int] = {}
+        # 내용이 바뀔 때마다 증가 (캐시 무효화 확인용)
+        self.version = 0
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+    def upsert(self, name: str, system_type: str, variables: Dict[str, Any]) -> None:
+        """시스템 한 행을 추가하거나 갱신
+
+        Parameters
+        ----------
+        name : str
+            시스템 이름
+        system_type : str
+            시스템 타입
+        variables : Dict[str, Any]
+            평가 결과. 스칼라 숫자가 아닌 값은 저장하지 않음
+        """
+        scalars = {k: float(v) for k, v in variables.items() if is_scalar(v)}
+        for key in scalars:
+            if key not in self._columns:
+                self._add_column(key)
+
+        row = self._rows.get(name)
+        if row is None:
+            row = len(self._names)
+            self._ensure_rows(row + 1)
+            self._names.append(name)
+            self._types.append(system_type)
+            self._rows[name] = row
+        else:
+            self._types[row] = system_type
+
+        values = self._data[row]
+        values[:] = np.nan
+        for key, value in scalars.items():
+            values[self._columns[key]] = value
+        self.version += 1
+
+    def remove(self, name: str) -> None:
+        """시스템 행을 삭제 (나머지 행의 순서는 유지)"""
+        row = self._rows.pop(name, None)
+        if row is None:
+            return
+        n = len(self._names)
+        self._data[row:n - 1] = self._data[row + 1:n]
+        self._data[n - 1] = np.nan
+        del self._names[row]
+        del self._types[row]
+        for i in range(row, n - 1):
+            self._rows[self._names[i]] = i
+        self.version += 1
+
+    def copy(self) -> 'ResultTable':
+        """독립된 사본을 반환 (다른 스레드에서 읽기용)"""
+        table = ResultTable.__new__(ResultTable)
+        table._data = self._data.copy()
+        table._names = list(self._names)
+        table._types = list(self._types)
+        table._rows = dict(self._rows)
+        table._columns = dict(self._columns)
+        table.version = self.version
+        return table
+
+    def clear(self) -> None:
+        """모든 행을 삭제"""
+        self._data[:] = np.nan
+        self._names.clear()
+        self._types.clear()
+        self._rows.clear()
+        self.version += 1
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    @property
+    def names(self) -> List[str]:
+        """행 순서대로의 시스템 이름"""
+        return list(self._names)
+
+    @property
+    def columns(self) -> List[str]:
+        """열(출력 변수) 이름"""
+        return list(self._columns)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._rows
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def system_type(self, name: str) -> str:
+        """시스템 타입 조회"""
+        return self._types[self._rows[name]]
+
+    def rows(self, names: Optional[Sequence[str]] = None):
+        """시스템 이름에 해당하는 행 인덱스 (연속된 행이면 slice)"""
+        if names is None:
+            return slice(0, len(self._names))
+        idx = [self._rows[name] for name in names]
+        if idx and idx == list(range(idx[0], idx[0] + len(idx))):
+            return slice(idx[0], idx[0] + len(idx))
+        return np.array(idx, dtype=int)
+
+    def column(self, var: str, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """출력 변수 한 열의 값 (없는 변수는 NaN)
+
+        Parameters
+        ----------
+        var : str
+            출력 변수 이름 (예: 'X_eff')
+        names : Sequence[str], optional
+            시스템 이름 목록 (기본값: 전체, 행 순서)
+
+        Returns
+        -------
+        np.ndarray
+            선택한 시스템 순서대로의 값. 연속된 행이면 읽기 전용 뷰
+        """
+        rows = self.rows(names)
+        j = self._columns.get(var)
+        if j is None:
+            n = len(range(*rows.indices(len(self._names)))) if isinstance(rows, slice) else len(rows)
+            return np.full(n, np.nan)
+        return _readonly(self._data[rows, j])
+
+    def values(
+        self,
+        names: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> np.ndarray:
+        """(시스템, 변수) 2차원 값 배열
+
+        열을 지정하지 않고 연속된 행을 선택하면 복사 없이 뷰를 반환합니다.
+        """
+        rows = self.rows(names)
+        if columns is None:
+            return _readonly(self._data[rows, :len(self._columns)])
+        cols = [self._columns.get(c, -1) for c in columns]
+        block = self._data[rows][:, [c if c >= 0 else 0 for c in cols]]
+        missing = [i for i, c in enumerate(cols) if c < 0]
+        if missing:
+            block[:, missing] = np.nan
+        return block
+
+    def frame(
+        self,
+        names: Optional[Sequence[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """선택한 시스템/변수로 DataFrame 생성 (index: 시스템 이름)"""
+        names = list(self._names) if names is None else list(names)
+        columns = self.columns if columns is None else list(columns)
+        return pd.DataFrame(self.values(names, columns), index=names, columns=columns, copy=False)
+
+    def rank(
+        self,
+        var: str,
+        names: Optional[Sequence[str]] = None,
+        descending: bool = True,
+    ) -> List[str]:
+        """출력 변수 값 순서로 정렬한 시스템 이름 (값이 없는 시스템은 맨 뒤, 같은 값은 원래 순서)"""
+        names = list(self._names) if names is None else list(names)
+        values = np.asarray(self.column(var, names), dtype=float)
+        keys = -values if descending else values
+        order = np.argsort(np.where(np.isnan(keys), np.inf, keys), kind='stable')
+        return [names[i] for i in order]
+
+    def row_bytes(self, names: Iterable[str]) -> bytes:
+        """선택한 시스템들의 결과 벡터를 바이트로 직렬화 (해시 키 계산용)"""
+        return np.ascontiguousarray(self.values(list(names))).tobytes()
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def _add_column(self, key: str) -> None:
+        j = len(self._columns)
+        if j >= self._data.shape[1]:
+            grown = np.full((self._data.shape[0], max(1, self._data.shape[1]) * 2), np.nan)
+            grown[:, :self._data.shape[1]] = self._data
+            self._data = grown
+        self._columns[key] = j
+
+    def _ensure_rows(self, n: int) -> None:
+        if n > self._data.shape[0]:
+            grown = np.full((max(n, self._data.shape[0] * 2), self._data.shape[1]), np.nan)
+            grown[:self._data.shape[0]] = self._data
+            self._data = grown
+
+
+def get_result_table(session_state: Any, names: Optional[Iterable[str]] = None) -> ResultTable:
+    """세션의 결과 테이블을 반환 (없으면 생성)
+
+    `names`를 지정하면 결과 테이블에 없는 시스템 중 평가 결과가 있는 시스템을 채워 넣습니다.
+
+    Parameters
+    ----------
+    session_state : Any
+        Streamlit session state
+    names : Iterable[str], optional
+        반드시 포함되어야 하는 시스템 이름
+
+    Returns
+    -------
+    ResultTable
+        세션의 결과 테이블
+    """
+    if 'result_table' not in session_state:
+        session_state['result_table'] = ResultTable()
+    table = session_state['result_table']
+    for name in names or ():
+        if name not in table:
+            system = session_state.systems.get(name, {})
+            if 'variables' in system:
+                table.upsert(name, system['type'], system['variables'])
+    return table
+
+
+def is_scalar(value: Any) -> bool:
+    """평가 결과 값이 스칼라 숫자인지 여부 (Python/numpy 정수와 실수, bool 제외)"""
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool)
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    if array.base is not None:
+        array = array.view()
+        array.flags.writeable = False
+    return array
@@ -0,0 +1,237 @@
+"""시나리오 저장/불러오기 모듈
+
+세션에 추가한 시스템 구성(비교 시나리오)을 작은 문자열이나 파일로 저장하고 한 번에 복원합니다.
+
+- 시스템마다 기본값과 다른 파라미터(delta)만 저장
+- 시나리오에는 형식 버전과 시스템 레지스트리 스키마 해시를 기록 (스키마가 바뀐 뒤 불러오면 경고)
+- URL 공유용 토큰: 압축(zlib) 후 base64url 인코딩하여 `st.query_params`에 저장
+- 토큰이 URL에 넣기에 너무 길면 JSON 파일로 저장 (`dump_scenario`/`load_scenario`)
+- 복원은 위젯을 하나씩 다시 입력하지 않고 session state를 한 번에 구성하며, 복원한 시스템은
+  다음 실행에서 `stale_systems`에 모두 포함되어 한 번의 배치로 평가됨
+
+Examples
+--------
+>>> from exergy_dashboard.scenario import export_scenario, encode_scenario, decode_scenario
+>>> token = encode_scenario(export_scenario(session_state, 'COOLING'))
+>>> names, warnings = restore_scenario(session_state, decode_scenario(token))
+>>> names
+['Air source heat pump 1', 'Ground source heat pump 1']
+"""
+
+import base64
+import copy
+import hashlib
+import json
+import zlib
+from typing import Any, Dict, IO, List, Optional, Tuple
+
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.system import get_systems
+
+
+# 시나리오 형식 버전 (형식이 바뀌면 증가)
+SCENARIO_VERSION = 1
+
+# 시나리오 토큰을 저장하는 query parameter 이름
+SCENARIO_QUERY_KEY = 'scenario'
+
+# URL에 넣을 최대 토큰 길이 (초과하면 파일로 저장)
+MAX_TOKEN_LENGTH = 1800
+
+# 압축을 푼 시나리오의 최대 크기 (bytes)
+MAX_SCENARIO_BYTES = 1 << 20
+
+
+def schema_hash(mode: str) -> str:
+    """모드에 등록된 시스템 타입과 파라미터 이름/기본값의 해시 (8자리 16진수)"""
+    systems = get_systems().get(mode.upper(), {})
+    schema = {
+        system_type: {key: parameter['default'] for key, parameter in config['parameters'].items()}
+        for system_type, config in systems.items()
+    }
+    text = json.dumps(schema, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(text.encode()).hexdigest()[:8]
+
+
+def export_scenario(session_state: Any, mode: str) -> Dict[str, Any]:
+    """세션의 시스템 구성을 시나리오로 변환
+
+    Parameters
+    ----------
+    session_state : Any
+        Streamlit session state
+    mode : str
+        시스템 모드
+
+    Returns
+    -------
+    Dict[str, Any]
+        {'v': 형식 버전, 'schema': 스키마 해시, 'mode': 모드,
+         'systems': [[시스템 타입, 번호, {파라미터: 값}], ...]}.
+        파라미터는 기본값과 다른 값만 포함
+    """
+    mode = mode.upper()
+    registered = get_systems().get(mode, {})
+    systems = []
+    for name, system in session_state.systems.items():
+        if system['type'] not in registered:
+            continue
+        deltas = {}
+        for key, parameter in registered[system['type']]['parameters'].items():
+            value = session_state.get(f'{name}:{key}', parameter['default'])
+            if value != parameter['default']:
+                deltas[key] = value
+        systems.append([system['type'], _system_number(name, system['type']), deltas])
+    return {'v': SCENARIO_VERSION, 'schema': schema_hash(mode), 'mode': mode, 'systems': systems}
+
+
+def encode_scenario(scenario: Dict[str, Any]) -> str:
+    """시나리오를 URL에 넣을 수 있는 토큰으로 변환 (JSON -> zlib -> base64url, '=' 제외)"""
+    text = json.dumps(scenario, separators=(',', ':'), ensure_ascii=False)
+    return base64.urlsafe_b64encode(zlib.compress(text.encode(), 9)).rstrip(b'=').decode('ascii')
+
+
+def decode_scenario(token: str) -> Dict[str, Any]:
+    """토큰을 시나리오로 변환
+
+    Raises
+    ------
+    ValueError
+        토큰이 올바른 시나리오가 아닌 경우
+    """
+    try:
+        data = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        decompressor = zlib.decompressobj()
+        text = decompressor.decompress(data, MAX_SCENARIO_BYTES)
+        if decompressor.unconsumed_tail:
+            raise ValueError('Scenario is too large')
+        scenario = json.loads(text)
+    except (ValueError, zlib.error) as e:
+        raise ValueError(f'Invalid scenario token: {e}') from e
+    return validate_scenario(scenario)
+
+
+def dump_scenario(scenario: Dict[str, Any], stream: Optional[IO[str]] = None) -> str:
+    """시나리오를 JSON 파일 형식으로 변환 (`stream`을 지정하면 기록)"""
+    text = json.dumps(scenario, indent=1, ensure_ascii=False)
+    if stream is not None:
+        stream.write(text)
+    return text
+
+
+def load_scenario(source: Any) -> Dict[str, Any]:
+    """JSON 파일(경로 또는 파일 객체)에서 시나리오를 읽음
+
+    Raises
+    ------
+    ValueError
+        올바른 시나리오 파일이 아닌 경우
+    """
+    if hasattr(source, 'read'):
+        text = source.read()
+    else:
+        with open(source, 'rb') as f:
+            text = f.read()
+    try:
+        scenario = json.loads(text)
+    except ValueError as e:
+        raise ValueError(f'Invalid scenario file: {e}') from e
+    return validate_scenario(scenario)
+
+
+def validate_scenario(scenario: Any) -> Dict[str, Any]:
+    """시나리오 구조를 확인
+
+    Raises
+    ------
+    ValueError
+        형식 버전이 다르거나 구조가 올바르지 않은 경우
+    """
+    if not isinstance(scenario, dict) or scenario.get('v') != SCENARIO_VERSION:
+        raise ValueError('Unsupported scenario version')
+    if not isinstance(scenario.get('mode'), str) or not isinstance(scenario.get('systems'), list):
+        raise ValueError('Invalid scenario')
+    for entry in scenario['systems']:
+        if (
+            not isinstance(entry, list) or len(entry) != 3
+            or not isinstance(entry[0], str) or not isinstance(entry[1], int)
+            or not isinstance(entry[2], dict)
+            or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in entry[2].values())
+        ):
+            raise ValueError('Invalid scenario')
+    return scenario
+
+
+def restore_scenario(session_state: Any, scenario: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+    """시나리오로 세션의 시스템 구성을 한 번에 교체
+
+    기존 시스템과 입력값, 결과 테이블을 지우고 시나리오의 시스템을 만든 뒤 모든 파라미터의
+    입력값을 session state에 기록합니다. 복원한 시스템은 평가 결과가 없으므로 다음 실행에서
+    한 번의 배치로 평가됩니다.
+
+    Parameters
+    ----------
+    session_state : Any
+        Streamlit session state
+    scenario : Dict[str, Any]
+        `validate_scenario`를 통과한 시나리오
+
+    Returns
+    -------
+    Tuple[List[str], List[str]]
+        (복원한 시스템 이름, 경고 메시지). 현재 스키마에 없는 시스템 타입이나 파라미터는
+        건너뛰고 경고에 기록
+
+    Raises
+    ------
+    ValueError
+        시나리오의 모드가 등록되어 있지 않은 경우
+    """
+    mode = scenario['mode'].upper()
+    registered = get_systems().get(mode)
+    if not registered:
+        raise ValueError(f"Unknown mode in scenario: {scenario['mode']}")
+
+    warnings = []
+    if scenario.get('schema') != schema_hash(mode):
+        warnings.append('The scenario was saved with a different system definition; defaults may have changed.')
+
+    # 기존 시스템의 입력값 제거
+    for name in list(session_state.systems):
+        for key in [k for k in session_state.keys() if isinstance(k, str) and (
+            k.startswith(f'{name}:') or k.startswith(f'draft:{name}:')
+        )]:
+            session_state.pop(key)
+    session_state.systems = {}
+    get_result_table(session_state).clear()
+
+    counts = {system_type: 0 for system_type in registered}
+    names = []
+    for system_type, number, deltas in scenario['systems']:
+        if system_type not in registered:
+            warnings.append(f'Unknown system type skipped: {system_type}')
+            continue
+        system = copy.deepcopy(registered[system_type])
+        name = f'{system_type} {number}'
+        if name in session_state.systems:
+            continue
+        system['name'] = name
+        system['type'] = system_type
+        unknown = sorted(set(deltas) - set(system['parameters']))
+        if unknown:
+            warnings.append(f"Unknown parameters skipped for {name}: {', '.join(unknown)}")
+        for key, parameter in system['parameters'].items():
+            session_state[f'{name}:{key}'] = deltas.get(key, parameter['default'])
+        session_state.systems[name] = system
+        counts[system_type] = max(counts[system_type], number)
+        names.append(name)
+
+    session_state.mode = mode.capitalize()
+    session_state.system_count = counts
+    return names, warnings
+
+
+def _system_number(name: str, system_type: str) -> int:
+    """'{system_type} {n}' 형식의 시스템 이름에서 번호 n"""
+    suffix = name[len(system_type):].strip()
+    return int(suffix) if suffix.isdigit() else 0
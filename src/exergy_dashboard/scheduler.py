@@ -0,0 +1,561 @@
+"""서버 전역 평가 스케줄러 모듈
+
+Streamlit은 각 세션의 스크립트 스레드에서 평가를 바로 실행하므로, 한 사용자가 무거운
+평가(예: GSHP)를 연속으로 요청하면 같은 레플리카의 다른 사용자가 모두 기다리게 됩니다.
+이 모듈은 모든 세션이 공유하는 스케줄러를 제공하여 평가 작업을 공정하게 분배합니다.
+
+주요 기능
+--------
+- CPU 코어 수에 맞춘 워커 스레드 풀
+- 세션별 공정 큐잉: 같은 우선순위 안에서는 세션 단위로 번갈아 가며 작업을 꺼냄
+- 우선순위: 대화형 단일 평가(INTERACTIVE) > 배치/스윕 작업(BATCH) > 선행 평가(PREFETCH)
+- 선행 평가는 워커 하나를 항상 비워 두고 실행하며(워커가 하나뿐이면 선행 평가를 하지 않음), 같은 입력의 실제 요청이 오면
+  해당 작업의 우선순위를 올리고, `cancel_pending`으로 취소할 수 있음
+- 제한된 큐: 전체/세션별 대기 작업 수를 넘으면 `SchedulerBusyError` 발생
+- 작업별 타임아웃: 기한 안에 시작되지 못한 작업은 실행하지 않고 `TimeoutError`로 종료
+- 평가 결과 캐시(`evaluation_cache`)와 동일 작업 병합(in-flight coalescing)
+
+사용 예시
+--------
+1. 단일 평가:
+    ```python
+    from exergy_dashboard.scheduler import scheduler
+
+    variables = scheduler.evaluate('COOLING', 'Air source heat pump', params)
+    ```
+
+2. 배치 평가 (배치 우선순위, 제출 창 크기만큼만 큐에 올림):
+    ```python
+    from exergy_dashboard.scheduler import scheduler
+
+    results = scheduler.evaluate_batch('COOLING', 'Air source heat pump', params_list)
+    ```
+
+참고사항
+-------
+- 과부하 시 직전 결과로 대체하는 처리는 `evaluation.evaluate_systems`에서 수행합니다.
+- 워커는 스레드이므로 이미 실행 중인 작업은 중단할 수 없습니다. 타임아웃이 지나도
+  실행 중인 작업은 끝까지 수행되며, 그 결과는 캐시에 저장되어 다음 요청에 재사용됩니다.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Callable, Deque, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from exergy_dashboard.evaluation import (
+    EvaluationCache,
+    EvaluationRegistry,
+    evaluation_cache,
+    registry,
+)
+
+
+# 기본 설정값
+DEFAULT_MAX_QUEUE_SIZE = 256
+DEFAULT_MAX_PENDING_PER_SESSION = 64
+DEFAULT_TIMEOUT = 30.0
+
+# 평가 소요 시간 기록이 없는 시스템 타입의 예상 소요 시간 [s]
+DEFAULT_DURATION_ESTIMATE = 0.5
+
+# 평가 소요 시간 지수 이동 평균의 가중치 (최근 값의 비중)
+DURATION_SMOOTHING = 0.3
+
+# 세션 정보가 없는 호출(스크립트, 노트북 등)에 사용하는 세션 ID
+DEFAULT_SESSION_ID = 'default'
+
+
+class Priority(IntEnum):
+    """작업 우선순위 (값이 작을수록 먼저 처리)"""
+    INTERACTIVE = 0
+    BATCH = 1
+    PREFETCH = 2
+
+
+class SchedulerBusyError(RuntimeError):
+    """대기 큐가 가득 차서 작업을 받을 수 없을 때 발생하는 예외"""
+
+
+def current_session_id() -> str:
+    """현재 Streamlit 세션 ID를 반환 (Streamlit 밖에서는 기본 ID)"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+    except ImportError:
+        return DEFAULT_SESSION_ID
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return ctx.session_id if ctx is not None else DEFAULT_SESSION_ID
+
+
+class _Job:
+    """스케줄러 내부 작업 단위"""
+    __slots__ = (
+        'func', 'args', 'kwargs', 'session_id', 'priority', 'deadline', 'future', 'key', 'started',
+    )
+
+    def __init__(self, func, args, kwargs, session_id, priority, deadline, key):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.session_id = session_id
+        self.priority = priority
+        self.deadline = deadline
+        self.future = Future()
+        self.key = key
+        self.started = False
+
+
+class EvaluationScheduler:
+    """세션 간 공정성과 우선순위를 보장하는 공유 워커 풀
+
+    Parameters
+    ----------
+    evaluator : EvaluationRegistry, optional
+        평가 함수 레지스트리 (기본값: 전역 레지스트리)
+    cache : EvaluationCache, optional
+        평가 결과 캐시 (기본값: 전역 캐시)
+    max_workers : int, optional
+        워커 스레드 수 (기본값: CPU 코어 수)
+    max_queue_size : int, default 256
+        전체 대기 작업 수 상한
+    max_pending_per_session : int, default 64
+        세션별 대기 작업 수 상한
+    default_timeout : float, default 30.0
+        작업별 기본 타임아웃 [s]
+    """
+
+    def __init__(
+        self,
+        evaluator: Optional[EvaluationRegistry] = None,
+        cache: Optional[EvaluationCache] = None,
+        max_workers: Optional[int] = None,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        max_pending_per_session: int = DEFAULT_MAX_PENDING_PER_SESSION,
+        default_timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.evaluator = evaluator if evaluator is not None else registry
+        self.cache = cache if cache is not None else evaluation_cache
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_queue_size = max_queue_size
+        self.max_pending_per_session = max_pending_per_session
+        self.default_timeout = default_timeout
+
+        # 우선순위별로 세션 -> 작업 큐를 라운드 로빈 순서(OrderedDict)로 관리
+        self._queues: Dict[Priority, "OrderedDict[str, Deque[_Job]]"] = {
+            p: OrderedDict() for p in Priority
+        }
+        self._pending = 0
+        self._pending_by_session: Dict[str, int] = {}
+        self._inflight: Dict[Hashable, _Job] = {}
+        # 선행 평가는 실제 요청을 위해 워커 하나를 남겨 둠 (워커가 하나뿐이면 선행 평가를 하지 않음)
+        self._prefetch_slots = self.max_workers - 1
+        self._running_prefetch = 0
+        self._cond = threading.Condition()
+        self._workers: List[threading.Thread] = []
+        self._shutdown = False
+        # (모드, 시스템 타입)별 평가 소요 시간의 지수 이동 평균 [s]
+        self._durations: Dict[Tuple[str, str], float] = {}
+
+    # ------------------------------------------------------------------
+    # 작업 제출
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        func: Callable,
+        *args: Any,
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """임의의 함수를 작업으로 제출
+
+        Parameters
+        ----------
+        func : Callable
+            워커에서 실행할 함수
+        session_id : str, optional
+            작업을 요청한 세션 ID (기본값: 현재 Streamlit 세션)
+        priority : Priority, default Priority.INTERACTIVE
+            작업 우선순위
+        timeout : float, optional
+            작업이 시작되어야 하는 기한 [s] (기본값: `default_timeout`)
+
+        Returns
+        -------
+        Future
+            작업 결과를 담을 Future
+
+        Raises
+        ------
+        SchedulerBusyError
+            전체 또는 세션별 대기 큐가 가득 찬 경우
+        """
+        return self._enqueue(func, args, kwargs, session_id, priority, timeout, key=None)
+
+    def submit_evaluation(
+        self,
+        mode: str,
+        system_type: str,
+        params: Dict[str, float],
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """평가 작업을 제출
+
+        캐시에 결과가 있으면 즉시 완료된 Future를 반환하고, 같은 입력의 평가가 이미
+        대기 중이거나 실행 중이면 해당 Future를 공유합니다. 대기 중인 작업이 더 낮은
+        우선순위(예: 선행 평가)라면 요청한 우선순위로 올립니다.
+
+        Parameters
+        ----------
+        mode : str
+            시스템 모드
+        system_type : str
+            시스템 타입
+        params : Dict[str, float]
+            평가에 필요한 파라미터들
+        session_id : str, optional
+            작업을 요청한 세션 ID
+        priority : Priority, default Priority.INTERACTIVE
+            작업 우선순위
+        timeout : float, optional
+            작업이 시작되어야 하는 기한 [s]
+
+        Returns
+        -------
+        Future
+            계산된 변수들을 담을 Future
+        """
+        key = self.cache.make_key(mode, system_type, params)
+        cached = self.cache.get(key)
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+
+        return self._enqueue(
+            self._evaluate, (mode, system_type, dict(params), key), {},
+            session_id, priority, timeout, key=key,
+        )
+
+    def evaluate(
+        self,
+        mode: str,
+        system_type: str,
+        params: Dict[str, float],
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.INTERACTIVE,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """평가 작업을 제출하고 결과를 기다림
+
+        Raises
+        ------
+        SchedulerBusyError
+            대기 큐가 가득 찬 경우
+        TimeoutError
+            기한 안에 결과를 얻지 못한 경우
+        """
+        timeout = self.default_timeout if timeout is None else timeout
+        future = self.submit_evaluation(mode, system_type, params, session_id, priority, timeout)
+        return future.result(timeout=timeout)
+
+    def iter_evaluate(
+        self,
+        mode: str,
+        system_type: str,
+        params_list: Iterable[Dict[str, float]],
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.BATCH,
+        timeout: Optional[float] = None,
+        window: Optional[int] = None,
+    ) -> Iterator[Union[Dict[str, Any], Exception]]:
+        """여러 파라미터 세트를 평가하며 입력 순서대로 결과를 하나씩 반환
+
+        한 번에 최대 `window`개의 작업만 큐에 올려 배치가 큐 전체를 차지하지 않도록 합니다.
+        실패한 항목은 예외 객체를 반환합니다.
+
+        Parameters
+        ----------
+        window : int, optional
+            동시에 제출해 둘 작업 수 (기본값: 워커 수의 2배)
+        """
+        session_id = session_id or current_session_id()
+        window = window or self.max_workers * 2
+        pending: Deque[Future] = deque()
+        params_iter = iter(params_list)
+
+        def fill():
+            while len(pending) < window:
+                params = next(params_iter, None)
+                if params is None:
+                    return
+                try:
+                    pending.append(self.submit_evaluation(
+                        mode, system_type, params, session_id, priority, timeout
+                    ))
+                except SchedulerBusyError as e:
+                    failed = Future()
+                    failed.set_exception(e)
+                    pending.append(failed)
+
+        fill()
+        while pending:
+            future = pending.popleft()
+            try:
+                yield future.result()
+            except Exception as e:
+                yield e
+            fill()
+
+    def evaluate_batch(
+        self,
+        mode: str,
+        system_type: str,
+        params_list: Iterable[Dict[str, float]],
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.BATCH,
+        timeout: Optional[float] = None,
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """여러 파라미터 세트를 배치 우선순위로 평가 (`iter_evaluate`의 리스트 버전)"""
+        return list(self.iter_evaluate(
+            mode, system_type, params_list, session_id, priority, timeout
+        ))
+
+    # ------------------------------------------------------------------
+    # 상태 조회 및 종료
+    # ------------------------------------------------------------------
+    @property
+    def pending(self) -> int:
+        """대기 중인 작업 수"""
+        with self._cond:
+            return self._pending
+
+    @property
+    def prefetch_enabled(self) -> bool:
+        """선행 평가를 실행할 수 있는지 여부 (워커가 둘 이상일 때만)"""
+        return self._prefetch_slots > 0
+
+    def cancel_pending(
+        self,
+        session_id: Optional[str] = None,
+        priority: Priority = Priority.PREFETCH,
+    ) -> int:
+        """아직 시작되지 않은 작업을 취소
+
+        Parameters
+        ----------
+        session_id : str, optional
+            취소할 세션 ID (기본값: 모든 세션)
+        priority : Priority, default Priority.PREFETCH
+            취소할 작업의 우선순위
+
+        Returns
+        -------
+        int
+            취소된 작업 수
+        """
+        cancelled = 0
+        with self._cond:
+            queue = self._queues[Priority(priority)]
+            session_ids = [session_id] if session_id is not None else list(queue)
+            for sid in session_ids:
+                for job in queue.pop(sid, ()):
+                    self._release(job)
+                    if job.key is not None and self._inflight.get(job.key) is job:
+                        del self._inflight[job.key]
+                    job.future.cancel()
+                    cancelled += 1
+        return cancelled
+
+    def shutdown(self, wait: bool = True) -> None:
+        """새 작업을 받지 않고 워커를 종료 (대기 중인 작업은 모두 처리)"""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+    def expected_duration(self, mode: str, system_type: str) -> float:
+        """최근 평가 소요 시간의 지수 이동 평균 [s] (기록이 없으면 `DEFAULT_DURATION_ESTIMATE`)"""
+        with self._cond:
+            return self._durations.get((mode, system_type), DEFAULT_DURATION_ESTIMATE)
+
+    def estimate_cost(
+        self,
+        mode: str,
+        requests: Iterable[Tuple[str, Dict[str, float]]],
+    ) -> Tuple[int, float]:
+        """평가 요청들을 제출했을 때의 예상 비용
+
+        Parameters
+        ----------
+        mode : str
+            시스템 모드
+        requests : Iterable[Tuple[str, Dict[str, float]]]
+            (시스템 타입, 파라미터) 목록
+
+        Returns
+        -------
+        Tuple[int, float]
+            (캐시에 없어 실제로 평가할 요청 수, 예상 소요 시간 [s]).
+            소요 시간은 타입별 평균 시간의 합을 워커 수로 나눈 값(가장 긴 평가 시간 이상)
+        """
+        durations = [
+            self.expected_duration(mode, system_type)
+            for system_type, params in requests
+            if self.cache.make_key(mode, system_type, params) not in self.cache
+        ]
+        if not durations:
+            return 0, 0.0
+        return len(durations), max(max(durations), sum(durations) / self.max_workers)
+
+    def _evaluate(self, mode: str, system_type: str, params: Dict[str, float], key: Hashable):
+        start = time.perf_counter()
+        variables = self.evaluator.evaluate(mode, system_type, params)
+        elapsed = time.perf_counter() - start
+        self.cache.put(key, variables)
+        with self._cond:
+            previous = self._durations.get((mode, system_type))
+            self._durations[(mode, system_type)] = elapsed if previous is None else (
+                DURATION_SMOOTHING * elapsed + (1 - DURATION_SMOOTHING) * previous
+            )
+        return variables
+
+    def _enqueue(self, func, args, kwargs, session_id, priority, timeout, key) -> Future:
+        session_id = session_id or current_session_id()
+        timeout = self.default_timeout if timeout is None else timeout
+        job = _Job(func, args, kwargs, session_id, Priority(priority),
+                   time.monotonic() + timeout, key)
+
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError('Scheduler has been shut down')
+            if job.priority == Priority.PREFETCH and not self._prefetch_slots:
+                raise SchedulerBusyError('Prefetch is disabled with a single worker')
+            existing = self._inflight.get(key) if key is not None else None
+            if existing is not None:
+                if not existing.started and job.priority < existing.priority:
+                    self._promote(existing, job)
+                return existing.future
+            if self._pending >= self.max_queue_size:
+                raise SchedulerBusyError(
+                    f'Evaluation queue is full ({self._pending} pending jobs)'
+                )
+            if self._pending_by_session.get(session_id, 0) >= self.max_pending_per_session:
+                raise SchedulerBusyError(
+                    f"Too many pending jobs for session '{session_id}'"
+                )
+
+            self._push(job)
+            if key is not None:
+                self._inflight[key] = job
+
+            self._ensure_workers()
+            self._cond.notify()
+        return job.future
+
+    def _push(self, job: _Job) -> None:
+        queue = self._queues[job.priority]
+        if job.session_id not in queue:
+            queue[job.session_id] = deque()
+        queue[job.session_id].append(job)
+        self._pending += 1
+        self._pending_by_session[job.session_id] = self._pending_by_session.get(job.session_id, 0) + 1
+
+    def _release(self, job: _Job) -> None:
+        # 대기 작업 수 집계에서 작업을 제외
+        self._pending -= 1
+        remaining = self._pending_by_session[job.session_id] - 1
+        if remaining:
+            self._pending_by_session[job.session_id] = remaining
+        else:
+            del self._pending_by_session[job.session_id]
+
+    def _promote(self, existing: _Job, request: _Job) -> None:
+        # 대기 중인 작업을 요청한 세션/우선순위의 큐로 옮김
+        queue = self._queues[existing.priority]
+        jobs = queue[existing.session_id]
+        jobs.remove(existing)
+        if not jobs:
+            del queue[existing.session_id]
+        self._release(existing)
+        existing.priority = request.priority
+        existing.session_id = request.session_id
+        existing.deadline = max(existing.deadline, request.deadline)
+        self._push(existing)
+
+    def _ensure_workers(self) -> None:
+        # 처음 작업이 들어올 때 워커를 시작 (임포트만으로 스레드를 만들지 않음)
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                name=f'exergy-scheduler-{len(self._workers)}',
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _next_job(self) -> Optional[_Job]:
+        # 높은 우선순위부터, 같은 우선순위 안에서는 세션 라운드 로빈
+        for priority in Priority:
+            queue = self._queues[priority]
+            if not queue:
+                continue
+            if priority == Priority.PREFETCH and self._running_prefetch >= self._prefetch_slots:
+                return None
+            session_id, jobs = queue.popitem(last=False)
+            job = jobs.popleft()
+            if jobs:
+                queue[session_id] = jobs  # 큐의 맨 뒤로 보내 다른 세션에 차례를 넘김
+            self._release(job)
+            job.started = True
+            if priority == Priority.PREFETCH:
+                self._running_prefetch += 1
+            return job
+        return None
+
+    def _worker_loop(self) -> None:
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._shutdown:
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+            self._run(job)
+
+    def _run(self, job: _Job) -> None:
+        try:
+            if not job.future.set_running_or_notify_cancel():
+                return
+            if time.monotonic() > job.deadline:
+                job.future.set_exception(TimeoutError('Job expired before it could start'))
+                return
+            try:
+                result = job.func(*job.args, **job.kwargs)
+            except BaseException as e:
+                job.future.set_exception(e)
+            else:
+                job.future.set_result(result)
+        finally:
+            with self._cond:
+                if job.key is not None and self._inflight.get(job.key) is job:
+                    del self._inflight[job.key]
+                if job.priority == Priority.PREFETCH:
+                    self._running_prefetch -= 1
+                    self._cond.notify()
+
+
+# 전역 스케줄러 인스턴스 생성 (모든 세션이 공유)
+scheduler = EvaluationScheduler()
@@ -0,0 +1,201 @@
+"""외부 세션 저장소 모듈
+
+사용자별 시스템 구성과 입력값을 Streamlit 서버 메모리 밖에 저장하여, 로드 밸런서가 다른
+replica로 연결하거나 replica가 재시작되어도 같은 상태로 이어서 사용할 수 있게 합니다.
+
+- 저장 내용: 시나리오(`exergy_dashboard.scenario`, 기본값과 다른 입력값만)와 표시 중인 시스템 선택
+- 세션 키는 URL의 query parameter('sid')에 기록. 새 세션이 시작될 때마다 저장된 상태를 읽은 뒤
+  새 키를 발급하므로(copy-on-load), URL을 공유하거나 여러 탭에서 열어도 서로 덮어쓰지 않음
+- 저장소는 환경 변수 `EXERGY_SESSION_STORE`로 선택
+    - 'sqlite:///경로' (기본값: 'sqlite:///.sessions/sessions.sqlite3', 같은 호스트의 replica끼리 공유)
+    - 'redis://호스트:포트/DB' (여러 호스트의 replica가 공유, `redis` 패키지 필요)
+    - 'none' (저장하지 않음)
+
+Examples
+--------
+>>> from exergy_dashboard.session_store import create_store
+>>> store = create_store('sqlite:///sessions.sqlite3')
+>>> store.save('abc', {'scenario': scenario, 'selected': ['ASHP 1']})
+>>> store.load('abc')['selected']
+['ASHP 1']
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from typing import Any, Dict, Optional
+
+
+# 저장소 URL을 지정하는 환경 변수와 기본값
+STORE_ENV = 'EXERGY_SESSION_STORE'
+DEFAULT_STORE_URL = 'sqlite:///.sessions/sessions.sqlite3'
+
+# 세션 키를 저장하는 query parameter 이름
+SESSION_QUERY_KEY = 'sid'
+
+# 마지막 저장 후 이 시간(초)이 지난 세션은 삭제
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+
+def new_session_key() -> str:
+    """새 세션 키 (추측할 수 없는 32자리 16진수)"""
+    return uuid.uuid4().hex
+
+
+class SessionStore:
+    """세션 상태 저장소 기본 클래스
+
+    하위 클래스는 bytes 단위의 `get`, `put`, `delete`를 구현합니다. `load`/`save`는 상태를
+    JSON + zlib으로 변환하고, 저장소 오류가 앱을 멈추지 않도록 예외를 기록만 합니다.
+    """
+
+    def __init__(self, max_age: float = DEFAULT_MAX_AGE):
+        self.max_age = max_age
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def put(self, key: str, data: bytes) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """저장된 세션 상태 (없거나 읽을 수 없으면 None)"""
+        try:
+            data = self.get(key)
+            return json.loads(zlib.decompress(data)) if data is not None else None
+        except Exception as e:
+            print(f"Error loading session {key}: {e}")
+            return None
+
+    def save(self, key: str, state: Dict[str, Any]) -> None:
+        """세션 상태 저장"""
+        try:
+            self.put(key, zlib.compress(json.dumps(state, separators=(',', ':')).encode()))
+        except Exception as e:
+            print(f"Error saving session {key}: {e}")
+
+
+class NullSessionStore(SessionStore):
+    """아무것도 저장하지 않는 저장소 ('none')"""
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def put(self, key: str, data: bytes) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite 파일 세션 저장소
+
+    같은 파일을 쓰는 여러 프로세스(같은 호스트의 replica)가 함께 사용할 수 있도록 WAL 모드로
+    엽니다. 처음 연결할 때 `max_age`가 지난 세션을 삭제합니다.
+    """
+
+    def __init__(self, path: str, max_age: float = DEFAULT_MAX_AGE):
+        super().__init__(max_age)
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5.0, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sessions (key TEXT PRIMARY KEY, data BLOB, updated REAL)'
+            )
+            conn.execute('DELETE FROM sessions WHERE updated < ?', (time.time() - self.max_age,))
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT data FROM sessions WHERE key = ? AND updated >= ?',
+                (key, time.time() - self.max_age),
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._connect().execute(
+                'INSERT OR REPLACE INTO sessions (key, data, updated) VALUES (?, ?, ?)',
+                (key, data, time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute('DELETE FROM sessions WHERE key = ?', (key,))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class RedisSessionStore(SessionStore):
+    """Redis 세션 저장소 (만료는 Redis TTL로 처리)
+
+    Redis 프로토콜을 지원하는 로컬 대체 서버(Valkey, KeyDB 등)도 사용할 수 있습니다.
+    """
+
+    def __init__(self, url: str, max_age: float = DEFAULT_MAX_AGE, prefix: str = 'exergy:session:'):
+        super().__init__(max_age)
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("RedisSessionStore requires the 'redis' package (pip install redis)") from e
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.prefix + key)
+
+    def put(self, key: str, data: bytes) -> None:
+        self._client.set(self.prefix + key, data, ex=int(self.max_age))
+
+    def delete(self, key: str) -> None:
+        self._client.delete(self.prefix + key)
+
+
+def create_store(url: Optional[str] = None) -> SessionStore:
+    """저장소 URL로 세션 저장소 생성
+
+    Parameters
+    ----------
+    url : str, optional
+        'sqlite:///경로', 'redis://...', 'rediss://...' 또는 'none'
+        (기본값: 환경 변수 `EXERGY_SESSION_STORE`, 없으면 `DEFAULT_STORE_URL`)
+
+    Raises
+    ------
+    ValueError
+        지원하지 않는 URL인 경우
+    """
+    url = url or os.environ.get(STORE_ENV) or DEFAULT_STORE_URL
+    if url == 'none':
+        return NullSessionStore()
+    if url.startswith('sqlite:///'):
+        return SQLiteSessionStore(url[len('sqlite:///'):])
+    if url.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisSessionStore(url)
+    raise ValueError(f'Unsupported session store: {url}')
+
+
+# 전역 세션 저장소 (연결은 처음 사용할 때 생성)
+session_store = create_store()
@@ -0,0 +1,471 @@
+"""Surrogate 모델 모듈
+
+엑서지 평가(`enex_analysis`)는 시스템에 따라 수백 ms 이상 걸릴 수 있습니다. 이 모듈은
+(모드, 시스템 타입)마다 작은 근사 모델을 학습해 두었다가, 정확한 평가가 끝나기 전에
+근사 결과를 즉시 보여줄 수 있게 합니다.
+
+모델
+----
+- 각 파라미터를 학습 범위 기준으로 [-1, 1]에 정규화한 뒤, 전체 차수(total degree)가
+  `degree` 이하인 르장드르 다항식 곱을 기저로 하는 다항식 카오스 전개(PCE)
+- 모든 스칼라 출력 변수(X_eff, X_c_* 등)를 하나의 최소제곱(리지) 문제로 동시에 학습
+- 학습 데이터는 파라미터 'range' 안(의존 범위 포함)에서 무작위로 추출한 점을
+  스케줄러의 배치 평가로 계산하여 만듦
+- 검증 세트의 X_eff 최대 절대 오차를 오차 한계(`error_bound`)로 함께 저장
+
+모델 파일은 `.npz` 하나(수십 KB)이며, 이미지 빌드 단계(Dockerfile)에서 학습하여 `surrogates/` 폴더에
+검증 오차 표(`VALIDATION_REPORT`)와 함께 저장되므로 이미지와 함께 배포됩니다.
+
+사용 예시
+--------
+1. 학습 (명령행):
+    ```bash
+    python -m exergy_dashboard.surrogate --systems-dir systems --out surrogates
+    ```
+
+2. 예측:
+    ```python
+    from exergy_dashboard.surrogate import surrogates
+
+    surrogates.load_directory('surrogates')
+    estimate = surrogates.predict('COOLING', 'Air source heat pump', params)
+    ```
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import sys
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from exergy_dashboard.results import is_scalar
+from exergy_dashboard.scheduler import EvaluationScheduler, scheduler as default_scheduler
+from exergy_dashboard.system import get_systems, resolve_range
+
+
+# 학습 범위를 조금 벗어난 입력까지는 허용 (정규화 좌표 기준)
+DOMAIN_TOLERANCE = 0.05
+
+# 학습 명령이 모델 폴더에 저장하는 검증 오차 표
+VALIDATION_REPORT = 'VALIDATION.txt'
+
+
+class SurrogateModel:
+    """다항식 카오스 전개 기반 다출력 근사 모델
+
+    Parameters
+    ----------
+    mode : str
+        시스템 모드
+    system_type : str
+        시스템 타입
+    param_names : Sequence[str]
+        입력 파라미터 이름 (순서 고정)
+    lower, upper : np.ndarray
+        파라미터별 학습 범위
+    exponents : np.ndarray
+        (n_terms, n_params) 다중 지수
+    outputs : Sequence[str]
+        출력 변수 이름
+    coef : np.ndarray
+        (n_terms, n_outputs) 계수
+    validation : Dict[str, Dict[str, float]], optional
+        출력별 검증 오차 {'rmse': ..., 'max_abs': ...}
+    n_train : int, default 0
+        학습에 사용한 표본 수
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        system_type: str,
+        param_names: Sequence[str],
+        lower: np.ndarray,
+        upper: np.ndarray,
+        exponents: np.ndarray,
+        outputs: Sequence[str],
+        coef: np.ndarray,
+        validation: Optional[Dict[str, Dict[str, float]]] = None,
+        n_train: int = 0,
+    ):
+        self.mode = mode
+        self.system_type = system_type
+        self.param_names = list(param_names)
+        self.lower = np.asarray(lower, dtype=float)
+        self.upper = np.asarray(upper, dtype=float)
+        self.exponents = np.asarray(exponents, dtype=int)
+        self.outputs = list(outputs)
+        self.coef = np.asarray(coef, dtype=float)
+        self.validation = validation or {}
+        self.n_train = n_train
+
+    @property
+    def degree(self) -> int:
+        return int(self.exponents.sum(axis=1).max()) if len(self.exponents) else 0
+
+    @property
+    def error_bound(self) -> Optional[float]:
+        """검증 세트에서의 X_eff 최대 절대 오차 (없으면 None)"""
+        return self.validation.get('X_eff', {}).get('max_abs')
+
+    def normalize(self, X: np.ndarray) -> np.ndarray:
+        """파라미터를 학습 범위 기준 [-1, 1]로 정규화"""
+        span = np.where(self.upper > self.lower, self.upper - self.lower, 1.0)
+        return 2.0 * (X - self.lower) / span - 1.0
+
+    def in_domain(self, params: Dict[str, float]) -> bool:
+        """입력이 학습 범위 안에 있는지 확인"""
+        try:
+            z = self.normalize(self._to_array([params]))
+        except KeyError:
+            return False
+        return bool(np.all(np.abs(z) <= 1.0 + DOMAIN_TOLERANCE))
+
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """(n, n_params) 입력에 대한 (n, n_outputs) 예측"""
+        return _design_matrix(self.normalize(X), self.exponents) @ self.coef
+
+    def predict(self, params: Dict[str, float]) -> Dict[str, float]:
+        """파라미터 세트 하나에 대한 출력 변수 예측"""
+        y = self.predict_array(self._to_array([params]))[0]
+        return dict(zip(self.outputs, y.tolist()))
+
+    def save(self, path: str) -> None:
+        """모델을 `.npz` 파일로 저장"""
+        meta = {
+            'mode': self.mode,
+            'system_type': self.system_type,
+            'param_names': self.param_names,
+            'outputs': self.outputs,
+            'validation': self.validation,
+            'n_train': self.n_train,
+        }
+        np.savez_compressed(
+            path,
+            meta=np.array(json.dumps(meta)),
+            lower=self.lower,
+            upper=self.upper,
+            exponents=self.exponents,
+            coef=self.coef,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> 'SurrogateModel':
+        """`.npz` 파일에서 모델을 불러옴"""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            return cls(
+                mode=meta['mode'],
+                system_type=meta['system_type'],
+                param_names=meta['param_names'],
+                lower=data['lower'],
+                upper=data['upper'],
+                exponents=data['exponents'],
+                outputs=meta['outputs'],
+                coef=data['coef'],
+                validation=meta.get('validation'),
+                n_train=meta.get('n_train', 0),
+            )
+
+    def _to_array(self, params_list: List[Dict[str, float]]) -> np.ndarray:
+        return np.array(
+            [[float(p[name]) for name in self.param_names] for p in params_list],
+            dtype=float,
+        )
+
+
+class SurrogateRegistry:
+    """(모드, 시스템 타입)별 surrogate 모델 레지스트리"""
+
+    def __init__(self):
+        self._models: Dict[Tuple[str, str], SurrogateModel] = {}
+        self._loaded_files: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def register(self, model: SurrogateModel) -> None:
+        """모델을 등록 (같은 모드/타입의 기존 모델은 교체)"""
+        with self._lock:
+            self._models[(model.mode, model.system_type)] = model
+
+    def get(self, mode: str, system_type: str) -> Optional[SurrogateModel]:
+        """등록된 모델을 반환하고, 없으면 None을 반환"""
+        return self._models.get((mode.upper(), system_type))
+
+    def predict(
+        self,
+        mode: str,
+        system_type: str,
+        params: Dict[str, float],
+    ) -> Optional[Dict[str, float]]:
+        """근사 결과를 반환. 모델이 없거나 입력이 학습 범위를 벗어나면 None"""
+        model = self.get(mode, system_type)
+        if model is None or not model.in_domain(params):
+            return None
+        return model.predict(params)
+
+    def load_directory(self, directory: str) -> int:
+        """폴더 안의 `.npz` 모델을 불러옴 (변경되지 않은 파일은 건너뜀)
+
+        Returns
+        -------
+        int
+            새로 불러온 모델 수
+        """
+        if not os.path.isdir(directory):
+            return 0
+        loaded = 0
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.npz'):
+                continue
+            path = os.path.join(directory, name)
+            mtime = os.path.getmtime(path)
+            if self._loaded_files.get(path) == mtime:
+                continue
+            try:
+                self.register(SurrogateModel.load(path))
+            except Exception as e:
+                print(f"Error loading surrogate model {path}: {e}")
+                continue
+            self._loaded_files[path] = mtime
+            loaded += 1
+        return loaded
+
+    def __len__(self) -> int:
+        return len(self._models)
+
+
+# 전역 surrogate 레지스트리 인스턴스 생성
+surrogates = SurrogateRegistry()
+
+
+# ----------------------------------------------------------------------
+# 학습
+# ----------------------------------------------------------------------
+def sample_parameters(
+    parameters: Dict[str, Dict[str, Any]],
+    rng: np.random.Generator,
+    max_tries: int = 100,
+) -> Optional[Dict[str, float]]:
+    """파라미터 범위 안에서 무작위 파라미터 세트를 하나 추출
+
+    다른 파라미터를 참조하는 범위(예: 'T_0 - 1.0')는 참조 대상이 정해진 뒤에 계산합니다.
+    범위가 비어 있는 조합이 나오면 다시 추출하며, `max_tries` 번 실패하면 None을 반환합니다.
+    """
+    for _ in range(max_tries):
+        values: Dict[str, float] = {}
+        remaining = dict(parameters)
+        feasible = True
+        while remaining and feasible:
+            progressed = False
+            for name, spec in list(remaining.items()):
+                try:
+                    low, high = resolve_range(spec, values)
+                except NameError:
+                    continue
+                if low > high:
+                    feasible = False
+                    break
+                values[name] = float(rng.uniform(low, high)) if high > low else low
+                del remaining[name]
+                progressed = True
+            if not progressed:
+                # 순환 참조 등으로 범위를 정할 수 없는 파라미터는 기본값 사용
+                for name, spec in remaining.items():
+                    values[name] = float(spec['default'])
+                remaining = {}
+        if feasible:
+            return values
+    return None
+
+
+def train_surrogate(
+    mode: str,
+    system_type: str,
+    n_samples: int = 500,
+    degree: int = 2,
+    validation_fraction: float = 0.2,
+    ridge: float = 1e-8,
+    seed: int = 0,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> SurrogateModel:
+    """등록된 평가 함수로 학습 데이터를 만들고 surrogate 모델을 학습
+
+    Parameters
+    ----------
+    mode : str
+        시스템 모드
+    system_type : str
+        시스템 타입
+    n_samples : int, default 500
+        추출할 표본 수 (평가에 실패한 표본은 제외됨)
+    degree : int, default 2
+        다항식 전체 차수
+    validation_fraction : float, default 0.2
+        검증에 사용할 표본 비율
+    ridge : float, default 1e-8
+        리지 정규화 계수 (기저 수 대비 표본이 적을 때 안정화)
+    seed : int, default 0
+        난수 시드
+    scheduler : EvaluationScheduler, optional
+        배치 평가에 사용할 스케줄러 (기본값: 전역 스케줄러)
+
+    Returns
+    -------
+    SurrogateModel
+        학습된 모델 (검증 오차 포함)
+    """
+    mode = mode.upper()
+    scheduler = scheduler or default_scheduler
+    parameters = get_systems()[mode][system_type]['parameters']
+    param_names = list(parameters.keys())
+    rng = np.random.default_rng(seed)
+
+    samples = [p for p in (sample_parameters(parameters, rng) for _ in range(n_samples)) if p]
+    X_rows, y_rows, outputs = [], [], None
+    for params, result in zip(samples, scheduler.iter_evaluate(mode, system_type, samples)):
+        if isinstance(result, Exception):
+            continue
+        if outputs is None:
+            outputs = sorted(k for k, v in result.items() if is_scalar(v))
+        try:
+            y = [float(result[k]) for k in outputs]
+        except (KeyError, TypeError, ValueError):
+            continue
+        if not np.all(np.isfinite(y)):
+            continue
+        X_rows.append([params[name] for name in param_names])
+        y_rows.append(y)
+
+    if outputs is None or len(X_rows) < 2:
+        raise ValueError(f"Not enough successful evaluations to train '{mode}/{system_type}'")
+
+    X = np.array(X_rows, dtype=float)
+    Y = np.array(y_rows, dtype=float)
+    exponents = _total_degree_exponents(len(param_names), degree)
+
+    n_valid = int(len(X) * validation_fraction)
+    order = rng.permutation(len(X))
+    valid_idx, train_idx = order[:n_valid], order[n_valid:]
+
+    model = SurrogateModel(
+        mode, system_type, param_names,
+        lower=X[train_idx].min(axis=0),
+        upper=X[train_idx].max(axis=0),
+        exponents=exponents,
+        outputs=outputs,
+        coef=np.zeros((len(exponents), len(outputs))),
+        n_train=len(train_idx),
+    )
+    A = _design_matrix(model.normalize(X[train_idx]), exponents)
+    gram = A.T @ A + ridge * len(train_idx) * np.eye(A.shape[1])
+    model.coef = np.linalg.solve(gram, A.T @ Y[train_idx])
+
+    if n_valid:
+        err = model.predict_array(X[valid_idx]) - Y[valid_idx]
+        model.validation = {
+            name: {
+                'rmse': float(np.sqrt(np.mean(err[:, j] ** 2))),
+                'max_abs': float(np.max(np.abs(err[:, j]))),
+            }
+            for j, name in enumerate(outputs)
+        }
+    return model
+
+
+def model_filename(mode: str, system_type: str) -> str:
+    """모델 파일 이름 (예: 'cooling__air_source_heat_pump.npz')"""
+    def slug(text):
+        return re.sub(r'[^0-9a-z]+', '_', text.lower()).strip('_')
+    return f'{slug(mode)}__{slug(system_type)}.npz'
+
+
+def _total_degree_exponents(n_params: int, degree: int) -> np.ndarray:
+    # 차수 합이 degree 이하인 모든 다중 지수 (상수항 포함)
+    terms = []
+    for d in range(degree + 1):
+        for combo in itertools.combinations_with_replacement(range(n_params), d):
+            exponent = [0] * n_params
+            for i in combo:
+                exponent[i] += 1
+            terms.append(exponent)
+    return np.array(terms, dtype=int).reshape(len(terms), n_params)
+
+
+def _design_matrix(Z: np.ndarray, exponents: np.ndarray) -> np.ndarray:
+    # 파라미터별 르장드르 다항식 값을 미리 계산한 뒤 다중 지수에 따라 곱함
+    degree = int(exponents.max()) if exponents.size else 0
+    legendre = np.empty((degree + 1,) + Z.shape)
+    legendre[0] = 1.0
+    if degree >= 1:
+        legendre[1] = Z
+    for k in range(1, degree):
+        legendre[k + 1] = ((2 * k + 1) * Z * legendre[k] - k * legendre[k - 1]) / (k + 1)
+
+    A = np.ones((Z.shape[0], len(exponents)))
+    for j in range(Z.shape[1]):
+        A *= legendre[exponents[:, j], :, j].T
+    return A
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """모든(또는 지정한) 시스템의 surrogate 모델을 학습하고 검증 오차를 출력
+
+    검증 오차 표는 모델과 함께 `--out` 폴더의 `VALIDATION_REPORT`에도 저장합니다.
+    학습에 실패한 시스템이 있으면 0이 아닌 종료 코드로 끝나므로, 이미지 빌드 단계에서
+    모델 없이 배포되는 일을 막습니다.
+    """
+    from exergy_dashboard.plugins import load_plugins
+
+    parser = argparse.ArgumentParser(description='Train surrogate models for registered systems.')
+    parser.add_argument('--systems-dir', default='systems', help='plugin folder (*_system.py)')
+    parser.add_argument('--out', default='surrogates', help='output folder for .npz models')
+    parser.add_argument('--mode', help='train only this mode')
+    parser.add_argument('--system-type', help='train only this system type')
+    parser.add_argument('--samples', type=int, default=500)
+    parser.add_argument('--degree', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    load_plugins(args.systems_dir)
+    os.makedirs(args.out, exist_ok=True)
+
+    lines = [f"{'mode':<12} {'system type':<34} {'train':>6} {'terms':>6} "
+             f"{'X_eff RMSE [%p]':>16} {'X_eff max [%p]':>15}"]
+    print(lines[0])
+    trained, failed = 0, 0
+    for mode, systems in get_systems().items():
+        if args.mode and mode != args.mode.upper():
+            continue
+        for system_type in systems:
+            if args.system_type and system_type != args.system_type:
+                continue
+            try:
+                model = train_surrogate(
+                    mode, system_type, args.samples, args.degree, seed=args.seed
+                )
+            except Exception as e:
+                line = f'{mode:<12} {system_type:<34} failed: {e}'
+                failed += 1
+            else:
+                model.save(os.path.join(args.out, model_filename(mode, system_type)))
+                x_eff = model.validation.get('X_eff', {})
+                line = (f"{mode:<12} {system_type:<34} {model.n_train:>6} {len(model.exponents):>6} "
+                        f"{x_eff.get('rmse', float('nan')) * 100:>16.3f} "
+                        f"{x_eff.get('max_abs', float('nan')) * 100:>15.3f}")
+                trained += 1
+            print(line)
+            lines.append(line)
+
+    with open(os.path.join(args.out, VALIDATION_REPORT), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    if failed or not trained:
+        sys.exit(f'Surrogate training failed: {trained} trained, {failed} failed')
+
+
+if __name__ == '__main__':
+    main()
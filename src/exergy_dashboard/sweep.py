@@ -0,0 +1,549 @@
+"""2차원 파라미터 sweep 모듈
+
+선택한 시스템 하나의 두 파라미터를 격자로 바꿔 가며 출력 변수(기본값: X_eff)를 계산하고
+히트맵(또는 등고선처럼 단계적인 색상)으로 표시합니다.
+
+- 격자는 여러 점을 묶은 작업(chunk)으로 나누어 스케줄러 워커에서 `Priority.BATCH`로 평가
+  (점마다 평가 캐시를 거치지 않으므로 큰 격자가 대화형 평가 결과를 캐시에서 밀어내지 않음)
+- 계산한 격자는 (모드, 시스템 타입, 나머지 파라미터, 축 범위/해상도, 출력 변수) 단위로 캐시
+- 브라우저로는 셀 예산(`MAX_CELLS`) 이하로 블록 평균 다운샘플링한 격자만 전송
+- 축은 다른 파라미터를 현재 값으로 고정했을 때 범위 조건(예: 'T_0 - 1.0')을 만족하는 구간으로
+  정하고, 두 축을 함께 바꿔 조건을 만족하지 않게 된 격자점은 비워 둠
+
+Examples
+--------
+>>> from exergy_dashboard.sweep import compute_sweep, downsample_grid
+>>> grid = compute_sweep('COOLING', 'Air source heat pump', params, 'T_0', 'T_a_room', resolution=100)
+>>> grid.z.shape
+(100, 100)
+>>> downsample_grid(grid, max_cells=2500).z.shape
+(50, 50)
+"""
+
+import functools
+import math
+import threading
+import warnings
+from collections import OrderedDict, deque
+from dataclasses import dataclass, replace
+from typing import Any, Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import streamlit as st
+
+from exergy_dashboard.chart import plot_sweep_heatmap
+from exergy_dashboard.evaluation import collect_parameters, registry as evaluation_registry
+from exergy_dashboard.results import get_result_table, is_scalar
+from exergy_dashboard.scheduler import (
+    EvaluationScheduler,
+    Priority,
+    current_session_id,
+    scheduler as default_scheduler,
+)
+from exergy_dashboard.system import get_systems, resolve_range
+from exergy_dashboard.visualization import VisualizationRegistry, registry as viz_registry
+
+
+# 축당 격자점 수 선택지와 기본값
+RESOLUTIONS = (10, 25, 50, 100, 200, 500)
+DEFAULT_RESOLUTION = 25
+
+# 브라우저로 보낼 최대 셀 수 (초과하면 블록 평균으로 다운샘플링)
+MAX_CELLS = 2500
+
+# 작업 하나에서 평가할 격자점 수
+CHUNK_SIZE = 128
+
+# 등고선 표시에서 사용할 색상 단계 수
+CONTOUR_LEVELS = 10
+
+
+@dataclass(frozen=True, eq=False)
+class SweepGrid:
+    """2차원 sweep 결과
+
+    Parameters
+    ----------
+    x_param, y_param : str
+        x축, y축 파라미터 이름
+    output : str
+        출력 변수 이름
+    x : np.ndarray
+        x축 값 (nx,)
+    y : np.ndarray
+        y축 값 (ny,)
+    z : np.ndarray
+        출력 변수 값 (ny, nx). 평가할 수 없는 격자점은 NaN
+    """
+    x_param: str
+    y_param: str
+    output: str
+    x: np.ndarray
+    y: np.ndarray
+    z: np.ndarray
+
+
+class SweepCache:
+    """sweep 격자를 시스템 구성 단위로 보관하는 LRU 캐시
+
+    Parameters
+    ----------
+    maxsize : int, default 32
+        보관할 최대 격자 수. 초과하면 가장 오래 사용되지 않은 격자부터 제거
+    """
+
+    def __init__(self, maxsize: int = 32):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        mode: str,
+        system_type: str,
+        params: Dict[str, float],
+        names: Sequence[str],
+        outputs: Sequence[str],
+        axes: Sequence[Tuple[float, float, int]],
+    ) -> Tuple:
+        """캐시 키 생성 (sweep하는 파라미터의 현재 값은 키에서 제외)"""
+        fixed = tuple(sorted((k, v) for k, v in params.items() if k not in names))
+        return (mode, system_type, fixed, tuple(names), tuple(outputs), tuple(axes))
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """캐시된 격자를 반환하고, 없으면 None을 반환"""
+        with self._lock:
+            grid = self._data.get(key)
+            if grid is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return grid
+
+    def put(self, key: Hashable, grid: Any) -> None:
+        """격자를 캐시에 저장"""
+        with self._lock:
+            self._data[key] = grid
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# 전역 sweep 캐시 (모든 세션이 공유)
+sweep_cache = SweepCache()
+
+
+def sweep_axis(
+    parameters: Dict[str, Dict[str, Any]],
+    params: Dict[str, float],
+    name: str,
+    resolution: int,
+) -> Tuple[float, float, int]:
+    """sweep 축 정의 (하한, 상한, 점 수)
+
+    허용 범위 전체를 쓰면 다른 파라미터의 범위 식 때문에 대부분의 격자점이 비므로, 다른
+    파라미터를 현재 값으로 고정했을 때 가능한 구간(`feasible_range`)을 `resolution`개 점으로
+    나눕니다.
+    """
+    low, high = feasible_range(parameters, params, name)
+    return (low, high, int(resolution) if high > low else 1)
+
+
+def compute_sweep(
+    mode: str,
+    system_type: str,
+    params: Dict[str, float],
+    x_param: str,
+    y_param: str,
+    output: str = 'X_eff',
+    resolution: int = DEFAULT_RESOLUTION,
+    x_axis: Optional[Tuple[float, float, int]] = None,
+    y_axis: Optional[Tuple[float, float, int]] = None,
+    cache: Optional[SweepCache] = None,
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> SweepGrid:
+    """두 파라미터에 대한 출력 변수 격자를 계산 (캐시 적중 시 평가하지 않음)
+
+    Parameters
+    ----------
+    mode : str
+        시스템 모드
+    system_type : str
+        시스템 타입
+    params : Dict[str, float]
+        기준 파라미터 값 (sweep하지 않는 파라미터는 이 값으로 고정)
+    x_param, y_param : str
+        sweep할 파라미터 이름
+    output : str, default 'X_eff'
+        격자에 담을 출력 변수
+    resolution : int, default DEFAULT_RESOLUTION
+        축당 격자점 수 (축 정의를 직접 지정하지 않은 경우)
+    x_axis, y_axis : Tuple[float, float, int], optional
+        축 정의 (하한, 상한, 점 수). 기본값: 다른 파라미터를 고정했을 때 가능한 구간 (`sweep_axis`)
+    cache : SweepCache, optional
+        격자 캐시 (기본값: 전역 캐시)
+    scheduler : EvaluationScheduler, optional
+        평가 스케줄러 (기본값: 전역 스케줄러)
+
+    Returns
+    -------
+    SweepGrid
+        (ny, nx) 격자. 범위 조건을 만족하지 않거나 평가에 실패한 점은 NaN
+    """
+    mode = mode.upper()
+    cache = cache if cache is not None else sweep_cache
+    scheduler = scheduler or default_scheduler
+    parameters = get_systems()[mode][system_type]['parameters']
+    x_axis = x_axis or sweep_axis(parameters, params, x_param, resolution)
+    y_axis = y_axis or sweep_axis(parameters, params, y_param, resolution)
+
+    key = cache.make_key(mode, system_type, params, (x_param, y_param), (output,), (x_axis, y_axis))
+    grid = cache.get(key)
+    if grid is not None:
+        return grid
+
+    x = np.linspace(*x_axis)
+    y = np.linspace(*y_axis)
+    xx, yy = np.meshgrid(x, y)
+    points = np.column_stack([xx.ravel(), yy.ravel()])
+    values, complete = evaluate_grid(
+        mode, system_type, params, (x_param, y_param), points, (output,), scheduler,
+    )
+
+    grid = SweepGrid(x_param, y_param, output, x, y, values[:, 0].reshape(len(y), len(x)))
+    # 서버 과부하/시간 초과로 빠진 점이 있으면 캐시하지 않음 (다음 렌더링에서 다시 계산)
+    if complete:
+        cache.put(key, grid)
+    return grid
+
+
+def evaluate_grid(
+    mode: str,
+    system_type: str,
+    params: Dict[str, float],
+    names: Sequence[str],
+    points: np.ndarray,
+    outputs: Sequence[str],
+    scheduler: Optional[EvaluationScheduler] = None,
+) -> Tuple[np.ndarray, bool]:
+    """격자점들을 `CHUNK_SIZE`개씩 묶어 스케줄러 워커에서 평가
+
+    한 번에 큐에 올리는 작업 수는 워커 수의 2배로 제한합니다.
+
+    Parameters
+    ----------
+    mode : str
+        시스템 모드
+    system_type : str
+        시스템 타입
+    params : Dict[str, float]
+        기준 파라미터 값
+    names : Sequence[str]
+        바꿔 가며 평가할 파라미터 이름
+    points : np.ndarray
+        (점 수, len(names)) 파라미터 값 배열
+    outputs : Sequence[str]
+        모을 출력 변수
+    scheduler : EvaluationScheduler, optional
+        평가 스케줄러 (기본값: 전역 스케줄러)
+
+    Returns
+    -------
+    Tuple[np.ndarray, bool]
+        (점 수, len(outputs)) 출력 값 배열(범위 조건을 만족하지 않거나 평가에 실패한 점은 NaN)과,
+        서버 과부하/시간 초과로 빠진 작업 없이 모두 평가했는지 여부
+    """
+    mode = mode.upper()
+    scheduler = scheduler or default_scheduler
+    parameters = get_systems()[mode][system_type]['parameters']
+    values = np.full((len(points), len(outputs)), np.nan)
+
+    session_id = current_session_id()
+    window = scheduler.max_workers * 2
+    chunks = iter(range(0, len(points), CHUNK_SIZE))
+    pending: Deque[Tuple[int, Any]] = deque()
+    complete = True
+
+    def fill():
+        while len(pending) < window:
+            start = next(chunks, None)
+            if start is None:
+                return
+            try:
+                pending.append((start, scheduler.submit(
+                    _evaluate_points, mode, system_type, parameters, params,
+                    tuple(names), points[start:start + CHUNK_SIZE], tuple(outputs),
+                    session_id=session_id, priority=Priority.BATCH,
+                )))
+            except Exception as e:
+                pending.append((start, e))
+
+    fill()
+    while pending:
+        start, future = pending.popleft()
+        try:
+            if isinstance(future, Exception):
+                raise future
+            chunk = future.result()
+            values[start:start + len(chunk)] = chunk
+        except Exception:
+            complete = False
+        fill()
+    return values, complete
+
+
+def _evaluate_points(
+    mode: str,
+    system_type: str,
+    parameters: Dict[str, Dict[str, Any]],
+    params: Dict[str, float],
+    names: Tuple[str, ...],
+    points: np.ndarray,
+    outputs: Tuple[str, ...],
+) -> np.ndarray:
+    """격자점 묶음을 평가 (스케줄러 워커에서 실행)"""
+    checked = _checked_parameters(parameters, names)
+    values = np.full((len(points), len(outputs)), np.nan)
+    for i, row in enumerate(points.tolist()):
+        point = dict(params)
+        point.update(zip(names, row))
+        if not _feasible(parameters, point, checked):
+            continue
+        try:
+            result = evaluation_registry.evaluate(mode, system_type, point)
+        except Exception:
+            continue
+        for j, output in enumerate(outputs):
+            value = result.get(output)
+            if is_scalar(value):
+                values[i, j] = float(value)
+    return values
+
+
+def feasible_range(
+    parameters: Dict[str, Dict[str, Any]],
+    params: Dict[str, float],
+    name: str,
+    samples: int = 201,
+) -> Tuple[float, float]:
+    """다른 파라미터를 현재 값으로 고정했을 때 범위 조건을 모두 만족하는 값의 구간
+
+    허용 범위를 `samples`개 점으로 나누어 확인하며, 만족하는 점이 없으면 허용 범위를 반환합니다.
+    """
+    low, high = resolve_range(parameters[name], params)
+    if high < low:
+        low, high = high, low
+    checked = _checked_parameters(parameters, (name,))
+    point = dict(params)
+    feasible = []
+    for value in np.linspace(low, high, samples).tolist():
+        point[name] = value
+        if _feasible(parameters, point, checked):
+            feasible.append(value)
+    return (feasible[0], feasible[-1]) if feasible else (low, high)
+
+
+def _checked_parameters(parameters: Dict[str, Dict[str, Any]], names: Sequence[str]) -> List[str]:
+    # 범위를 확인할 파라미터: 바꾸는 파라미터와 그 값을 범위 식에서 참조하는 파라미터
+    return [
+        key for key, spec in parameters.items()
+        if key in names or any(
+            isinstance(bound, str) and any(name in bound for name in names)
+            for bound in spec['range']
+        )
+    ]
+
+
+def _feasible(parameters: Dict[str, Dict[str, Any]], point: Dict[str, float], names: Sequence[str]) -> bool:
+    for name in names:
+        try:
+            low, high = resolve_range(parameters[name], point)
+        except NameError:
+            continue
+        value = point.get(name)
+        if value is not None and not (low - 1e-9 <= value <= high + 1e-9):
+            return False
+    return True
+
+
+def downsample_grid(grid: SweepGrid, max_cells: int = MAX_CELLS) -> SweepGrid:
+    """셀 수가 `max_cells` 이하가 되도록 f x f 블록 평균으로 격자를 줄임
+
+    블록 안에 값이 하나도 없으면(모두 NaN) 그 셀은 NaN입니다.
+    """
+    ny, nx = grid.z.shape
+    factor = math.ceil(math.sqrt(nx * ny / max_cells)) if nx * ny > max_cells else 1
+    if factor <= 1:
+        return grid
+
+    def pad(values: np.ndarray, n: int, axis: int) -> np.ndarray:
+        extra = -values.shape[axis] % n
+        if not extra:
+            return values
+        shape = list(values.shape)
+        shape[axis] = extra
+        return np.concatenate([values, np.full(shape, np.nan)], axis=axis)
+
+    z = pad(pad(grid.z, factor, 0), factor, 1)
+    blocks = z.reshape(z.shape[0] // factor, factor, z.shape[1] // factor, factor)
+    with warnings.catch_warnings():
+        # 모두 NaN인 블록의 nanmean 경고는 무시 (결과는 NaN)
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        z = np.nanmean(blocks, axis=(1, 3))
+        x = np.nanmean(pad(grid.x, factor, 0).reshape(-1, factor), axis=1)
+        y = np.nanmean(pad(grid.y, factor, 0).reshape(-1, factor), axis=1)
+    return replace(grid, x=x, y=y, z=z)
+
+
+def grid_cells(grid: SweepGrid) -> Dict[str, np.ndarray]:
+    """격자를 사각형 셀 데이터(중심, 경계, 값)로 변환 (값이 없는 셀은 제외)"""
+    x0, x1 = _cell_edges(grid.x)
+    y0, y1 = _cell_edges(grid.y)
+    ix, iy = np.meshgrid(np.arange(len(grid.x)), np.arange(len(grid.y)))
+    ix, iy, z = ix.ravel(), iy.ravel(), grid.z.ravel()
+    keep = ~np.isnan(z)
+    ix, iy, z = ix[keep], iy[keep], z[keep]
+    x, x0, x1 = (round_significant(a)[ix] for a in (grid.x, x0, x1))
+    y, y0, y1 = (round_significant(a)[iy] for a in (grid.y, y0, y1))
+    return {'x': x, 'y': y, 'x0': x0, 'x1': x1, 'y0': y0, 'y1': y1, 'value': round_significant(z)}
+
+
+def round_significant(values: np.ndarray, digits: int = 6) -> np.ndarray:
+    """유효숫자 `digits`자리로 반올림 (spec의 JSON 크기를 줄이기 위함)"""
+    magnitude = np.floor(np.log10(np.abs(np.where(values == 0, 1.0, values))))
+    factor = 10.0 ** (digits - 1 - magnitude)
+    return np.round(values * factor) / factor
+
+
+def _cell_edges(centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if len(centers) == 1:
+        half = max(abs(centers[0]) * 0.01, 0.5)
+        return centers - half, centers + half
+    mid = (centers[1:] + centers[:-1]) / 2
+    lower = np.concatenate([[2 * centers[0] - mid[0]], mid])
+    upper = np.concatenate([mid, [2 * centers[-1] - mid[-1]]])
+    return lower, upper
+
+
+# ----------------------------------------------------------------------
+# 시각화
+# ----------------------------------------------------------------------
+def sweep_settings(session_state: Any, selected_systems: List[str], mode: str) -> Dict[str, Any]:
+    """session state의 sweep 설정('sweep:{mode}:*')을 읽고 유효하지 않은 값은 기본값으로 바꿈"""
+    def get(field, default=None):
+        return session_state.get(f'sweep:{mode}:{field}', default)
+
+    system = get('system')
+    if system not in selected_systems:
+        system = selected_systems[0]
+    names = list(session_state.systems[system]['parameters'])
+    x_param = get('x') if get('x') in names else names[0]
+    y_param = get('y') if get('y') in names and get('y') != x_param else next(
+        (name for name in names if name != x_param), x_param
+    )
+    resolution = get('resolution') if get('resolution') in RESOLUTIONS else DEFAULT_RESOLUTION
+    return {
+        'system': system,
+        'x': x_param,
+        'y': y_param,
+        'output': get('output') or 'X_eff',
+        'resolution': resolution,
+        'contour': bool(get('contour', False)),
+    }
+
+
+def sweep_controls(session_state: Any, selected_systems: List[str], mode: str) -> None:
+    """sweep 설정 위젯 표시 (값은 session state의 'sweep:{mode}:*'에 저장)"""
+    settings = sweep_settings(session_state, selected_systems, mode)
+    # 선택한 시스템이 바뀌어 없어진 값은 위젯을 만들기 전에 바로잡음
+    for field in ('system', 'x', 'y', 'resolution'):
+        session_state[f'sweep:{mode}:{field}'] = settings[field]
+
+    system = session_state.systems[settings['system']]
+    parameters = system['parameters']
+    table = get_result_table(session_state, [settings['system']])
+    outputs = ['X_eff']
+    if settings['system'] in table:
+        values = table.values([settings['system']])[0]
+        outputs += [c for c, v in zip(table.columns, values) if c != 'X_eff' and not np.isnan(v)]
+    if session_state.get(f'sweep:{mode}:output') not in outputs:
+        session_state[f'sweep:{mode}:output'] = 'X_eff'
+
+    def describe(name):
+        return f"{parameters[name]['explanation']['EN'].capitalize()} ({name})"
+
+    system_col, x_col, y_col = st.columns(3)
+    system_col.selectbox('System', selected_systems, key=f'sweep:{mode}:system')
+    x_col.selectbox('X parameter', list(parameters), format_func=describe, key=f'sweep:{mode}:x')
+    y_col.selectbox(
+        'Y parameter', [name for name in parameters if name != settings['x']],
+        format_func=describe, key=f'sweep:{mode}:y',
+    )
+    output_col, resolution_col, contour_col = st.columns(3, vertical_alignment='bottom')
+    output_col.selectbox('Output', outputs, key=f'sweep:{mode}:output')
+    resolution_col.select_slider(
+        'Grid resolution', RESOLUTIONS, format_func=lambda n: f'{n} x {n}',
+        key=f'sweep:{mode}:resolution',
+    )
+    contour_col.toggle('Contour levels', key=f'sweep:{mode}:contour')
+
+
+def plot_parameter_sweep(session_state: Any, selected_systems: List[str], mode: str) -> Dict[str, Any]:
+    """선택한 시스템의 2차원 파라미터 sweep 히트맵 생성"""
+    settings = sweep_settings(session_state, selected_systems, mode)
+    name = settings['system']
+    system = session_state.systems[name]
+    parameters = system['parameters']
+    params = {
+        key: parameter.get('value', parameter['default']) for key, parameter in parameters.items()
+    }
+    params.update(collect_parameters(session_state, name))
+
+    x_param, y_param, output = settings['x'], settings['y'], settings['output']
+    grid = compute_sweep(
+        mode, system['type'], params, x_param, y_param, output, settings['resolution'],
+    )
+    shown = downsample_grid(grid)
+
+    # 엑서지 효율은 대시보드의 다른 차트와 같이 % 단위로 표시
+    scale, value_title = (100.0, 'Exergy efficiency [%]') if output == 'X_eff' else (1.0, output)
+    cells = grid_cells(replace(shown, z=shown.z * scale))
+    table = get_result_table(session_state, [name])
+    current = table.column(output, [name])[0] * scale if name in table else np.nan
+    point = {'x': [params[x_param]], 'y': [params[y_param]], 'value': [current]}
+
+    def title(key):
+        return f"{parameters[key]['explanation']['EN'].capitalize()} [{parameters[key]['unit']}]"
+
+    return plot_sweep_heatmap(
+        cells, point, title(x_param), title(y_param), value_title,
+        CONTOUR_LEVELS if settings['contour'] else None,
+    )
+
+
+def register_sweep_views(mode: str, registry: Optional[VisualizationRegistry] = None) -> None:
+    """모드에 2차원 파라미터 sweep 시각화를 등록 (모든 모드에 공통)
+
+    설정이 위젯 상태에 따라 달라지므로 spec 캐시에서 제외하고(`cacheable=False`),
+    계산한 격자는 `sweep_cache`에 보관합니다.
+    """
+    registry = registry or viz_registry
+    registry.register(
+        mode, 'Parameter sweep (2-D)', cacheable=False,
+        controls=functools.partial(sweep_controls, mode=mode),
+    )(functools.partial(plot_parameter_sweep, mode=mode))
@@ -1,5 +1,5 @@
 # 각 시스템의 파라미터를 설정하세요.
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from dataclasses import dataclass
 from copy import deepcopy
 
@@ -196,3 +196,34 @@ def get_system_template() -> dict:
 def get_systems() -> Dict[str, Dict[str, Any]]:
     """전역 레지스트리에 등록된 모든 시스템을 반환합니다."""
     return system_registry.get_systems()
+
+def resolve_range(parameter: dict, params: Dict[str, float]) -> Tuple[float, float]:
+    """파라미터의 허용 범위를 현재 입력값 기준으로 계산합니다.
+
+    'range'의 각 경계는 숫자이거나 다른 파라미터를 참조하는 식(예: 'T_0 - 1.0')입니다.
+
+    Parameters
+    ----------
+    parameter : dict
+        파라미터 설정 (시스템 설정의 'parameters' 항목 하나)
+    params : Dict[str, float]
+        같은 시스템의 현재 파라미터 값
+
+    Returns
+    -------
+    Tuple[float, float]
+        (하한, 상한)
+
+    Raises
+    ------
+    NameError
+        식이 존재하지 않는 파라미터를 참조하는 경우
+    """
+    low, high = parameter['range']
+    return _resolve_bound(low, params), _resolve_bound(high, params)
+
+
+def _resolve_bound(bound: Any, params: Dict[str, float]) -> float:
+    if isinstance(bound, str):
+        return float(eval(bound, {'__builtins__': {}}, dict(params)))
+    return float(bound)
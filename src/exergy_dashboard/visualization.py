@@ -44,13 +44,42 @@ Examples
     
     viz_manager = VisualizationManager(registry)
     viz_manager.render_tabs(st.session_state, selected_systems)
+
+    # 선택한 탭의 시각화만 실행 (나머지는 백그라운드에서 미리 생성)
+    viz_manager.render_tabs(st.session_state, selected_systems, mode, lazy=True)
+    ```
+
+3. 결과 캐시에서 제외하기:
+    세션 결과 테이블(선택한 시스템의 출력 변수) 외의 값에 의존하는 시각화는
+    `cacheable=False`로 등록합니다.
+    ```python
+    @registry.register('COOLING', 'Parameter sweep', cacheable=False)
+    def plot_sweep(session_state, selected_systems):
+        ...
     ```
 """
 
-from typing import Callable, Dict, List, Any
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional
+import altair as alt
 import streamlit as st
 from dataclasses import dataclass
 
+from exergy_dashboard.chart import chart_to_dict
+from exergy_dashboard.metrics import VISUALIZATION_ERRORS, VISUALIZATION_SECONDS
+from exergy_dashboard.render import FORMATS, render_image, render_images
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.scheduler import (
+    Priority,
+    SchedulerBusyError,
+    current_session_id,
+    scheduler as default_scheduler,
+)
+
 
 @dataclass
 class VisualizationRegistry:
@@ -59,11 +88,24 @@ class VisualizationRegistry:
     새로운 시각화 도구를 등록하고 관리하는 레지스트리 클래스입니다.
     """
     _visualizers: Dict[str, Dict[str, Callable]] = None
+    _cacheable: Dict[str, Dict[str, bool]] = None
+    _page_sizes: Dict[str, Dict[str, Optional[int]]] = None
+    _controls: Dict[str, Dict[str, Optional[Callable]]] = None
     
     def __post_init__(self):
         self._visualizers = {}
+        self._cacheable = {}
+        self._page_sizes = {}
+        self._controls = {}
     
-    def register(self, mode: str, name: str) -> Callable:
+    def register(
+        self,
+        mode: str,
+        name: str,
+        cacheable: bool = True,
+        page_size: Optional[int] = None,
+        controls: Optional[Callable] = None,
+    ) -> Callable:
         """
         데코레이터: 새로운 시각화 도구를 등록
 
@@ -73,6 +115,16 @@ class VisualizationRegistry:
             시각화 도구가 사용될 모드 (예: 'COOLING', 'TEST')
         name : str
             시각화 도구의 이름
+        cacheable : bool, default True
+            결과(차트 spec)를 캐시할지 여부. 선택한 시스템의 평가 결과 외의 값
+            (위젯 상태, 시간 등)에 따라 출력이 달라지는 시각화는 False로 등록
+        page_size : int, optional
+            시스템마다 차트를 그리는 시각화의 페이지당 시스템 수. 선택한 시스템이 더 많으면
+            엑서지 효율 순서로 페이지를 나누어 한 페이지만 표시
+        controls : Callable, optional
+            차트 위에 설정 위젯을 표시하는 함수 ``controls(session_state, selected_systems)``.
+            위젯 값은 session state에 저장되고 시각화 함수는 session state에서 읽으므로,
+            보고서/이미지 내보내기처럼 위젯 없이 실행해도 현재 설정으로 차트를 생성
 
         Returns
         -------
@@ -82,9 +134,27 @@ class VisualizationRegistry:
         def decorator(func: Callable) -> Callable:
             if mode not in self._visualizers:
                 self._visualizers[mode] = {}
+                self._cacheable[mode] = {}
+                self._page_sizes[mode] = {}
+                self._controls[mode] = {}
             self._visualizers[mode][name] = func
+            self._cacheable[mode][name] = cacheable
+            self._page_sizes[mode][name] = page_size
+            self._controls[mode][name] = controls
             return func
         return decorator
+
+    def is_cacheable(self, name: str, mode: str) -> bool:
+        """시각화 결과를 캐시할 수 있는지 여부"""
+        return self._cacheable.get(mode, {}).get(name, False)
+
+    def page_size(self, name: str, mode: str) -> Optional[int]:
+        """페이지당 시스템 수 (페이지로 나누지 않는 시각화는 None)"""
+        return self._page_sizes.get(mode, {}).get(name)
+
+    def get_controls(self, name: str, mode: str) -> Optional[Callable]:
+        """설정 위젯 함수 (없으면 None)"""
+        return self._controls.get(mode, {}).get(name)
     
     def get_visualizer(self, name: str, mode: str) -> Callable:
         """
@@ -125,10 +195,113 @@ class VisualizationRegistry:
         return {}
 
 
+class SpecCache:
+    """시각화 결과(Vega-Lite spec 또는 HTML)를 입력 데이터 해시 단위로 보관하는 LRU 캐시
+
+    키는 모드, 시각화 이름, 선택한 시스템(이름, 타입)과 그 결과 벡터의 해시이므로
+    같은 결과를 보는 다른 세션과도 공유됩니다.
+
+    Parameters
+    ----------
+    maxsize : int, default 256
+        보관할 최대 spec 수. 초과하면 가장 오래 사용되지 않은 spec부터 제거
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(session_state: Any, selected_systems: List[str], mode: str, name: str) -> str:
+        """시각화 입력 데이터의 해시 키 생성"""
+        table = get_result_table(session_state, selected_systems)
+        names = [n for n in selected_systems if n in table]
+        header = json.dumps(
+            [mode, name, list(selected_systems), [table.system_type(n) for n in names], table.columns],
+            ensure_ascii=False,
+        )
+        digest = hashlib.sha256(header.encode('utf-8'))
+        digest.update(table.row_bytes(names))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 spec을 반환하고, 없으면 None을 반환"""
+        with self._lock:
+            spec = self._data.get(key)
+            if spec is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data.move_to_end(key)
+            return spec
+
+    def put(self, key: str, spec: Any) -> None:
+        """spec을 캐시에 저장"""
+        with self._lock:
+            self._data[key] = spec
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SessionSnapshot(dict):
+    """시각화 함수가 읽는 세션 상태의 사본
+
+    백그라운드 워커에서 시각화를 실행할 때 사용합니다. Streamlit session state는
+    스크립트 스레드 밖에서 안전하게 읽을 수 없으므로, 선택한 시스템의 정보와 결과
+    테이블 사본만 담습니다. `session_state.systems`처럼 속성으로도 접근할 수 있습니다.
+
+    Parameters
+    ----------
+    session_state : Any
+        Streamlit session state
+    selected_systems : List[str]
+        선택된 시스템 이름 목록
+    """
+
+    def __init__(self, session_state: Any, selected_systems: List[str]):
+        table = get_result_table(session_state, selected_systems)
+        super().__init__(
+            systems={name: dict(session_state.systems[name]) for name in selected_systems},
+            result_table=table.copy(),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def chart_to_spec(chart: Any) -> Any:
+    """시각화 함수의 반환값을 캐시 가능한 형태(dict 또는 str)로 변환
+
+    Altair 차트는 `chart_to_dict`로 Vega-Lite dict로 직렬화하고, 그 외의 값은 그대로 반환합니다.
+    """
+    if isinstance(chart, alt.TopLevelMixin):
+        return chart_to_dict(chart)
+    return chart
+
+
 class VisualizationManager:
     """시각화 관리 및 렌더링을 담당하는 클래스"""
     
-    def __init__(self, registry: VisualizationRegistry):
+    def __init__(self, registry: VisualizationRegistry, cache: Optional[SpecCache] = None):
         """
         시각화 관리자 초기화
         
@@ -136,10 +309,109 @@ class VisualizationManager:
         ----------
         registry : VisualizationRegistry
             사용할 시각화 레지스트리
+        cache : SpecCache, optional
+            시각화 결과 캐시 (기본값: 전역 캐시)
         """
         self.registry = registry
+        self.cache = cache if cache is not None else spec_cache
+
+    def build_spec(self, session_state: Any, selected_systems: List[str], mode: str, name: str) -> Any:
+        """
+        시각화 하나를 실행하여 spec을 반환 (캐시 적중 시 시각화 함수를 실행하지 않음)
+
+        Returns
+        -------
+        Any
+            Vega-Lite spec(dict), HTML(str) 또는 None.
+            캐시하지 않는 시각화는 함수의 반환값(Altair 차트 등)을 그대로 반환
+        """
+        func = self.registry.get_visualizer(name, mode)
+        if not self.registry.is_cacheable(name, mode):
+            return func(session_state, selected_systems)
+
+        key = self.cache.make_key(session_state, selected_systems, mode, name)
+        spec = self.cache.get(key)
+        if spec is None:
+            spec = chart_to_spec(func(session_state, selected_systems))
+            if spec is not None:
+                self.cache.put(key, spec)
+        return spec
+
+    def visible_systems(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        name: str,
+    ) -> List[str]:
+        """
+        시각화에 실제로 전달할 시스템 목록
+
+        페이지로 나누는 시각화(`page_size`)이고 선택한 시스템이 한 페이지보다 많으면,
+        엑서지 효율 내림차순으로 정렬한 뒤 현재 페이지(session state의
+        'visualization_page:{mode}:{name}', 1부터 시작)의 시스템만 반환합니다.
+        """
+        page_size = self.registry.page_size(name, mode)
+        if not page_size or len(selected_systems) <= page_size:
+            return selected_systems
+        ranked = get_result_table(session_state, selected_systems).rank('X_eff', selected_systems)
+        n_pages = -(-len(ranked) // page_size)
+        page = min(max(int(session_state.get(f'visualization_page:{mode}:{name}', 1)), 1), n_pages)
+        return ranked[(page - 1) * page_size:page * page_size]
     
-    def render_tabs(self, session_state: Any, selected_systems: List[str], mode: str) -> None:
+    def prefetch_specs(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        names: List[str],
+        scheduler: Any = None,
+    ) -> List[Any]:
+        """
+        캐시할 수 있는 시각화의 spec을 백그라운드에서 미리 생성하여 캐시에 저장
+
+        세션 상태의 사본(`SessionSnapshot`)으로 `Priority.PREFETCH` 작업을 제출하므로
+        사용자 요청보다 늦게 처리됩니다. 페이지로 나누는 시각화는 제출하기 전에 현재 세션
+        상태에서 사용자가 보고 있는 페이지의 시스템을 정합니다. 이미 캐시에 있는 spec은 제출하지 않고,
+        큐가 가득 차면 나머지는 건너뜁니다. 워커가 하나뿐이면 아무것도 제출하지 않습니다.
+
+        Returns
+        -------
+        List[Future]
+            제출된 작업들
+        """
+        scheduler = scheduler or default_scheduler
+        if not scheduler.prefetch_enabled:
+            return []
+        session_id = current_session_id()
+        snapshot = None
+        submitted = []
+        for name in names:
+            if not self.registry.is_cacheable(name, mode):
+                continue
+            snapshot = snapshot or SessionSnapshot(session_state, selected_systems)
+            # 현재 페이지('visualization_page:...')는 사본에 없으므로 실제 세션 상태로 결정
+            systems = self.visible_systems(session_state, selected_systems, mode, name)
+            if self.cache.make_key(snapshot, systems, mode, name) in self.cache:
+                continue
+            try:
+                submitted.append(scheduler.submit(
+                    self.build_spec, snapshot, list(systems), mode, name,
+                    session_id=session_id, priority=Priority.PREFETCH,
+                ))
+            except SchedulerBusyError:
+                break
+        return submitted
+
+    def render_tabs(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        lazy: bool = False,
+        prefetch: bool = True,
+        static: Optional[str] = None,
+    ) -> None:
         """
         등록된 모든 시각화를 탭으로 구성하여 렌더링
 
@@ -151,6 +423,14 @@ class VisualizationManager:
             선택된 시스템 이름 목록
         mode : str
             시각화할 특정 모드
+        lazy : bool, default False
+            True이면 `st.tabs` 대신 탭 선택기(session state의
+            'visualization_tab:{mode}')를 표시하고 선택한 시각화만 실행하여 전송
+        prefetch : bool, default True
+            lazy 모드에서 선택하지 않은 시각화의 spec을 백그라운드에서 미리 생성
+        static : str, optional
+            'svg' 또는 'png'이면 차트를 서버에서 이미지로 렌더링하여 표시하고
+            다운로드 버튼을 함께 표시 (저사양 클라이언트용 정적 이미지 표시 모드)
         """
         if not selected_systems:
             return
@@ -161,26 +441,153 @@ class VisualizationManager:
         if not available_visualizers:
             st.write(f"No visualizations available for {mode} mode.")
             return
-            
-        tabs = st.tabs(available_visualizers.keys())
+
+        tab_names = list(available_visualizers.keys())
+
+        if lazy:
+            key = f'visualization_tab:{mode}'
+            if session_state.get(key) not in tab_names:
+                session_state[key] = tab_names[0]
+            active = st.segmented_control(
+                label="Select visualization",
+                options=tab_names,
+                key=key,
+                label_visibility='collapsed',
+            )
+            # 선택을 해제한 경우 첫 번째 탭을 표시
+            if active is None:
+                active = tab_names[0]
+            self._render(session_state, selected_systems, mode, active, static)
+            if prefetch:
+                others = [name for name in tab_names if name != active]
+                self.prefetch_specs(session_state, selected_systems, mode, others)
+            return
+
+        tabs = st.tabs(tab_names)
         
-        for tab, tab_name in zip(tabs, available_visualizers.keys()):
+        for tab, tab_name in zip(tabs, tab_names):
             with tab:
-                func = available_visualizers[tab_name]
-                st.subheader(tab_name)
-                try:
-                    chart = func(session_state, selected_systems)
-                    if isinstance(chart, dict):
-                        st.vega_lite_chart(chart)
-                    elif isinstance(chart, str):
-                        st.components.v1.html(chart)
-                    elif chart is not None:  # 차트를 반환하는 경우에만 표시
-                        st.altair_chart(chart, use_container_width=True)
-                except Exception as e:
-                    st.error(f"Error rendering visualization: {str(e)}")
-                    import traceback
-                    st.error(f"상세 오류: {traceback.format_exc()}")
+                self._render(session_state, selected_systems, mode, tab_name, static)
+
+    def export_images(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        fmt: str = 'svg',
+        names: Optional[List[str]] = None,
+        scale: float = 1.0,
+    ) -> Dict[str, Any]:
+        """
+        시각화들을 이미지로 렌더링 (렌더링은 스케줄러 워커에서 병렬로 실행)
+
+        Parameters
+        ----------
+        fmt : str, default 'svg'
+            이미지 형식 ('svg' 또는 'png')
+        names : List[str], optional
+            렌더링할 시각화 이름 (기본값: 모드의 모든 시각화)
+        scale : float, default 1.0
+            PNG 해상도 배율
+
+        Returns
+        -------
+        Dict[str, Any]
+            시각화 이름과 이미지(bytes). 실패한 시각화는 예외 객체, 이미지로 만들 수 없는
+            시각화(HTML 등)는 제외
+        """
+        if names is None:
+            names = list(self.registry.get_available_visualizers(mode))
+
+        specs = {}
+        images: Dict[str, Any] = {}
+        for name in names:
+            try:
+                spec = chart_to_spec(self.build_spec(session_state, selected_systems, mode, name))
+            except Exception as e:
+                images[name] = e
+                continue
+            if isinstance(spec, dict):
+                specs[name] = spec
+
+        rendered = render_images(list(specs.values()), fmt, scale=scale)
+        images.update(zip(specs, rendered))
+        return {name: images[name] for name in names if name in images}
+
+    def _render(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        name: str,
+        static: Optional[str] = None,
+    ) -> None:
+        """시각화 하나를 현재 컨테이너에 렌더링 (소요 시간과 오류는 메트릭에 기록)"""
+        st.subheader(name)
+        start = time.perf_counter()
+        try:
+            controls = self.registry.get_controls(name, mode)
+            if controls is not None:
+                controls(session_state, selected_systems)
+            page_size = self.registry.page_size(name, mode)
+            if page_size and len(selected_systems) > page_size:
+                self._page_selector(session_state, selected_systems, mode, name, page_size)
+            systems = self.visible_systems(session_state, selected_systems, mode, name)
+            spec = self.build_spec(session_state, systems, mode, name)
+            if static and spec is not None and not isinstance(spec, str):
+                image = render_image(chart_to_spec(spec), static)
+                st.image(image.decode('utf-8') if static == 'svg' else image, use_container_width=True)
+                st.download_button(
+                    f'Download {static.upper()}',
+                    data=image,
+                    file_name=f'{name}.{static}',
+                    mime=FORMATS[static],
+                    key=f'download:{mode}:{name}',
+                )
+            elif isinstance(spec, dict):
+                st.vega_lite_chart(spec, use_container_width=True)
+            elif isinstance(spec, str):
+                st.components.v1.html(spec)
+            elif spec is not None:  # 차트를 반환하는 경우에만 표시
+                st.altair_chart(spec, use_container_width=True)
+        except Exception as e:
+            VISUALIZATION_ERRORS.inc(mode, name)
+            st.error(f"Error rendering visualization: {str(e)}")
+            import traceback
+            st.error(f"상세 오류: {traceback.format_exc()}")
+        finally:
+            VISUALIZATION_SECONDS.observe(time.perf_counter() - start, mode, name)
+
+    def _page_selector(
+        self,
+        session_state: Any,
+        selected_systems: List[str],
+        mode: str,
+        name: str,
+        page_size: int,
+    ) -> None:
+        """페이지 선택기 표시 (선택한 페이지는 session state에 저장)"""
+        key = f'visualization_page:{mode}:{name}'
+        n_pages = -(-len(selected_systems) // page_size)
+        # 선택한 시스템 수가 줄어 페이지가 없어진 경우 마지막 페이지로
+        if session_state.get(key, 1) > n_pages:
+            session_state[key] = n_pages
+        page_col, caption_col = st.columns([1, 3], vertical_alignment='bottom')
+        with page_col:
+            page = st.number_input(
+                f'Page (1-{n_pages})', min_value=1, max_value=n_pages, step=1, key=key,
+            )
+        with caption_col:
+            start = (page - 1) * page_size
+            end = min(start + page_size, len(selected_systems))
+            st.caption(
+                f'Ranked by exergy efficiency: systems {start + 1}-{end} '
+                f'of {len(selected_systems)}'
+            )
 
 
 # 전역 레지스트리 인스턴스 생성
-registry = VisualizationRegistry()
\ No newline at end of file
+registry = VisualizationRegistry()
+
+# 전역 시각화 결과 캐시 (모든 세션이 공유)
+spec_cache = SpecCache()
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""서버 시작 warm-up 및 준비 상태(readiness) 모듈
+
+배포 직후 첫 사용자는 평가 엔진(`enex_analysis`) 임포트, 기본값 평가, 차트 생성을 모두
+기다려야 합니다. 이 모듈은 서버가 시작될 때 백그라운드 스레드에서 다음을 미리 수행하고,
+모두 끝난 뒤에만 준비 상태를 켭니다.
+
+1. 시스템 플러그인 임포트(`load_plugins`, 평가 엔진 임포트 포함)와 surrogate 모델 로딩
+2. 등록된 모든 시스템을 기본값으로 평가 (평가 캐시 `evaluation_cache`에 저장)
+3. 시스템 하나를 기본값으로 추가했을 때의 차트 spec 생성 (spec 캐시와 차트 템플릿 캐시에 저장).
+   설정 위젯에 따라 달라지는 시각화(sweep, 탐색)는 격자 평가가 커서 제외
+
+준비 상태는 메트릭 서버(`exergy_dashboard.metrics`)의 '/ready'(준비 전 503, 준비 후 200)로
+확인하고, '/health'는 프로세스가 응답하면 항상 200을 반환합니다. 모든 평가와 시각화가
+성공해야 준비 상태가 켜집니다. 일부가 실패하면 `DEGRADED`, 플러그인을 불러오지 못했거나
+평가가 하나도 성공하지 못하면 `FAILED`로 끝나며, 두 경우 모두 '/ready'는 503을 반환하므로
+로드 밸런서와 헬스체크가 이 replica로 요청을 보내지 않습니다.
+
+실행 방법
+--------
+- ``python -m exergy_dashboard.warmup app.py [Streamlit 옵션]``: warm-up을 시작한 뒤 같은
+  프로세스에서 Streamlit 서버를 실행 (첫 세션이 오기 전에 warm-up)
+- ``streamlit run app.py``: 첫 세션이 시작될 때 app.py가 warm-up을 시작
+
+Examples
+--------
+>>> from exergy_dashboard.warmup import start_warmup, warmup_status
+>>> start_warmup('systems', 'surrogates')
+>>> warmup_status.wait(60)
+True
+>>> warmup_status.as_dict()['specs']
+24
+"""
+
+import argparse
+import copy
+import os
+import sys
+import threading
+import time
+from concurrent import futures as _futures
+from typing import Any, Dict, List, Optional
+
+from exergy_dashboard.metrics import metrics, routes, start_metrics_server
+
+
+# warm-up 진행 단계
+PENDING = 'pending'
+RUNNING = 'running'
+READY = 'ready'
+DEGRADED = 'degraded'   # 끝났지만 일부 평가나 시각화가 실패함 (준비되지 않은 것으로 취급)
+FAILED = 'failed'
+
+# warm-up 평가 작업에 사용하는 스케줄러 세션 ID
+WARMUP_SESSION_ID = 'warmup'
+
+
+class WarmupStatus:
+    """warm-up 진행 상태와 준비 여부 (모든 스레드에서 읽을 수 있음)"""
+
+    def __init__(self):
+        self.phase = PENDING
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.evaluations = 0
+        self.specs = 0
+        self.errors: List[str] = []
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """warm-up이 끝나 요청을 받을 준비가 되었는지 여부"""
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """준비될 때까지 기다림 (`timeout` 안에 준비되면 True)"""
+        return self._ready.wait(timeout)
+
+    def start(self) -> None:
+        with self._lock:
+            self.phase = RUNNING
+            self.started = time.monotonic()
+
+    def finish(self, phase: str) -> None:
+        with self._lock:
+            self.phase = phase
+            self.finished = time.monotonic()
+        if phase == READY:
+            self._ready.set()
+
+    def error(self, message: str) -> None:
+        print(f"Warm-up: {message}")
+        with self._lock:
+            self.errors.append(message)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """상태 요약 (단계, 소요 시간, 평가 수, spec 수, 오류)"""
+        with self._lock:
+            end = self.finished if self.finished is not None else time.monotonic()
+            return {
+                'phase': self.phase,
+                'ready': self._ready.is_set(),
+                'seconds': end - self.started if self.started is not None else 0.0,
+                'evaluations': self.evaluations,
+                'specs': self.specs,
+                'errors': list(self.errors),
+            }
+
+
+class _DefaultSession(dict):
+    """기본값으로 추가한 시스템만 담은 세션 상태 (`session_state.systems`처럼 속성 접근 가능)"""
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+def default_session(mode: str, system_type: str, variables: Dict[str, Any]) -> _DefaultSession:
+    """대시보드에서 시스템을 처음 추가하고 평가했을 때와 같은 세션 상태
+
+    시스템 이름('{시스템 타입} 1')과 파라미터 값이 app.py와 같으므로, 이 상태로 만든 spec은
+    사용자의 첫 화면에서 spec 캐시 적중으로 재사용됩니다.
+    """
+    from exergy_dashboard.results import ResultTable
+    from exergy_dashboard.system import get_systems
+
+    system = copy.deepcopy(get_systems()[mode][system_type])
+    name = f'{system_type} 1'
+    system['name'] = name
+    system['type'] = system_type
+    for parameter in system['parameters'].values():
+        parameter['value'] = parameter['default']
+    system['variables'] = variables
+    table = ResultTable()
+    table.upsert(name, system_type, variables)
+    return _DefaultSession(systems={name: system}, result_table=table)
+
+
+def warm_up(
+    systems_dir: str,
+    surrogate_dir: Optional[str] = None,
+    status: Optional[WarmupStatus] = None,
+) -> WarmupStatus:
+    """warm-up을 현재 스레드에서 실행
+
+    Parameters
+    ----------
+    systems_dir : str
+        플러그인 폴더 경로
+    surrogate_dir : str, optional
+        surrogate 모델 폴더 경로
+    status : WarmupStatus, optional
+        진행 상태를 기록할 객체 (기본값: 전역 `warmup_status`)
+
+    Returns
+    -------
+    WarmupStatus
+        진행 상태
+    """
+    from exergy_dashboard.plugins import load_plugins
+    from exergy_dashboard.scheduler import Priority, scheduler
+    from exergy_dashboard.surrogate import surrogates
+    from exergy_dashboard.system import get_systems
+    from exergy_dashboard.visualization import VisualizationManager, registry as viz_registry
+
+    status = status if status is not None else warmup_status
+    status.start()
+    try:
+        load_plugins(systems_dir)
+        if surrogate_dir:
+            surrogates.load_directory(surrogate_dir)
+    except Exception as e:
+        status.error(f'loading plugins failed: {e}')
+        status.finish(FAILED)
+        return status
+
+    # 모든 시스템을 기본값으로 평가 (워커 풀에서 병렬로 실행)
+    submitted = {}
+    for mode, systems in get_systems().items():
+        for system_type, config in systems.items():
+            params = {key: parameter['default'] for key, parameter in config['parameters'].items()}
+            try:
+                submitted[(mode, system_type)] = scheduler.submit_evaluation(
+                    mode, system_type, params,
+                    session_id=WARMUP_SESSION_ID, priority=Priority.BATCH,
+                )
+            except Exception as e:
+                status.error(f'{mode} / {system_type}: {e}')
+    _futures.wait(list(submitted.values()))
+
+    # 시스템 하나를 추가했을 때의 기본 차트 spec 생성
+    manager = VisualizationManager(viz_registry)
+    for (mode, system_type), future in submitted.items():
+        try:
+            variables = future.result()
+        except Exception as e:
+            status.error(f'{mode} / {system_type}: {e}')
+            continue
+        status.evaluations += 1
+        session = default_session(mode, system_type, variables)
+        for name in viz_registry.get_available_visualizers(mode):
+            if not viz_registry.is_cacheable(name, mode):
+                continue
+            try:
+                manager.build_spec(session, list(session.systems), mode, name)
+            except Exception as e:
+                status.error(f'{mode} / {system_type} / {name}: {e}')
+                continue
+            status.specs += 1
+
+    if not status.evaluations:
+        phase = FAILED
+    elif status.errors:
+        phase = DEGRADED
+    else:
+        phase = READY
+    status.finish(phase)
+    summary = status.as_dict()
+    print(f"Warm-up finished in {summary['seconds']:.1f} s ({phase}): "
+          f"{summary['evaluations']} evaluations, {summary['specs']} specs, {len(summary['errors'])} errors")
+    return status
+
+
+# 전역 warm-up 상태
+warmup_status = WarmupStatus()
+
+_thread: Optional[threading.Thread] = None
+_thread_lock = threading.Lock()
+
+
+def start_warmup(systems_dir: str, surrogate_dir: Optional[str] = None) -> threading.Thread:
+    """메트릭 서버('/ready')를 시작하고 warm-up을 백그라운드 스레드에서 실행 (프로세스당 한 번)
+
+    Returns
+    -------
+    threading.Thread
+        warm-up 스레드 (이미 시작했으면 기존 스레드)
+    """
+    global _thread
+    with _thread_lock:
+        if _thread is None:
+            _register_endpoints()
+            start_metrics_server()
+            _thread = threading.Thread(
+                target=warm_up, args=(systems_dir, surrogate_dir), name='warmup', daemon=True,
+            )
+            _thread.start()
+        return _thread
+
+
+def _ready_response():
+    if warmup_status.ready:
+        return 200, 'ready\n'
+    errors = len(warmup_status.errors)
+    detail = f', {errors} errors' if errors else ''
+    return 503, f'not ready ({warmup_status.phase}{detail})\n'
+
+
+def _register_endpoints() -> None:
+    """메트릭 서버에 '/ready', '/health'와 warm-up 메트릭을 등록"""
+    routes['/ready'] = _ready_response
+    routes['/health'] = lambda: (200, 'ok\n')
+    metrics.callback('exergy_ready', 'Whether warm-up has completed (1) or not (0).', lambda: int(warmup_status.ready))
+    metrics.callback(
+        'exergy_warmup_seconds', 'Time spent in (or so far in) the startup warm-up.',
+        lambda: warmup_status.as_dict()['seconds'],
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """warm-up을 시작하고 같은 프로세스에서 Streamlit 서버를 실행
+
+    Streamlit이 앱을 같은 프로세스에서 실행하므로 warm-up으로 채운 캐시를 모든 세션이 공유합니다.
+    알 수 없는 인자는 `streamlit run`에 그대로 전달합니다 (예: ``--server.port 8501``).
+    """
+    parser = argparse.ArgumentParser(description='Warm up caches and run the Streamlit dashboard.')
+    parser.add_argument('script', nargs='?', default='app.py', help='Streamlit app script')
+    parser.add_argument('--systems-dir', help='plugin folder (default: systems/ next to the script)')
+    parser.add_argument('--surrogate-dir', help='surrogate model folder (default: surrogates/ next to the script)')
+    args, streamlit_args = parser.parse_known_args(argv)
+
+    app_dir = os.path.dirname(os.path.abspath(args.script))
+    start_warmup(
+        args.systems_dir or os.path.join(app_dir, 'systems'),
+        args.surrogate_dir or os.path.join(app_dir, 'surrogates'),
+    )
+
+    from streamlit.web import cli as stcli
+
+    sys.argv = ['streamlit', 'run', args.script] + streamlit_args
+    sys.exit(stcli.main())
+
+
+if __name__ == '__main__':
+    # app.py가 임포트하는 모듈과 같은 warm-up 상태와 메트릭을 쓰도록 패키지 모듈로 실행
+    from exergy_dashboard import warmup
+
+    warmup.main()
@@ -0,0 +1,178 @@
+"""엑서지 소비 과정(waterfall) 정의 모듈
+
+시스템마다 waterfall 차트의 각 막대(라벨, 원본 변수, 부호 규칙, 설명)를 선언적으로
+등록하고, 하나의 벡터화된 빌더가 결과 테이블에서 N개 시스템의 long-form 데이터를
+한 번에 만듭니다.
+
+부호 규칙
+--------
+- ``'+'``: 변수값 그대로 (입력 엑서지)
+- ``'-'``: 변수값의 부호를 반대로 (소비/손실 엑서지)
+- ``'+abs'``: 변수값의 절댓값
+- ``'-abs'``: 변수값의 절댓값에 음수
+- ``'zero'``: 0 (마지막 출력 막대, 누적합으로 표시됨)
+
+Examples
+--------
+>>> from exergy_dashboard.waterfall import WaterfallStep, register_waterfall
+>>> register_waterfall('COOLING', 'Air source heat pump', [
+...     WaterfallStep('E_cmp', 'E_cmp', '+', 'Exergy input to the compressor.'),
+...     WaterfallStep('X_c_r', 'X_c_r', '-', 'Exergy consumed in the refrigerant loop.'),
+...     WaterfallStep('X_out', None, 'zero', 'Transferred exergy.'),
+... ])
+>>> source = build_waterfall_source(table, selected_systems, 'COOLING')
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from exergy_dashboard.results import ResultTable
+
+
+# 한 번에 표시할 waterfall 수 (선택한 시스템이 더 많으면 효율 순위로 페이지를 나눔)
+WATERFALL_PAGE_SIZE = 6
+
+# 부호 규칙: (부호, 절댓값 사용 여부)
+SIGN_RULES = {
+    '+': (1.0, False),
+    '-': (-1.0, False),
+    '+abs': (1.0, True),
+    '-abs': (-1.0, True),
+    'zero': (0.0, False),
+}
+
+
+@dataclass(frozen=True)
+class WaterfallStep:
+    """Waterfall 차트의 막대 하나에 대한 정의
+
+    Parameters
+    ----------
+    label : str
+        x축 라벨
+    source : str or None
+        값을 가져올 출력 변수 이름 (``'zero'`` 규칙이면 None)
+    sign : str
+        부호 규칙 (``SIGN_RULES`` 참조)
+    desc : str
+        툴팁 설명
+    desc_negative : str, optional
+        원본 변수값이 음수일 때 사용할 설명 (예: 'Cool' 대신 'Warm')
+    """
+    label: str
+    source: Optional[str]
+    sign: str
+    desc: str
+    desc_negative: Optional[str] = None
+
+    def __post_init__(self):
+        if self.sign not in SIGN_RULES:
+            raise ValueError(f"Unknown sign rule '{self.sign}' for step '{self.label}'")
+        if self.source is None and self.sign != 'zero':
+            raise ValueError(f"Step '{self.label}' needs a source variable")
+
+
+class WaterfallRegistry:
+    """(모드, 시스템 타입)별 waterfall 정의 레지스트리"""
+
+    def __init__(self):
+        self._specs: Dict[str, Dict[str, List[WaterfallStep]]] = {}
+
+    def register(self, mode: str, system_type: str, steps: Sequence[WaterfallStep]) -> None:
+        """시스템 타입의 waterfall 정의를 등록"""
+        mode = mode.upper()
+        if mode not in self._specs:
+            self._specs[mode] = {}
+        self._specs[mode][system_type] = list(steps)
+
+    def get(self, mode: str, system_type: str) -> Optional[List[WaterfallStep]]:
+        """등록된 waterfall 정의를 반환하고, 없으면 None을 반환"""
+        return self._specs.get(mode.upper(), {}).get(system_type)
+
+
+# 전역 레지스트리 인스턴스 생성
+waterfall_registry = WaterfallRegistry()
+
+
+def register_waterfall(mode: str, system_type: str, steps: Sequence[WaterfallStep]) -> None:
+    """waterfall 정의를 등록하는 편의 함수"""
+    waterfall_registry.register(mode, system_type, steps)
+
+
+def build_waterfall_source(
+    table: ResultTable,
+    selected_systems: Sequence[str],
+    mode: str,
+    registry: Optional[WaterfallRegistry] = None,
+) -> pd.DataFrame:
+    """선택한 시스템들의 waterfall long-form 데이터를 생성
+
+    시스템 타입별로 결과 테이블에서 (시스템 수, 막대 수) 값 행렬을 한 번에 꺼내
+    부호 규칙과 설명을 벡터 연산으로 적용합니다. waterfall 정의가 없는 시스템은 제외됩니다.
+
+    Parameters
+    ----------
+    table : ResultTable
+        세션 결과 테이블
+    selected_systems : Sequence[str]
+        시스템 이름 목록 (출력 순서)
+    mode : str
+        시스템 모드
+    registry : WaterfallRegistry, optional
+        waterfall 정의 레지스트리 (기본값: 전역 레지스트리)
+
+    Returns
+    -------
+    pd.DataFrame
+        'label', 'amount', 'desc', 'group' 열을 가진 데이터 (시스템별로 막대 순서대로)
+    """
+    registry = registry or waterfall_registry
+
+    # 시스템 타입별로 묶되, 원래 순서는 positions로 기억 (평가 결과가 없는 시스템은 제외)
+    by_type: Dict[str, List[int]] = {}
+    for i, name in enumerate(selected_systems):
+        if name in table:
+            by_type.setdefault(table.system_type(name), []).append(i)
+
+    blocks = []
+    for system_type, positions in by_type.items():
+        steps = registry.get(mode, system_type)
+        if not steps:
+            continue
+        names = [selected_systems[i] for i in positions]
+        n, k = len(names), len(steps)
+
+        signs = np.array([SIGN_RULES[s.sign][0] for s in steps])
+        use_abs = np.array([SIGN_RULES[s.sign][1] for s in steps])
+        sources = [s.source if s.source is not None else '' for s in steps]
+
+        raw = table.values(names, sources)
+        raw[:, signs == 0] = 0.0
+        amount = np.where(use_abs, np.abs(raw), raw) * signs
+
+        desc = np.array([s.desc for s in steps], dtype=object)
+        desc_negative = np.array(
+            [s.desc_negative if s.desc_negative is not None else s.desc for s in steps],
+            dtype=object,
+        )
+        descs = np.where(raw < 0, desc_negative, desc)
+
+        blocks.append(pd.DataFrame({
+            'label': np.tile(np.array([s.label for s in steps], dtype=object), n),
+            'amount': amount.ravel(),
+            'desc': descs.ravel(),
+            'group': np.repeat(np.array(names, dtype=object), k),
+            '_order': np.repeat(np.array(positions), k),
+            '_step': np.tile(np.arange(k), n),
+        }))
+
+    if not blocks:
+        return pd.DataFrame(columns=['label', 'amount', 'desc', 'group'])
+
+    source = pd.concat(blocks, ignore_index=True)
+    if len(blocks) > 1:
+        source = source.sort_values(['_order', '_step'], kind='stable', ignore_index=True)
+    return source.drop(columns=['_order', '_step'])
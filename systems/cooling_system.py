@@ -6,6 +6,13 @@ import altair as alt
 from exergy_dashboard.system import register_system
 from exergy_dashboard.evaluation import registry as eval_registry
 from exergy_dashboard.visualization import registry as viz_registry
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.waterfall import (
+    WATERFALL_PAGE_SIZE,
+    WaterfallStep,
+    build_waterfall_source,
+    register_waterfall,
+)
 from exergy_dashboard.chart import plot_waterfall_multi, create_efficiency_grade_chart
 import enex_analysis as enex
 
@@ -244,18 +251,71 @@ COOLING_GSHP = {
 register_system('COOLING', 'Air source heat pump', COOLING_ASHP)
 register_system('COOLING', 'Ground source heat pump', COOLING_GSHP)
 
+# COOLING 모드 엑서지 소비 과정(waterfall) 정의
+register_waterfall('COOLING', 'Air source heat pump', [
+    WaterfallStep('E_fan_ext', 'E_fan_ext', '+',
+                  'Exergy input required to operate the fan in the external unit.'),
+    WaterfallStep('X_r_ext(ext side)', 'X_r_ext', '+',
+                  'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'),
+    WaterfallStep('X_c_ext', 'X_c_ext', '-',
+                  'Exergy consumed during the heat exchange process in the external unit.'),
+    WaterfallStep('X_a_ext_out', 'X_a_ext_out', '-',
+                  'Exergy contained in the outlet air of the external unit, which is ultimately consumed.'),
+    WaterfallStep('E_cmp', 'E_cmp', '+',
+                  'Exergy input as electrical work to power the compressor.'),
+    WaterfallStep('X_c_r', 'X_c_r', '-',
+                  'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the refrigerant of internal and external units.'),
+    WaterfallStep('X_r_ext(ref side)', 'X_r_ext', '-',
+                  'Cool exergy transferred from the external unit side refrigerant to the outdoor air.',
+                  desc_negative='Warm exergy transferred from the external unit refrigerant to the outdoor air.'),
+    WaterfallStep('X_fan_int', 'E_fan_int', '+',
+                  'Exergy input required to operate the fan in the internal unit.'),
+    WaterfallStep('X_a_int_in', 'X_a_int_in', '+',
+                  'Exergy contained in the room air entering the internal unit.'),
+    WaterfallStep('X_c_int', 'X_c_int', '-',
+                  'Exergy consumed during the heat exchange process in the internal unit.'),
+    WaterfallStep('X_out', None, 'zero',
+                  'Transferred cool exergy to the room air. (X_a_int_out - X_a_int_in)'),
+])
+register_waterfall('COOLING', 'Ground source heat pump', [
+    WaterfallStep('X_in_g', 'X_in_g', '+',
+                  'Exergy input comming from the ground.'),
+    WaterfallStep('X_c_g', 'X_c_g', '-',
+                  'Exergy consumption during heat extraction from ground to borehole surface.'),
+    WaterfallStep('E_pmp', 'E_pmp', '+',
+                  'Exergy input required to operate the circulating pump in the ground heat exchanger.'),
+    WaterfallStep('X_c_GHE', 'X_c_GHE', '-',
+                  'Exergy consumed in the ground heat exchanger.'),
+    WaterfallStep('X_r_exch(GHE side)', 'X_r_exch', '+abs',
+                  'Cool exergy supplied by refrigerant.',
+                  desc_negative='Warm exergy supplied by refrigerant.'),
+    WaterfallStep('X_c_exch', 'X_c_exch', '-',
+                  'Exergy consumed in the heat exchanger.'),
+    WaterfallStep('E_cmp', 'E_cmp', '+',
+                  'Exergy input as electrical work to power the compressor.'),
+    WaterfallStep('X_c_r', 'X_c_r', '-',
+                  'Exergy consumed within the refrigerant loop.'),
+    WaterfallStep('X_r_exch(ref side)', 'X_r_exch', '-abs',
+                  'Cool exergy supplied to heat exchanger.',
+                  desc_negative='Warm exergy supplied to heat exchanger.'),
+    WaterfallStep('E_fan_int', 'E_fan_int', '+',
+                  'Exergy input as electrical work to operate the internal unit fan.'),
+    WaterfallStep('X_a_int_in', 'X_a_int_in', '+',
+                  'Exergy contained in the room air entering the internal unit.'),
+    WaterfallStep('X_c_int', 'X_c_int', '-',
+                  'Exergy consumed in the internal unit during heat exchange.'),
+    WaterfallStep('X_out', None, 'zero',
+                  'Transferred cool exergy to the room air. (X_a_int_out - X_a_int_in)'),
+])
+
 
 # COOLING 모드 시각화 함수들
 @viz_registry.register('COOLING', 'Exergy efficiency')
 def plot_exergy_efficiency(session_state: Any, selected_systems: List[str]) -> alt.Chart:
     """엑서지 효율 차트 생성"""
     # COOLING 모드 전용 시각화
-    efficiencies = []
-    
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        eff = sv['X_eff'] * 100
-        efficiencies.append(eff)
+    table = get_result_table(session_state, selected_systems)
+    efficiencies = table.column('X_eff', selected_systems) * 100
 
     chart_data = pd.DataFrame({
         'efficiency': efficiencies,
@@ -307,76 +367,13 @@ def plot_exergy_efficiency(session_state: Any, selected_systems: List[str]) -> a
 
     return c + text
 
-@viz_registry.register('COOLING', 'Exergy consumption process')
-def plot_exergy_consumption(session_state: Any, selected_systems: List[str]) -> alt.Chart:
+@viz_registry.register('COOLING', 'Exergy consumption process', page_size=WATERFALL_PAGE_SIZE)
+def plot_exergy_consumption(session_state: Any, selected_systems: List[str]) -> Any:
     """엑서지 소비 과정 차트 생성"""
-    # COOLING 모드 전용 시각화
-    sources = []
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        sys_type = session_state.systems[key]['type']
-        
-        if sys_type == 'Air source heat pump':
-            items = [
-            {'label': 'E_fan_ext', 'amount': sv['E_fan_ext'],
-                'desc': 'Exergy input required to operate the fan in the external unit.'},
-            {'label': 'X_r_ext(ext side)', 'amount': sv['X_r_ext'],
-                'desc': 'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'},
-            {'label': 'X_c_ext', 'amount': -sv['X_c_ext'],
-                'desc': 'Exergy consumed during the heat exchange process in the external unit.'},
-            {'label': 'X_a_ext_out', 'amount': -sv['X_a_ext_out'],
-                'desc': 'Exergy contained in the outlet air of the external unit, which is ultimately consumed.'},
-            {'label': 'E_cmp', 'amount': sv['E_cmp'],
-                'desc': 'Exergy input as electrical work to power the compressor.'},
-            {'label': 'X_c_r', 'amount': -sv['X_c_r'],
-                'desc': 'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the refrigerant of internal and external units.'},
-            {'label': 'X_r_ext(ref side)', 'amount': -sv['X_r_ext'],
-                'desc': 'Cool exergy transferred from the external unit side refrigerant to the outdoor air.' if sv['X_r_ext'] >= 0 else 'Warm exergy transferred from the external unit refrigerant to the outdoor air.'},
-            {'label': 'X_fan_int', 'amount': sv['E_fan_int'],
-                'desc': 'Exergy input required to operate the fan in the internal unit.'},
-            {'label': 'X_a_int_in', 'amount': sv['X_a_int_in'],
-                'desc': 'Exergy contained in the room air entering the internal unit.'},
-            {'label': 'X_c_int', 'amount': -sv['X_c_int'],
-                'desc': 'Exergy consumed during the heat exchange process in the internal unit.'},
-            {'label': 'X_out', 'amount': 0,
-                'desc': 'Transferred cool exergy to the room air. (X_a_int_out - X_a_int_in)'},
-            ]
-        
-        if sys_type == 'Ground source heat pump':
-            items = [
-            {'label': 'X_in_g', 'amount': sv['X_in_g'], 
-             'desc': 'Exergy input comming from the ground.'},
-            {'label': 'X_c_g', 'amount': -sv['X_c_g'],
-             'desc': 'Exergy consumption during heat extraction from ground to borehole surface.'},
-            {'label': 'E_pmp', 'amount': sv['E_pmp'],
-             'desc': 'Exergy input required to operate the circulating pump in the ground heat exchanger.'},
-            {'label': 'X_c_GHE', 'amount': -sv['X_c_GHE'], 'desc': 'Exergy consumed in the ground heat exchanger.'},
-            {'label': 'X_r_exch(GHE side)', 'amount': abs(sv['X_r_exch']),
-             'desc': f"{'Cool' if sv['X_r_exch'] >= 0 else 'Warm'} exergy supplied by refrigerant."},
-            {'label': 'X_c_exch', 'amount': -sv['X_c_exch'], 
-             'desc': 'Exergy consumed in the heat exchanger.'},
-            {'label': 'E_cmp', 'amount': sv['E_cmp'], 
-             'desc': 'Exergy input as electrical work to power the compressor.'},
-            {'label': 'X_c_r', 'amount': -sv['X_c_r'], 
-             'desc': 'Exergy consumed within the refrigerant loop.'},
-            {'label': 'X_r_exch(ref side)', 'amount': -abs(sv['X_r_exch']), 
-             'desc': f"{'Cool' if sv['X_r_exch'] >= 0 else 'Warm'} exergy supplied to heat exchanger."},
-            {'label': 'E_fan_int', 'amount': sv['E_fan_int'], 
-             'desc': 'Exergy input as electrical work to operate the internal unit fan.'},
-            {'label': 'X_a_int_in', 'amount': sv['X_a_int_in'], 
-             'desc': 'Exergy contained in the room air entering the internal unit.'},
-            {'label': 'X_c_int', 'amount': -sv['X_c_int'], 
-             'desc': 'Exergy consumed in the internal unit during heat exchange.'},
-            {'label': 'X_out', 'amount': 0, 'desc': 'Transferred cool exergy to the room air. (X_a_int_out - X_a_int_in)'},
-            ]
-            
-        for item in items:
-            item['group'] = key
-        source = pd.DataFrame(items)
-        sources.append(source)
-
-    if sources:
-        source = pd.concat(sources)
+    # COOLING 모드 전용 시각화 (막대 정의는 위의 register_waterfall 참조)
+    table = get_result_table(session_state, selected_systems)
+    source = build_waterfall_source(table, selected_systems, 'COOLING')
+    if not source.empty:
         return plot_waterfall_multi(source)
     return alt.Chart(pd.DataFrame({'x': [0], 'y': [0]})).mark_point()
 
@@ -386,15 +383,15 @@ grade_range_cooling = [(0,E), (E,D), (D,C), (C,B), (B,A), (A,A_plus)]
 
 # COOLING 모드 시각화 함수들
 @viz_registry.register('COOLING', 'Exergy efficiency grade')
-def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]) -> alt.Chart:
+def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]) -> Dict[str, Any]:
     """엑서지 효율 차트 생성"""
     # COOLING 모드 전용 시각화
     cases = [
 
     ]
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        eff = sv['X_eff'] * 100
+    table = get_result_table(session_state, selected_systems)
+    efficiencies = table.column('X_eff', selected_systems) * 100
+    for key, eff in zip(selected_systems, efficiencies):
         name = ''.join(c[0] for c in key.title().split()[:-1]) + ' ' + key.title().split()[-1]
         cases.append({
             'name': name,
@@ -416,7 +413,8 @@ def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]
         text_dy=-12,
         grade_unit=8,
         grade_ranges=grade_range_cooling,
-    ).properties(height=230)
+        height=230,
+    )
 
     return chart
 
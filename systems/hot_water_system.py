@@ -8,6 +8,13 @@ import enex_analysis as enex
 from exergy_dashboard.system import register_system
 from exergy_dashboard.evaluation import registry as eval_registry
 from exergy_dashboard.visualization import registry as viz_registry
+from exergy_dashboard.results import get_result_table
+from exergy_dashboard.waterfall import (
+    WATERFALL_PAGE_SIZE,
+    WaterfallStep,
+    build_waterfall_source,
+    register_waterfall,
+)
 from exergy_dashboard.chart import plot_waterfall_multi, create_efficiency_grade_chart
 
 
@@ -834,16 +841,137 @@ register_system('HOT WATER', 'Heat pump boiler', HEAT_PUMP_BOILER)
 register_system('HOT WATER', 'Solar assisted gas boiler', SOLAR_ASSISTED_GAS_BOILER)
 register_system('HOT WATER', 'Ground source heat pump boiler', GSHP_BOILER)
 
+# HOT WATER 모드 엑서지 소비 과정(waterfall) 정의
+register_waterfall('HOT WATER', 'Electric boiler', [
+    WaterfallStep('X_w_sup_tank', 'X_w_sup_tank', '+',
+                  'Exergy of the supply water flowing into the hot water tank.'),
+    WaterfallStep('X_heater', 'X_heater', '+',
+                  'Exergy input from electricity to the heater.'),
+    WaterfallStep('X_c_tank', 'X_c_tank', '-',
+                  'Exergy consumption during the energy conversion process from electricity to thermal energy in the hot water tank.'),
+    WaterfallStep('X_l_tank', 'X_l_tank', '-',
+                  'Exergy lost due to heat loss through the tank envelope.'),
+    WaterfallStep('X_w_sup_mix', 'X_w_sup_mix', '+',
+                  'Exergy of the cold supply water directed to the mixing valve.'),
+    WaterfallStep('X_c_mix', 'X_c_mix', '-',
+                  'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'),
+    WaterfallStep('X_w_serv', None, 'zero',
+                  'Exergy contained in the final service hot water supplied to the user.'),
+])
+register_waterfall('HOT WATER', 'Gas boiler', [
+    WaterfallStep('X_w_sup', 'X_w_sup', '+',
+                  'Exergy of the supply water entering the combustion chamber for heating'),
+    WaterfallStep('X_NG', 'X_NG', '+',
+                  'Exergy input from the chemical potential of the natural gas fuel'),
+    WaterfallStep('X_c_comb', 'X_c_comb', '-',
+                  'Exergy consumption during the energy conversion process from chemical potential to thermal energy in the combustion chamber'),
+    WaterfallStep('X_exh', 'X_exh', '-',
+                  'Exergy carried away by the hot exhaust gases, which is ultimately consumed as it dissipates into the environment'),
+    WaterfallStep('X_c_tank', 'X_c_tank', '-',
+                  'Exergy consumption during the heat transfer process within the hot water tank.'),
+    WaterfallStep('X_l_tank', 'X_l_tank', '-',
+                  'Exergy from heat loss through the tank envelope, which is ultimately consumed'),
+    WaterfallStep('X_w_sup_mix', 'X_w_sup_mix', '+',
+                  'Exergy of the cold supply water directed to the mixing valve for temperature adjustment'),
+    WaterfallStep('X_c_mix', 'X_c_mix', '-',
+                  'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'),
+    WaterfallStep('X_w_serv', None, 'zero',
+                  'Exergy contained in the final service hot water supplied to the user.'),
+])
+register_waterfall('HOT WATER', 'Heat pump boiler', [
+    WaterfallStep('X_fan', 'X_fan', '+',
+                  'Exergy input required to operate the fan in the external unit.'),
+    WaterfallStep('X_r_ext(ext side)', 'X_r_ext', '+',
+                  'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'),
+    WaterfallStep('X_a_ext_in', 'X_a_ext_in', '+',
+                  'Exergy contained in the outdoor air entering the external unit.'),
+    WaterfallStep('X_c_ext', 'X_c_ext', '-',
+                  'Exergy consumed during the heat exchange process in the external unit.'),
+    WaterfallStep('X_a_ext_out', 'X_a_ext_out', '-',
+                  'Exergy contained in the outlet air of the external unit, which is ultimately lost.'),
+    WaterfallStep('X_cmp', 'X_cmp', '+',
+                  'Exergy input as electrical work to power the compressor.'),
+    WaterfallStep('X_c_r', 'X_c_r', '-',
+                  'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the refrigerant in hot water tank and external units.'),
+    WaterfallStep('X_r_ext(ref side)', 'X_r_ext', '-',
+                  'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'),
+    WaterfallStep('X_l_tank', 'X_l_tank', '-',
+                  'Exergy lost due to heat loss through the tank envelope, which is ultimately consumed.'),
+    WaterfallStep('X_c_tank', 'X_c_tank', '-',
+                  'Exergy consumed during heat transfer from the refrigerant to the water in the tank.'),
+    WaterfallStep('X_w_sup_tank', 'X_w_sup_tank', '+',
+                  'Exergy of the supply water entering the hot water tank.'),
+    WaterfallStep('X_w_sup_mix', 'X_w_sup_mix', '+',
+                  'Exergy of the cold supply water directed to the mixing valve.'),
+    WaterfallStep('X_c_mix', 'X_c_mix', '-',
+                  'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'),
+    WaterfallStep('X_w_serv', None, 'zero',
+                  'Exergy contained in the final service hot water supplied to the user.'),
+])
+register_waterfall('HOT WATER', 'Solar assisted gas boiler', [
+    WaterfallStep('X_w_sup', 'X_w_sup', '+',
+                  'Exergy of the supply water entering the solar thermal collector.'),
+    WaterfallStep('X_sol', 'X_sol', '+',
+                  'Supplied exergy coming from solar irradiation before being absorbed by the collector.'),
+    WaterfallStep('X_c_stc', 'X_c_stc', '-',
+                  'Exergy consumed during the heat transfer process in the solar thermal collector.'),
+    WaterfallStep('X_l', 'X_l', '-',
+                  'Exergy lost due to heat loss from the solar thermal collector system.'),
+    WaterfallStep('X_NG', 'X_NG', '+',
+                  'Exergy input from the chemical potential of the natural gas fuel.'),
+    WaterfallStep('X_c_comb', 'X_c_comb', '-',
+                  'Exergy consumed during the combustion process in the gas boiler.'),
+    WaterfallStep('X_exh', 'X_exh', '-',
+                  'Exergy carried away by the exhaust gases, which is ultimately lost to the environment.'),
+    WaterfallStep('X_w_sup_mix', 'X_w_sup_mix', '+',
+                  'Exergy of the cold supply water directed to the mixing valve for temperature adjustment.'),
+    WaterfallStep('X_c_mix', 'X_c_mix', '-',
+                  'Exergy consumed during the mixing of hot water and cold supply water to achieve the desired service hot water temperature.'),
+    WaterfallStep('X_w_serv', None, 'zero',
+                  'Exergy contained in the final service hot water supplied to the user.'),
+])
+register_waterfall('HOT WATER', 'Ground source heat pump boiler', [
+    WaterfallStep('Xin_g', 'Xin_g', '+',
+                  'Exergy input comming from the ground.'),
+    WaterfallStep('Xc_g', 'Xc_g', '-',
+                  'Exergy consumption during heat extraction from ground to borehole wall surface.'),
+    WaterfallStep('E_pmp', 'E_pmp', '+',
+                  'Exergy input required to operate the circulating pump in the ground heat exchanger.'),
+    WaterfallStep('Xc_GHE', 'Xc_GHE', '-',
+                  'Exergy consumption in the ground heat exchanger (GHE) during heat transfer.'),
+    WaterfallStep('X_r_exch(GHE side)', 'X_r_exch', '+abs',
+                  'Cool exergy supplied by refrigerant to ground heat exchanger loop.',
+                  desc_negative='Warm exergy supplied by refrigerant to ground heat exchanger loop.'),
+    WaterfallStep('Xc_exch', 'Xc_exch', '-',
+                  'Exergy consumption in the external heat exchanger.'),
+    WaterfallStep('X_cmp', 'X_cmp', '+',
+                  'Exergy input as electrical work to power the compressor.'),
+    WaterfallStep('Xc_r', 'Xc_r', '-',
+                  'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the heat exchanger and the refrigerant.'),
+    WaterfallStep('X_r_exch(ref side)', 'X_r_exch', '-abs',
+                  'Cool exergy supplied to the heat exchanger.',
+                  desc_negative='Warm exergy supplied to the heat exchanger.'),
+    WaterfallStep('X_l_tank', 'X_l_tank', '-',
+                  'Exergy lost due to heat loss through the tank envelope, which is ultimately consumed.'),
+    WaterfallStep('X_w_sup_tank', 'X_w_sup_tank', '+',
+                  'Exergy of the supply water entering the hot water tank.'),
+    WaterfallStep('Xc_tank', 'Xc_tank', '-',
+                  'Exergy consumed during heat transfer from refrigerant to water in the tank.'),
+    WaterfallStep('X_w_sup_mix', 'X_w_sup_mix', '+',
+                  'Exergy of the cold supply water directed to the mixing valve.'),
+    WaterfallStep('Xc_mix', 'Xc_mix', '-',
+                  'Exergy consumed during the mixing process to achieve the desired service hot water temperature.'),
+    WaterfallStep('X_w_serv', None, 'zero',
+                  'Exergy contained in the final service hot water supplied to the user.'),
+])
+
 # HOT WATER 모드 시각화 함수들
 @viz_registry.register('HOT WATER', 'Exergy efficiency')
 def plot_exergy_efficiency(session_state: Any, selected_systems: List[str]) -> alt.Chart:
     """엑서지 효율 차트 생성"""
     # HOT WATER 모드 전용 시각화
-    efficiencies = []
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        eff = sv['X_eff'] * 100
-        efficiencies.append(eff)
+    table = get_result_table(session_state, selected_systems)
+    efficiencies = table.column('X_eff', selected_systems) * 100
 
     chart_data = pd.DataFrame({
         'efficiency': efficiencies,
@@ -902,117 +1030,13 @@ def plot_exergy_efficiency(session_state: Any, selected_systems: List[str]) -> a
     return chart
 
 
-@viz_registry.register('HOT WATER', 'Exergy consumption process')
-def plot_exergy_consumption(session_state: Any, selected_systems: List[str]) -> alt.Chart:
+@viz_registry.register('HOT WATER', 'Exergy consumption process', page_size=WATERFALL_PAGE_SIZE)
+def plot_exergy_consumption(session_state: Any, selected_systems: List[str]) -> Any:
     """엑서지 소비 과정 차트 생성"""
-    # COOLING 모드 전용 시각화
-    sources = []
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        sys_type = session_state.systems[key]['type']
-        # 라벨별 설명문 매핑 (EN 기준)
-        if sys_type == 'Electric boiler':
-            items = [
-            {'label': 'X_w_sup_tank', 'amount': sv['X_w_sup_tank'],
-             'desc': 'Exergy of the supply water flowing into the hot water tank.'},
-            {'label': 'X_heater', 'amount': sv['X_heater'],
-             'desc': 'Exergy input from electricity to the heater.'},
-            {'label': 'X_c_tank', 'amount': -sv['X_c_tank'],
-             'desc': 'Exergy consumption during the energy conversion process from electricity to thermal energy in the hot water tank.'},
-            {'label': 'X_l_tank', 'amount': -sv['X_l_tank'],
-             'desc': 'Exergy lost due to heat loss through the tank envelope.'},
-            {'label': 'X_w_sup_mix', 'amount': sv['X_w_sup_mix'],
-             'desc': 'Exergy of the cold supply water directed to the mixing valve.'},
-            {'label': 'X_c_mix', 'amount': -sv['X_c_mix'],
-             'desc': 'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'},
-            {'label': 'X_w_serv', 'amount': 0,
-             'desc': 'Exergy contained in the final service hot water supplied to the user.'},
-            ]
-
-        if sys_type == 'Gas boiler':
-            items = [
-            {'label': 'X_w_sup', 'amount': sv['X_w_sup'], 'desc': 'Exergy of the supply water entering the combustion chamber for heating'},
-            {'label': 'X_NG', 'amount': sv['X_NG'], 'desc': 'Exergy input from the chemical potential of the natural gas fuel'},
-            {'label': 'X_c_comb', 'amount': -sv['X_c_comb'], 'desc': 'Exergy consumption during the energy conversion process from chemical potential to thermal energy in the combustion chamber'},
-            {'label': 'X_exh', 'amount': -sv['X_exh'], 'desc': 'Exergy carried away by the hot exhaust gases, which is ultimately consumed as it dissipates into the environment'},
-            {'label': 'X_c_tank', 'amount': -sv['X_c_tank'], 'desc': 'Exergy consumption during the heat transfer process within the hot water tank.'},
-            {'label': 'X_l_tank', 'amount': -sv['X_l_tank'], 'desc': 'Exergy from heat loss through the tank envelope, which is ultimately consumed'},
-            {'label': 'X_w_sup_mix', 'amount': sv['X_w_sup_mix'], 'desc': 'Exergy of the cold supply water directed to the mixing valve for temperature adjustment'},
-            {'label': 'X_c_mix', 'amount': -sv['X_c_mix'], 'desc': 'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'},
-            {'label': 'X_w_serv', 'amount': 0, 'desc': 'Exergy contained in the final service hot water supplied to the user.'},
-            ]
-        if sys_type == 'Heat pump boiler':
-            items = [
-                {'label': 'X_fan', 'amount': sv['X_fan'],
-                    'desc': 'Exergy input required to operate the fan in the external unit.'},
-                {'label': 'X_r_ext(ext side)', 'amount': sv['X_r_ext'],
-                    'desc': 'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'},
-                {'label': 'X_a_ext_in', 'amount': sv['X_a_ext_in'],
-                    'desc': 'Exergy contained in the outdoor air entering the external unit.'},
-                {'label': 'X_c_ext', 'amount': -sv['X_c_ext'],
-                    'desc': 'Exergy consumed during the heat exchange process in the external unit.'},
-                {'label': 'X_a_ext_out', 'amount': -sv['X_a_ext_out'],
-                    'desc': 'Exergy contained in the outlet air of the external unit, which is ultimately lost.'},
-                {'label': 'X_cmp', 'amount': sv['X_cmp'],
-                    'desc': 'Exergy input as electrical work to power the compressor.'},
-                {'label': 'X_c_r', 'amount': -sv['X_c_r'],
-                    'desc': 'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the refrigerant in hot water tank and external units.'},
-                {'label': 'X_r_ext(ref side)', 'amount': -sv['X_r_ext'],
-                    'desc': 'Cool exergy transferred from the external unit side refrigerant to the outdoor air.'},
-                {'label': 'X_l_tank', 'amount': -sv['X_l_tank'],
-                    'desc': 'Exergy lost due to heat loss through the tank envelope, which is ultimately consumed.'},
-                {'label': 'X_c_tank', 'amount': -sv['X_c_tank'],
-                    'desc': 'Exergy consumed during heat transfer from the refrigerant to the water in the tank.'},
-                {'label': 'X_w_sup_tank', 'amount': sv['X_w_sup_tank'],
-                    'desc': 'Exergy of the supply water entering the hot water tank.'},
-                {'label': 'X_w_sup_mix', 'amount': sv['X_w_sup_mix'],
-                    'desc': 'Exergy of the cold supply water directed to the mixing valve.'},
-                {'label': 'X_c_mix', 'amount': -sv['X_c_mix'],
-                    'desc': 'Exergy consumed during the mixing of hot water from the tank and cold supply water to achieve the desired service hot water temperature.'},
-                {'label': 'X_w_serv', 'amount': 0,
-                    'desc': 'Exergy contained in the final service hot water supplied to the user.'},
-            ]
-
-        if sys_type == 'Solar assisted gas boiler':
-            items = [
-            {'label': 'X_w_sup', 'amount': sv['X_w_sup'], 'desc': 'Exergy of the supply water entering the solar thermal collector.'},
-            {'label': 'X_sol', 'amount': sv['X_sol'], 'desc': 'Supplied exergy coming from solar irradiation before being absorbed by the collector.'},
-            {'label': 'X_c_stc', 'amount': -sv['X_c_stc'], 'desc': 'Exergy consumed during the heat transfer process in the solar thermal collector.'},
-            {'label': 'X_l', 'amount': -sv['X_l'], 'desc': 'Exergy lost due to heat loss from the solar thermal collector system.'},
-            {'label': 'X_NG', 'amount': sv['X_NG'], 'desc': 'Exergy input from the chemical potential of the natural gas fuel.'},
-            {'label': 'X_c_comb', 'amount': -sv['X_c_comb'], 'desc': 'Exergy consumed during the combustion process in the gas boiler.'},
-            {'label': 'X_exh', 'amount': -sv['X_exh'], 'desc': 'Exergy carried away by the exhaust gases, which is ultimately lost to the environment.'},
-            {'label': 'X_w_sup_mix', 'amount': sv['X_w_sup_mix'], 'desc': 'Exergy of the cold supply water directed to the mixing valve for temperature adjustment.'},
-            {'label': 'X_c_mix', 'amount': -sv['X_c_mix'], 'desc': 'Exergy consumed during the mixing of hot water and cold supply water to achieve the desired service hot water temperature.'},
-            {'label': 'X_w_serv', 'amount': 0, 'desc': 'Exergy contained in the final service hot water supplied to the user.'},
-            ]
-
-        if sys_type == 'Ground source heat pump boiler':
-            items = [
-            {'label': 'Xin_g', 'amount': sv['Xin_g'], 'desc': 'Exergy input comming from the ground.'},
-            {'label': 'Xc_g', 'amount': -sv['Xc_g'], 'desc': 'Exergy consumption during heat extraction from ground to borehole wall surface.'},
-            {'label': 'E_pmp', 'amount': sv['E_pmp'], 'desc': 'Exergy input required to operate the circulating pump in the ground heat exchanger.'},
-            {'label': 'Xc_GHE', 'amount': -sv['Xc_GHE'], 'desc': 'Exergy consumption in the ground heat exchanger (GHE) during heat transfer.'},
-            {'label': 'X_r_exch(GHE side)', 'amount': abs(sv['X_r_exch']), 'desc': f"{'Cool' if sv['X_r_exch'] >= 0 else 'Warm'} exergy supplied by refrigerant to ground heat exchanger loop."},
-            {'label': 'Xc_exch', 'amount': -sv['Xc_exch'], 'desc': 'Exergy consumption in the external heat exchanger.'},
-            {'label': 'X_cmp', 'amount': sv['X_cmp'], 'desc': 'Exergy input as electrical work to power the compressor.'},
-            {'label': 'Xc_r', 'amount': -sv['Xc_r'], 'desc': 'Exergy consumed within the refrigerant cycle, which uses electrical exergy to transfer thermal exergy between the heat exchanger and the refrigerant.'},
-            {'label': 'X_r_exch(ref side)', 'amount': -abs(sv['X_r_exch']), 'desc': f"{'Cool' if sv['X_r_exch'] >= 0 else 'Warm'} exergy supplied to the heat exchanger."},
-            {'label': 'X_l_tank', 'amount': -sv['X_l_tank'], 'desc': 'Exergy lost due to heat loss through the tank envelope, which is ultimately consumed.'},
-            {'label': 'X_w_sup_tank', 'amount': sv['X_w_sup_tank'], 'desc': 'Exergy of the supply water entering the hot water tank.'},
-            {'label': 'Xc_tank', 'amount': -sv['Xc_tank'], 'desc': 'Exergy consumed during heat transfer from refrigerant to water in the tank.'},
-            {'label': 'X_w_sup_mix', 'amount': sv['X_w_sup_mix'], 'desc': 'Exergy of the cold supply water directed to the mixing valve.'},
-            {'label': 'Xc_mix', 'amount': -sv['Xc_mix'], 'desc': 'Exergy consumed during the mixing process to achieve the desired service hot water temperature.'},
-            {'label': 'X_w_serv', 'amount': 0, 'desc': 'Exergy contained in the final service hot water supplied to the user.'},
-            ]
-            
-        for item in items:
-            item['group'] = key
-        source = pd.DataFrame(items)
-        sources.append(source)
-
-    if sources:
-        source = pd.concat(sources)
+    # HOT WATER 모드 전용 시각화 (막대 정의는 위의 register_waterfall 참조)
+    table = get_result_table(session_state, selected_systems)
+    source = build_waterfall_source(table, selected_systems, 'HOT WATER')
+    if not source.empty:
         return plot_waterfall_multi(source)
     return alt.Chart(pd.DataFrame({'x': [0], 'y': [0]})).mark_point()
 
@@ -1022,15 +1046,15 @@ grade_range_hot_water = [(0,E), (E,D), (D,C), (C,B), (B,A), (A,A_plus)]
 
 # HEATING 모드 시각화 함수들
 @viz_registry.register('HOT WATER', 'Exergy efficiency grade')
-def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]) -> alt.Chart:
+def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]) -> Dict[str, Any]:
     """엑서지 효율 차트 생성"""
     # COOLING 모드 전용 시각화
     cases = [
 
     ]
-    for key in selected_systems:
-        sv = session_state.systems[key]['variables']
-        eff = sv['X_eff'] * 100
+    table = get_result_table(session_state, selected_systems)
+    efficiencies = table.column('X_eff', selected_systems) * 100
+    for key, eff in zip(selected_systems, efficiencies):
         name = ''.join(c[0] for c in key.title().split()[:-1]) + ' ' + key.title().split()[-1]
         cases.append({
             'name': name,
@@ -1051,7 +1075,8 @@ def plot_exergy_efficiency_grade(session_state: Any, selected_systems: List[str]
         text_dx=7,
         text_dy=-12,
         grade_ranges = grade_range_hot_water,
-    ).properties(height=230)
+        height=230,
+    )
 
     print(cases)
     return chart
@@ -0,0 +1,74 @@
+"""테스트 공통 fixture
+
+평가 엔진(enex_analysis)과 `systems/` 플러그인 없이 실행되도록, 계산이 단순한 장난감 시스템을
+테스트 전용 모드에 등록하고 테스트마다 독립된 평가 레지스트리/캐시/스케줄러를 만듭니다.
+"""
+
+import pytest
+
+from exergy_dashboard.evaluation import EvaluationCache, EvaluationRegistry
+from exergy_dashboard.scheduler import EvaluationScheduler
+from exergy_dashboard.system import register_system, system_registry
+
+
+# 테스트 전용 모드와 시스템 타입
+MODE = 'PYTEST'
+SYSTEM_TYPE = 'Toy system'
+
+TOY_SYSTEM = {
+    'display': {'title': 'Toy system', 'icon': ':test_tube:'},
+    'parameters': {
+        'T_0': {
+            'explanation': {'EN': 'Environment temperature', 'KR': '환경 온도'},
+            'latex': r'$T_0$',
+            'default': 30.0,
+            'range': [-50, 50],
+            'unit': '℃',
+            'step': 0.5,
+        },
+        'T_room': {
+            'explanation': {'EN': 'Room temperature', 'KR': '실내 온도'},
+            'latex': r'$T_{room}$',
+            'default': 20.0,
+            'range': [-50, 'T_0 - 1.0'],
+            'unit': '℃',
+            'step': 0.5,
+        },
+    },
+}
+
+
+def evaluate_toy(params):
+    if params['T_0'] == 13.0:
+        raise ValueError('unlucky input')
+    return {'X_eff': 1 - (params['T_room'] + 273.15) / (params['T_0'] + 273.15), 'model': object()}
+
+
+@pytest.fixture(scope='session', autouse=True)
+def toy_system():
+    """테스트 전용 모드에 장난감 시스템을 등록 (끝나면 제거)"""
+    register_system(MODE, SYSTEM_TYPE, TOY_SYSTEM)
+    yield
+    system_registry._systems.pop(MODE, None)
+
+
+@pytest.fixture
+def evaluator():
+    registry = EvaluationRegistry()
+    registry.register(MODE, SYSTEM_TYPE)(evaluate_toy)
+    return registry
+
+
+@pytest.fixture
+def make_scheduler(evaluator):
+    """독립된 레지스트리/캐시를 쓰는 스케줄러 생성 함수 (끝나면 워커 종료)"""
+    created = []
+
+    def make(**kwargs):
+        scheduler = EvaluationScheduler(evaluator=evaluator, cache=EvaluationCache(), **kwargs)
+        created.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in created:
+        scheduler.shutdown()
@@ -0,0 +1,131 @@
+import io
+import json
+from wsgiref.util import setup_testing_defaults
+
+import pytest
+
+from exergy_dashboard import api
+from exergy_dashboard.api import EvaluationAPI
+
+from conftest import MODE, SYSTEM_TYPE
+
+
+@pytest.fixture
+def app(make_scheduler):
+    return EvaluationAPI(scheduler=make_scheduler(max_workers=2))
+
+
+def call(app, method, path, body=None, query=''):
+    """WSGI 앱을 직접 호출하고 (상태 코드, 응답 본문)을 반환"""
+    data = body if isinstance(body, bytes) else (b'' if body is None else json.dumps(body).encode())
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'CONTENT_LENGTH': str(len(data)),
+        'wsgi.input': io.BytesIO(data),
+    }
+    setup_testing_defaults(environ)
+    status = []
+    body = b''.join(app(environ, lambda line, headers: status.append(line)))
+    return int(status[0].split()[0]), body
+
+
+def request(params, **fields):
+    return {'mode': MODE, 'system_type': SYSTEM_TYPE, 'params': params, **fields}
+
+
+def error(body):
+    return json.loads(body)['error']
+
+
+def test_evaluate(app):
+    status, body = call(app, 'POST', '/evaluate', request({'T_0': 25.0}))
+
+    assert status == 200
+    result = json.loads(body)
+    assert result['params'] == {'T_0': 25.0, 'T_room': 20.0}
+    assert set(result['variables']) == {'X_eff'}
+
+
+def test_evaluate_batch_streams_results_in_order(app):
+    status, body = call(app, 'POST', '/evaluate/batch', request([{'T_0': 30.0}, {'T_0': 13.0, 'T_room': 10.0}]))
+
+    assert status == 200
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert [line['index'] for line in lines] == [0, 1]
+    assert 'variables' in lines[0]
+    assert lines[1]['error'] == 'unlucky input'
+
+
+def test_systems_lists_schema(app):
+    status, body = call(app, 'GET', '/systems', query=f'mode={MODE.lower()}')
+
+    assert status == 200
+    assert list(json.loads(body)[MODE][SYSTEM_TYPE]['parameters']) == ['T_0', 'T_room']
+
+
+@pytest.mark.parametrize('method, path, query', [
+    ('GET', '/missing', ''),
+    ('POST', '/evaluate/missing', ''),
+    ('GET', '/systems', 'mode=unknown'),
+])
+def test_not_found(app, method, path, query):
+    status, body = call(app, method, path, query=query)
+
+    assert status == 404
+    assert error(body)
+
+
+@pytest.mark.parametrize('method, path', [
+    ('GET', '/evaluate'),
+    ('PUT', '/evaluate/batch'),
+    ('POST', '/systems'),
+])
+def test_method_not_allowed(app, method, path):
+    status, body = call(app, method, path)
+
+    assert status == 405
+    assert 'Method not allowed' in error(body)
+
+
+@pytest.mark.parametrize('body, message', [
+    (b'{not json', 'Invalid JSON'),
+    ([1, 2], 'must be a JSON object'),
+    (request({}, mode=1), 'must be strings'),
+    (request({}, mode='unknown'), 'Unknown mode'),
+    (request({}, system_type='Unknown system'), 'Unknown system type'),
+    (request([]), "'params' must be an object"),
+    (request({'T_1': 1.0}), 'Unknown parameters: T_1'),
+    (request({'T_0': '30'}), 'must be a finite number'),
+    (request({'T_0': True}), 'must be a finite number'),
+    (request({'T_0': 80.0}), "'T_0' = 80.0 is outside"),
+    (request({'T_0': 30.0, 'T_room': 29.5}), "'T_room' = 29.5 is outside"),
+])
+def test_evaluate_bad_request(app, body, message):
+    status, response = call(app, 'POST', '/evaluate', body)
+
+    assert status == 400
+    assert message in error(response)
+
+
+def test_batch_bad_request_names_the_item(app):
+    status, body = call(app, 'POST', '/evaluate/batch', request([{'T_0': 30.0}, {'T_0': 99.0}]))
+
+    assert status == 400
+    assert error(body).startswith('params[1]:')
+
+
+def test_batch_params_must_be_a_list(app):
+    status, body = call(app, 'POST', '/evaluate/batch', request({'T_0': 30.0}))
+
+    assert status == 400
+    assert 'must be an array' in error(body)
+
+
+def test_batch_too_large(app, monkeypatch):
+    monkeypatch.setattr(api, 'MAX_BATCH_SIZE', 2)
+
+    status, _ = call(app, 'POST', '/evaluate/batch', request([{}, {}, {}]))
+
+    assert status == 413
@@ -0,0 +1,72 @@
+import base64
+import json
+import re
+import zlib
+
+import pytest
+
+from exergy_dashboard.scenario import (
+    MAX_SCENARIO_BYTES,
+    MAX_TOKEN_LENGTH,
+    SCENARIO_VERSION,
+    decode_scenario,
+    encode_scenario,
+)
+
+
+def scenario(systems):
+    return {'v': SCENARIO_VERSION, 'schema': '0123abcd', 'mode': 'COOLING', 'systems': systems}
+
+
+def raw_token(obj):
+    """검증 없이 임의의 JSON 값을 토큰으로 변환"""
+    text = json.dumps(obj).encode()
+    return base64.urlsafe_b64encode(zlib.compress(text)).rstrip(b'=').decode()
+
+
+def test_round_trip():
+    original = scenario([
+        ['Air source heat pump', 1, {'T_0': 31.5, 'Q_r_int': 6500}],
+        ['Ground source heat pump', 3, {}],
+        ['냉방 시스템', 2, {'T_0': -1e-3}],
+    ])
+
+    token = encode_scenario(original)
+
+    assert re.fullmatch(r'[A-Za-z0-9_-]+', token)
+    assert decode_scenario(token) == original
+
+
+def test_typical_scenario_fits_in_url():
+    systems = [
+        ['Air source heat pump', i, {f'param_{j}': 20.0 + i + j * 0.5 for j in range(6)}]
+        for i in range(1, 9)
+    ]
+
+    assert len(encode_scenario(scenario(systems))) <= MAX_TOKEN_LENGTH
+
+
+def test_oversized_scenario_is_rejected():
+    padding = 'a' * MAX_SCENARIO_BYTES
+    token = raw_token(scenario([['Air source heat pump', 1, {}]]) | {'padding': padding})
+
+    # 압축률이 높아 토큰은 짧지만 압축을 풀면 제한을 넘음
+    assert len(token) < 4096
+    with pytest.raises(ValueError, match='too large'):
+        decode_scenario(token)
+
+
+@pytest.mark.parametrize('token', [
+    '',
+    'not a token!',
+    base64.urlsafe_b64encode(b'plain text').decode(),
+    raw_token([1, 2, 3]),
+    raw_token({'v': SCENARIO_VERSION + 1, 'mode': 'COOLING', 'systems': []}),
+    raw_token(scenario('Air source heat pump')),
+    raw_token(scenario([['Air source heat pump', '1', {}]])),
+    raw_token(scenario([['Air source heat pump', 1, {'T_0': 'hot'}]])),
+    raw_token(scenario([['Air source heat pump', 1, {'T_0': True}]])),
+])
+def test_invalid_token_is_rejected(token):
+    with pytest.raises(ValueError):
+        decode_scenario(token)
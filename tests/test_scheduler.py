@@ -0,0 +1,167 @@
+import threading
+
+import pytest
+
+from exergy_dashboard.scheduler import Priority, SchedulerBusyError
+
+from conftest import MODE, SYSTEM_TYPE
+
+
+PARAMS = {'T_0': 30.0, 'T_room': 20.0}
+
+
+def echo(value):
+    return value
+
+
+@pytest.fixture
+def paused(make_scheduler, monkeypatch):
+    """워커를 시작하지 않는 스케줄러 (큐에서 꺼내는 순서를 직접 확인)"""
+    scheduler = make_scheduler(max_workers=2)
+    monkeypatch.setattr(scheduler, '_ensure_workers', lambda: None)
+    return scheduler
+
+
+def drain(scheduler):
+    """워커가 꺼낼 순서대로 대기 중인 작업을 모두 꺼냄"""
+    jobs = []
+    with scheduler._cond:
+        job = scheduler._next_job()
+        while job is not None:
+            jobs.append(job)
+            job = scheduler._next_job()
+    return jobs
+
+
+def test_higher_priority_runs_first(paused):
+    paused.submit(echo, 'prefetch', session_id='a', priority=Priority.PREFETCH)
+    paused.submit(echo, 'batch', session_id='a', priority=Priority.BATCH)
+    paused.submit(echo, 'interactive', session_id='a', priority=Priority.INTERACTIVE)
+
+    assert [job.args[0] for job in drain(paused)] == ['interactive', 'batch', 'prefetch']
+
+
+def test_sessions_take_turns_within_a_priority(paused):
+    for name in ('a1', 'a2', 'a3'):
+        paused.submit(echo, name, session_id='a')
+    for name in ('b1', 'b2'):
+        paused.submit(echo, name, session_id='b')
+
+    assert [job.args[0] for job in drain(paused)] == ['a1', 'b1', 'a2', 'b2', 'a3']
+
+
+def test_only_one_prefetch_job_leaves_a_worker_free(paused):
+    paused.submit(echo, 'p1', session_id='a', priority=Priority.PREFETCH)
+    paused.submit(echo, 'p2', session_id='b', priority=Priority.PREFETCH)
+
+    assert [job.args[0] for job in drain(paused)] == ['p1']
+    assert paused.pending == 1
+
+
+def test_prefetch_is_rejected_with_a_single_worker(make_scheduler):
+    scheduler = make_scheduler(max_workers=1)
+
+    assert not scheduler.prefetch_enabled
+    with pytest.raises(SchedulerBusyError):
+        scheduler.submit(echo, 'p', priority=Priority.PREFETCH)
+
+
+def test_full_queue_raises_busy(paused):
+    paused.max_queue_size = 2
+    paused.submit(echo, 1, session_id='a')
+    paused.submit(echo, 2, session_id='b')
+
+    with pytest.raises(SchedulerBusyError):
+        paused.submit(echo, 3, session_id='c')
+    assert paused.pending == 2
+
+
+def test_per_session_limit_does_not_block_other_sessions(paused):
+    paused.max_pending_per_session = 1
+    paused.submit(echo, 1, session_id='a')
+
+    with pytest.raises(SchedulerBusyError):
+        paused.submit(echo, 2, session_id='a')
+    paused.submit(echo, 3, session_id='b')
+    assert paused.pending == 2
+
+
+def test_same_evaluation_is_coalesced(paused):
+    first = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS, session_id='a')
+    second = paused.submit_evaluation(MODE, SYSTEM_TYPE, dict(reversed(PARAMS.items())), session_id='b')
+
+    assert second is first
+    assert paused.pending == 1
+
+
+def test_cached_evaluation_is_not_queued(paused):
+    key = paused.cache.make_key(MODE, SYSTEM_TYPE, PARAMS)
+    paused.cache.put(key, {'X_eff': 0.5})
+
+    future = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS)
+
+    assert future.done() and future.result() == {'X_eff': 0.5}
+    assert paused.pending == 0
+
+
+def test_interactive_request_promotes_pending_prefetch(paused):
+    prefetch = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS, session_id='a', priority=Priority.PREFETCH)
+    paused.submit(echo, 'batch', session_id='c', priority=Priority.BATCH)
+    request = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS, session_id='b')
+
+    assert request is prefetch
+    assert paused.cancel_pending(priority=Priority.PREFETCH) == 0
+    jobs = drain(paused)
+    assert [(job.priority, job.session_id) for job in jobs] == [
+        (Priority.INTERACTIVE, 'b'), (Priority.BATCH, 'c'),
+    ]
+    paused._run(jobs[0])
+    assert request.result()['X_eff'] == pytest.approx(1 - 293.15 / 303.15)
+
+
+def test_cancel_pending_cancels_only_matching_jobs(paused):
+    first = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS, session_id='a', priority=Priority.PREFETCH)
+    second = paused.submit(echo, 'p', session_id='a', priority=Priority.PREFETCH)
+    other = paused.submit(echo, 'q', session_id='b', priority=Priority.PREFETCH)
+    interactive = paused.submit(echo, 'i', session_id='a')
+
+    assert paused.cancel_pending(session_id='a') == 2
+    assert first.cancelled() and second.cancelled()
+    assert not other.cancelled() and not interactive.cancelled()
+    assert paused.pending == 2
+    # 취소된 평가는 병합 대상에서 빠지므로 같은 입력을 다시 제출할 수 있음
+    again = paused.submit_evaluation(MODE, SYSTEM_TYPE, PARAMS, session_id='a')
+    assert again is not first and not again.cancelled()
+
+
+def test_workers_evaluate_and_cache_results(make_scheduler):
+    scheduler = make_scheduler(max_workers=2)
+
+    variables = scheduler.evaluate(MODE, SYSTEM_TYPE, PARAMS, timeout=5)
+
+    assert set(variables) == {'X_eff'}
+    assert scheduler.cache.get(scheduler.cache.make_key(MODE, SYSTEM_TYPE, PARAMS)) == variables
+
+
+def test_batch_keeps_input_order_and_returns_errors(make_scheduler):
+    scheduler = make_scheduler(max_workers=2)
+    params_list = [{'T_0': t, 'T_room': 10.0} for t in (30.0, 13.0, 20.0)]
+
+    results = scheduler.evaluate_batch(MODE, SYSTEM_TYPE, params_list, timeout=5)
+
+    assert results[0]['X_eff'] > results[2]['X_eff']
+    assert isinstance(results[1], ValueError)
+
+
+def test_job_that_cannot_start_in_time_expires(make_scheduler):
+    scheduler = make_scheduler(max_workers=1)
+    gate = threading.Event()
+    blocker = scheduler.submit(gate.wait, 5)
+    expired = scheduler.submit(echo, 'late', timeout=0.05)
+
+    threading.Timer(0.2, gate.set).start()
+
+    assert blocker.result(timeout=5) is True
+    with pytest.raises(TimeoutError):
+        expired.result(timeout=5)
+
@@ -0,0 +1,65 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from exergy_dashboard.sweep import SweepGrid, downsample_grid
+
+
+def grid(nx, ny):
+    x = np.arange(nx, dtype=float)
+    y = np.arange(ny, dtype=float) * 10
+    z = np.arange(nx * ny, dtype=float).reshape(ny, nx)
+    return SweepGrid('x', 'y', 'X_eff', x, y, z)
+
+
+def test_small_grid_is_unchanged():
+    original = grid(50, 50)
+
+    assert downsample_grid(original, max_cells=2500) is original
+
+
+def test_block_average():
+    original = grid(100, 100)
+
+    reduced = downsample_grid(original, max_cells=2500)
+
+    assert reduced.z.shape == (50, 50)
+    assert reduced.z[0, 0] == pytest.approx(original.z[:2, :2].mean())
+    assert reduced.z[-1, -1] == pytest.approx(original.z[-2:, -2:].mean())
+    np.testing.assert_allclose(reduced.x, original.x.reshape(-1, 2).mean(axis=1))
+    np.testing.assert_allclose(reduced.y, original.y.reshape(-1, 2).mean(axis=1))
+    assert (reduced.x_param, reduced.y_param, reduced.output) == ('x', 'y', 'X_eff')
+
+
+def test_uneven_shape_averages_the_remaining_points():
+    original = grid(5, 7)
+
+    reduced = downsample_grid(original, max_cells=10)
+
+    # factor = ceil(sqrt(35 / 10)) = 2, 마지막 행/열 블록은 남은 점만 평균
+    assert reduced.z.shape == (4, 3)
+    assert reduced.z.size <= 12
+    assert reduced.z[-1, -1] == pytest.approx(original.z[6, 4])
+    assert reduced.x[-1] == original.x[-1]
+    assert reduced.y[-1] == original.y[-1]
+
+
+def test_empty_blocks_stay_empty_and_nan_is_ignored():
+    original = grid(4, 4)
+    z = original.z.copy()
+    z[:2, :2] = np.nan
+    z[2, 2] = np.nan
+    original = SweepGrid('x', 'y', 'X_eff', original.x, original.y, z)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        reduced = downsample_grid(original, max_cells=4)
+
+    assert np.isnan(reduced.z[0, 0])
+    assert reduced.z[1, 1] == pytest.approx(np.mean([z[2, 3], z[3, 2], z[3, 3]]))
+
+
+@pytest.mark.parametrize('size, max_cells', [(500, 2500), (333, 2500), (101, 100)])
+def test_result_fits_the_cell_budget(size, max_cells):
+    assert downsample_grid(grid(size, size), max_cells=max_cells).z.size <= max_cells